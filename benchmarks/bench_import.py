@@ -0,0 +1,94 @@
+"""Import time budget: the toolkit entry points imported in fresh interpreters.
+
+Each module is imported in a new interpreter, so nothing is already loaded,
+and the best of `--repeat` runs is checked against its budget. A budget also
+lists heavy modules the import must not load. Exits with status 1 when a
+budget is exceeded, so it can gate CI:
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --scale 2
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted(set(sys.modules) - before)]))
+"""
+
+
+@dataclass
+class Budget:
+    """Maximum import time of a module, and modules it must not import."""
+
+    module: str
+    milliseconds: float
+    forbidden: tuple[str, ...] = ()
+
+
+BUDGETS = [
+    Budget("notion_toolkit.schema", 25, ("pydantic",)),
+    Budget("notion_toolkit.notion", 300, ("pydantic", "email_validator")),
+    Budget("notion_toolkit.schema.page_properties", 300, ("email_validator",)),
+]
+
+
+def import_time(module: str, repeat: int = 5) -> tuple[float, list[str]]:
+    """Best import time in seconds, and the modules the import loaded."""
+    best, loaded = float("inf"), []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        elapsed, loaded = json.loads(output)
+        best = min(best, elapsed)
+    return best, loaded
+
+
+def check(budget: Budget, repeat: int, scale: float = 1.0) -> list[str]:
+    """Print the import time of a budgeted module; return the budget breaches."""
+    elapsed, loaded = import_time(budget.module, repeat)
+    limit = budget.milliseconds * scale
+    print(
+        f"{budget.module:<40} {elapsed * 1000:8.1f} ms"
+        f"  (budget {limit:.0f} ms, {len(loaded)} modules)"
+    )
+    failures = []
+    if elapsed * 1000 > limit:
+        failures.append(f"{budget.module} took {elapsed * 1000:.1f} ms")
+    for name in budget.forbidden:
+        if name in loaded:
+            failures.append(f"{budget.module} imported {name}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply every time budget"
+    )
+    args = parser.parse_args()
+
+    failures = []
+    for budget in BUDGETS:
+        failures += check(budget, args.repeat, args.scale)
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
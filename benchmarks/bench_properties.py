@@ -0,0 +1,107 @@
+"""Microbenchmark: page property payload building.
+
+Compares the dict-per-call payload builder `Notion._create_properties` used to
+be with the precompiled `ProdCopilotSourcePropertiesTemplate`.
+
+    python benchmarks/bench_properties.py --rows 100000
+"""
+
+import argparse
+import time
+
+from notion_toolkit.template import ProdCopilotSourcePropertiesTemplate
+
+
+def build_properties(
+    title: str,
+    text_link: str | None = None,
+    bold: bool = False,
+    italic: bool = False,
+    strikethrough: bool = False,
+    underline: bool = False,
+    code: bool = False,
+    color: str = "default",
+    href: str | None = None,
+    archived: bool = False,
+    source_type: str = "webpage",
+    tags: list[str] | None = None,
+    url: str | None = None,
+) -> dict:
+    """The original, fully rebuilt payload."""
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": title,
+                        "link": text_link,
+                    },
+                    "annotations": {
+                        "bold": bold,
+                        "italic": italic,
+                        "strikethrough": strikethrough,
+                        "underline": underline,
+                        "code": code,
+                        "color": color,
+                    },
+                    "plain_text": title,
+                    "href": href,
+                }
+            ],
+        },
+        "Archived": {"checkbox": archived},
+        "Tags": {
+            "type": "multi_select",
+            "multi_select": [{"name": tag} for tag in tags or ()],
+        },
+        "Source_Type": {
+            "type": "select",
+            "select": {"name": source_type},
+        },
+        "URL": {"url": url},
+    }
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Source page {i}",
+            "tags": ["ml"] if i % 3 == 0 else None,
+            "url": f"https://example.com/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(build, rows: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            build(**row)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    template = ProdCopilotSourcePropertiesTemplate()
+    baseline = measure(build_properties, rows, args.repeat)
+    compiled = measure(template.render, rows, args.repeat)
+
+    print(f"rows:      {args.rows}")
+    print(f"baseline:  {baseline:.3f}s ({baseline / args.rows * 1e6:.2f} us/row)")
+    print(f"template:  {compiled:.3f}s ({compiled / args.rows * 1e6:.2f} us/row)")
+    print(f"speedup:   {baseline / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Microbenchmark: request body serialization.
+
+Compares `json.dumps(model_dump())`, the path a pydantic payload takes through
+the HTTP client today, with `schema.encode.dumps`.
+
+    python benchmarks/bench_serialization.py --spans 100 --bodies 2000
+"""
+
+import argparse
+import json
+import time
+
+from notion_toolkit.schema.encode import dumps
+from notion_toolkit.schema.rich_text import RichText
+from notion_toolkit.template import ProdCopilotSourcePropertiesTemplate
+
+
+def model_dump_then_encode(body: dict) -> bytes:
+    def plain(obj):
+        if isinstance(obj, dict):
+            return {key: plain(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [plain(item) for item in obj]
+        if isinstance(obj, RichText):
+            return obj.model_dump(mode="json")
+        return obj
+
+    return json.dumps(plain(body)).encode()
+
+
+def measure(encode, bodies: list, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            encode(body)
+        best = min(best, time.perf_counter() - start)
+    return best, sum(len(encode(body)) for body in bodies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=100)
+    parser.add_argument("--bodies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spans = [RichText.create_for_text(f"span {i}") for i in range(args.spans)]
+    block_bodies = [
+        {"children": [{"type": "paragraph", "paragraph": {"rich_text": spans}}]}
+    ] * args.bodies
+    template = ProdCopilotSourcePropertiesTemplate()
+    page_bodies = [
+        {
+            "parent": {"database_id": "db"},
+            "properties": template.render(title=f"page {i}", url=f"https://e.com/{i}"),
+        }
+        for i in range(args.bodies * 10)
+    ]
+
+    for name, bodies, baseline in (
+        ("block children (models)", block_bodies, model_dump_then_encode),
+        ("page payloads (dicts)", page_bodies, lambda body: json.dumps(body).encode()),
+    ):
+        base_time, base_bytes = measure(baseline, bodies, args.repeat)
+        fast_time, fast_bytes = measure(dumps, bodies, args.repeat)
+        print(f"{name}: {len(bodies)} bodies")
+        print(f"  baseline: {base_time:.3f}s, {base_bytes} bytes")
+        print(f"  dumps:    {fast_time:.3f}s, {fast_bytes} bytes")
+        print(f"  speedup:  {base_time / fast_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""Benchmark suite: schema, payloads, serialization, import time and throughput.
+
+Runs every benchmark, prints a table and writes the results as JSON, so runs
+can be compared over time:
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --compare results.json --threshold 0.15
+
+`--compare` exits with status 1 when a benchmark regressed by more than the
+threshold. End-to-end throughput runs `bulk_create` against the local
+`FakeNotionServer` at each `--concurrency` level.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable
+
+from bench_import import BUDGETS, import_time
+from notion_toolkit.fake_server import FakeNotionServer
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.schema.encode import dumps
+from notion_toolkit.schema.rich_text import Annotations, RichText
+
+SPAN = {
+    "type": "text",
+    "text": {"content": "Source page", "link": {"url": "https://example.com/"}},
+    "annotations": {
+        "bold": True,
+        "italic": False,
+        "strikethrough": False,
+        "underline": False,
+        "code": False,
+        "color": "default",
+    },
+    "plain_text": "Source page",
+    "href": "https://example.com/",
+}
+ROW = {
+    "title": "Source page",
+    "tags": ["ml", "notion"],
+    "url": "https://example.com/source",
+}
+
+
+@dataclass
+class Result:
+    """One benchmark measurement."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    params: dict[str, Any] = field(default_factory=dict)
+    samples: list[float] = field(default_factory=list)
+
+
+def time_per_op(
+    name: str, func: Callable[[], Any], number: int, repeat: int, **params: Any
+) -> Result:
+    """Best time per call over `repeat` runs of `number` calls."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return Result(
+        name,
+        min(samples),
+        "s/op",
+        params={"number": number, "repeat": repeat, **params},
+        samples=samples,
+    )
+
+
+def schema_benchmarks(number: int, repeat: int) -> list[Result]:
+    return [
+        time_per_op("schema.annotations.default", Annotations, number, repeat),
+        time_per_op(
+            "schema.annotations.validate",
+            lambda: Annotations.model_validate(SPAN["annotations"]),
+            number,
+            repeat,
+        ),
+        time_per_op(
+            "schema.rich_text.create_for_text",
+            lambda: RichText.create_for_text("Source page"),
+            number,
+            repeat,
+        ),
+        time_per_op(
+            "schema.rich_text.create_for_text_link",
+            lambda: RichText.create_for_text("Source page", "https://example.com/"),
+            number,
+            repeat,
+        ),
+        time_per_op(
+            "schema.rich_text.validate",
+            lambda: RichText.model_validate(SPAN),
+            number,
+            repeat,
+        ),
+    ]
+
+
+def payload_benchmarks(number: int, repeat: int) -> list[Result]:
+    notion = Notion(token="benchmark")
+    return [
+        time_per_op(
+            "payload.create_properties",
+            lambda: notion._create_properties(**ROW),
+            number,
+            repeat,
+        ),
+        time_per_op(
+            "payload.create_page_kwargs",
+            lambda: notion._create_page_kwargs("db", **ROW),
+            number,
+            repeat,
+        ),
+    ]
+
+
+def serialization_benchmarks(number: int, repeat: int) -> list[Result]:
+    notion = Notion(token="benchmark")
+    page_body = notion._create_page_kwargs("db", **ROW)
+    spans = [RichText.create_for_text(f"span {i}") for i in range(100)]
+    block_body = {
+        "children": [{"type": "paragraph", "paragraph": {"rich_text": spans}}]
+    }
+    blocks_number = max(number // 100, 1)
+    return [
+        time_per_op(
+            "serialization.page_body.json",
+            lambda: json.dumps(page_body).encode(),
+            number,
+            repeat,
+        ),
+        time_per_op(
+            "serialization.page_body.dumps", lambda: dumps(page_body), number, repeat
+        ),
+        time_per_op(
+            "serialization.block_children.dumps",
+            lambda: dumps(block_body),
+            blocks_number,
+            repeat,
+            spans=len(spans),
+        ),
+    ]
+
+
+def import_benchmarks(repeat: int) -> list[Result]:
+    results = []
+    for budget in BUDGETS:
+        elapsed, loaded = import_time(budget.module, repeat)
+        results.append(
+            Result(
+                f"import.{budget.module}",
+                elapsed * 1000,
+                "ms",
+                params={"repeat": repeat, "modules": len(loaded)},
+            )
+        )
+    return results
+
+
+def throughput_benchmarks(
+    pages: int, concurrency: list[int], latency: float, jitter: float
+) -> list[Result]:
+    results = []
+    with FakeNotionServer(latency=latency, jitter=jitter) as server:
+        database_id = server.add_database()["id"]
+        for level in concurrency:
+            notion = Notion(
+                token="benchmark",
+                scheduler=RequestScheduler(rate=1_000_000, burst=level),
+                base_url=server.base_url,
+            )
+            rows = [dict(ROW, title=f"page {i}") for i in range(pages)]
+            start = time.perf_counter()
+            failed = sum(
+                not result.ok
+                for result in notion.bulk_create(database_id, rows, max_in_flight=level)
+            )
+            elapsed = time.perf_counter() - start
+            results.append(
+                Result(
+                    f"e2e.create_page.concurrency_{level}",
+                    pages / elapsed,
+                    "pages/s",
+                    higher_is_better=True,
+                    params={
+                        "pages": pages,
+                        "concurrency": level,
+                        "latency": latency,
+                        "jitter": jitter,
+                        "failed": failed,
+                    },
+                    samples=[elapsed],
+                )
+            )
+    return results
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    packages = {}
+    for package in ("notion_toolkit", "pydantic", "pydantic-core", "httpx"):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "packages": packages,
+    }
+
+
+def compare(results: list[Result], baseline_path: str, threshold: float) -> bool:
+    """Print the change against a baseline run; return whether any regressed."""
+    with open(baseline_path) as file:
+        baseline = {result["name"]: result for result in json.load(file)["results"]}
+    regressed = False
+    print(f"\ncompared with {baseline_path}:")
+    for result in results:
+        before = baseline.get(result.name)
+        if before is None or not before["value"]:
+            continue
+        ratio = result.value / before["value"]
+        # Positive change is an improvement whatever the unit.
+        change = ratio - 1 if result.higher_is_better else 1 / ratio - 1
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"  {result.name:<45} {change:+7.1%}{flag}")
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument(
+        "--filter", default="", help="only run names starting with this prefix"
+    )
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=[1, 4, 16],
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="seconds")
+    parser.add_argument(
+        "--quick", action="store_true", help="small sizes, for smoke testing"
+    )
+    args = parser.parse_args()
+    if args.quick:
+        args.number, args.repeat, args.pages = 200, 2, 20
+
+    groups: dict[str, Callable[[], list[Result]]] = {
+        "schema": lambda: schema_benchmarks(args.number, args.repeat),
+        "payload": lambda: payload_benchmarks(args.number, args.repeat),
+        "serialization": lambda: serialization_benchmarks(args.number, args.repeat),
+        "import": lambda: import_benchmarks(args.repeat),
+        "e2e": lambda: throughput_benchmarks(
+            args.pages, args.concurrency, args.latency, args.jitter
+        ),
+    }
+    results = []
+    for group, run in groups.items():
+        if not (group.startswith(args.filter) or args.filter.startswith(group)):
+            continue
+        for result in run():
+            if result.name.startswith(args.filter):
+                results.append(result)
+                value = (
+                    f"{result.value * 1e6:10.2f} us/op"
+                    if result.unit == "s/op"
+                    else f"{result.value:10.1f} {result.unit}"
+                )
+                print(f"{result.name:<45} {value}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "meta": metadata(),
+                    "results": [asdict(result) for result in results],
+                },
+                file,
+                indent=2,
+            )
+        print(f"\nwrote {len(results)} results to {args.output}")
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,39 @@
 import os
+from contextlib import ExitStack
+
 import typer
 from dotenv import load_dotenv
-from rich import print
-from notion_toolkit.notion import Notion
+from notion_toolkit.profiling import profiled, traced_memory
 
 load_dotenv()
 
 DATABASE_ID = "54ab647b7e4949d4972d4d5ede8b48ce"
 
 
-def main():
-    writer = Notion(token=os.getenv("NOTION_TOKEN"))
-    response = writer.create_page(database_id=DATABASE_ID, title="test_123")
-    print(response)
+def main(
+    profile: bool = typer.Option(
+        False, "--profile", help="Print the hottest functions by area."
+    ),
+    profile_output: str = typer.Option(
+        None, help="Also save the raw cProfile stats to this file."
+    ),
+    trace_memory: bool = typer.Option(
+        False, "--trace-memory", help="Print the top allocation sites by area."
+    ),
+    top: int = typer.Option(10, help="Rows per area in the reports."),
+):
+    with ExitStack() as stack:
+        if trace_memory:
+            stack.enter_context(traced_memory(top))
+        if profile:
+            stack.enter_context(profiled(top, output=profile_output))
+        # Imported here so that --help and option errors return immediately.
+        from rich import print
+        from notion_toolkit.notion import Notion
+
+        writer = Notion(token=os.getenv("NOTION_TOKEN"))
+        response = writer.create_page(database_id=DATABASE_ID, title="test_123")
+        print(response)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""Bulk import helpers."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of creating the page for a single source row."""
+
+    index: int
+    row: Mapping[str, Any]
+    response: dict[str, Any] | None = None
+    error: Exception | None = field(default=None, repr=False)
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def stream_bounded(
+    func: Callable[[Mapping[str, Any]], dict[str, Any]],
+    rows: Iterable[Mapping[str, Any]],
+    max_in_flight: int,
+    lookup: Callable[[Mapping[str, Any]], dict[str, Any] | None] | None = None,
+) -> Iterator[BulkCreateResult]:
+    """Apply `func` to rows on a thread pool and yield results as they complete.
+
+    At most `max_in_flight` rows are pulled from `rows` and not yet yielded at
+    any time, so memory stays flat however long the input is. Closing the
+    generator cancels the rows that have not started yet. Rows for which
+    `lookup` returns a response are yielded as resumed without calling `func`.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+
+    pending: dict[Future, BulkCreateResult] = {}
+    source = enumerate(rows)
+    executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    try:
+        while True:
+            for index, row in source:
+                result = BulkCreateResult(index=index, row=row)
+                if lookup is not None and (response := lookup(row)) is not None:
+                    result.response = response
+                    result.resumed = True
+                    yield result
+                    continue
+                pending[executor.submit(func, row)] = result
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = pending.pop(future)
+                try:
+                    result.response = future.result()
+                except Exception as error:
+                    result.error = error
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
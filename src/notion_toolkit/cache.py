@@ -0,0 +1,221 @@
+"""Read-through page cache."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import PathLike
+from typing import Any, Protocol
+
+
+@dataclass
+class CacheEntry:
+    """A cached API object and the time it was last known to be current."""
+
+    value: dict[str, Any]
+    checked_at: float
+
+    @property
+    def last_edited_time(self) -> str | None:
+        return self.value.get("last_edited_time")
+
+
+@dataclass
+class CacheStats:
+    """Cache counters, useful to tune the cache size under load."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    revalidated: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(Protocol):
+    """Storage used by `PageCache`."""
+
+    evictions: int
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class LRUBackend:
+    """In-memory backend evicting the least recently used entry."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskBackend:
+    """SQLite backend that survives restarts, evicting least recently used rows."""
+
+    def __init__(self, path: str | PathLike, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS cache_used_at ON cache (used_at);
+            """)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, checked_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE cache SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry(value=json.loads(row[0]), checked_at=row[1])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, checked_at, used_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry.value), entry.checked_at, time.time()),
+            )
+            overflow = len(self) - self.maxsize
+            if overflow > 0:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY used_at LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class PageCache:
+    """
+    Read-through cache of Notion objects keyed by id.
+
+    Entries are served for `ttl` seconds after they were last known to be
+    current. Every page seen elsewhere (query results, API responses) is passed
+    to `observe`, which compares `last_edited_time`: an unchanged page extends
+    the entry's lifetime for free, a newer one replaces it.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float = 300.0):
+        self.backend = backend if backend is not None else LRUBackend()
+        self.ttl = ttl
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.evictions = self.backend.evictions
+        return self._stats
+
+    @staticmethod
+    def key(object_id: str) -> str:
+        return object_id.replace("-", "").lower()
+
+    def get(self, object_id: str) -> dict[str, Any] | None:
+        """Fresh cached object, or None on a miss or an expired entry."""
+        key = self.key(object_id)
+        entry = self.backend.get(key)
+        if entry is not None and time.time() - entry.checked_at > self.ttl:
+            self._stats.expired += 1
+            self.backend.delete(key)
+            entry = None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return entry.value
+
+    def put(self, value: dict[str, Any]) -> None:
+        self.backend.set(
+            self.key(value["id"]), CacheEntry(value=value, checked_at=time.time())
+        )
+
+    def observe(self, value: dict[str, Any]) -> None:
+        """Revalidate or replace the cached copy of an object seen elsewhere."""
+        key = self.key(value["id"])
+        entry = self.backend.get(key)
+        if entry is None:
+            return
+        edited = value.get("last_edited_time")
+        if edited is not None and edited == entry.last_edited_time:
+            self._stats.revalidated += 1
+            self.backend.set(key, CacheEntry(entry.value, time.time()))
+        elif (
+            edited is None
+            or entry.last_edited_time is None
+            or (edited > entry.last_edited_time)
+        ):
+            self.put(value)
+
+    def invalidate(self, object_id: str) -> None:
+        self.backend.delete(self.key(object_id))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self.backend)
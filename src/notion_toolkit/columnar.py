@@ -0,0 +1,363 @@
+"""Columnar export of database rows to CSV, Arrow or Parquet.
+
+Query results are decoded straight from the raw page dicts, one column at a
+time, into batches of column buffers: each `PagePropertyType` has a decoder
+flattening its value into a scalar or a list of strings. Batches stream to the
+writers, so memory stays bounded by a few times `batch_size` whatever the
+database size.
+
+Arrow and Parquet need the optional `pyarrow` dependency:
+
+    pip install notion_toolkit[arrow]
+
+"""
+
+import csv
+from dataclasses import dataclass
+from enum import Enum
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from notion_toolkit.notion import Notion
+from notion_toolkit.schema.page_properties import PagePropertyType
+
+Batch = dict[str, list[Any]]
+Decoder = Callable[[Any], Any]
+
+DEFAULT_BATCH_SIZE = 10_000
+# Batches held back by the Arrow writers while an `infer` column is all empty.
+MAX_HELD_BATCHES = 8
+
+
+class ColumnType(str, Enum):
+    """
+    Value type of a column; `infer` columns are typed from their first values.
+    """
+
+    BOOL = "bool"
+    FLOAT = "float"
+    INFER = "infer"
+    LIST = "list"
+    STRING = "string"
+    TIMESTAMP = "timestamp"
+
+
+class ColumnarFormat(str, Enum):
+    """
+    Output format of a columnar export.
+    """
+
+    ARROW = "arrow"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+def _plain_text(spans: list[dict[str, Any]] | None) -> str | None:
+    return "".join(span["plain_text"] for span in spans) if spans is not None else None
+
+
+def _name(option: dict[str, Any] | None) -> str | None:
+    return option["name"] if option else None
+
+
+def _names(options: list[dict[str, Any]] | None) -> list[str]:
+    return [option["name"] for option in options or ()]
+
+
+def _ids(references: list[dict[str, Any]] | None) -> list[str]:
+    return [reference["id"] for reference in references or ()]
+
+
+def _user(user: dict[str, Any] | None) -> str | None:
+    return user["id"] if user else None
+
+
+def _date(date: dict[str, Any] | None) -> str | None:
+    return date["start"] if date else None
+
+
+def _files(files: list[dict[str, Any]] | None) -> list[str]:
+    return [
+        file.get("name") or (file.get(file["type"]) or {}).get("url", "")
+        for file in files or ()
+    ]
+
+
+def _formula(formula: dict[str, Any] | None) -> Any:
+    if not formula:
+        return None
+    value = formula.get(formula["type"])
+    return _date(value) if formula["type"] == "date" else value
+
+
+def _rollup(rollup: dict[str, Any] | None) -> Any:
+    if not rollup:
+        return None
+    kind = rollup["type"]
+    if kind == "array":
+        return [str(decode_property(item)) for item in rollup["array"]]
+    value = rollup.get(kind)
+    return _date(value) if kind == "date" else value
+
+
+def _unique_id(unique_id: dict[str, Any] | None) -> str | None:
+    if not unique_id or unique_id.get("number") is None:
+        return None
+    prefix = unique_id.get("prefix")
+    return f"{prefix}-{unique_id['number']}" if prefix else str(unique_id["number"])
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Decoder of the value under the type key of a property, and its column type.
+PROPERTY_DECODERS: dict[PagePropertyType, tuple[ColumnType, Decoder]] = {
+    PagePropertyType.CHECKBOX: (ColumnType.BOOL, _identity),
+    PagePropertyType.CREATED_BY: (ColumnType.STRING, _user),
+    PagePropertyType.CREATED_TIME: (ColumnType.TIMESTAMP, _identity),
+    PagePropertyType.DATE: (ColumnType.STRING, _date),
+    PagePropertyType.EMAIL: (ColumnType.STRING, _identity),
+    PagePropertyType.FILES: (ColumnType.LIST, _files),
+    PagePropertyType.FORMULA: (ColumnType.INFER, _formula),
+    PagePropertyType.LAST_EDITED_BY: (ColumnType.STRING, _user),
+    PagePropertyType.LAST_EDITED_TIME: (ColumnType.TIMESTAMP, _identity),
+    PagePropertyType.MULTI_SELECT: (ColumnType.LIST, _names),
+    PagePropertyType.NUMBER: (ColumnType.FLOAT, _identity),
+    PagePropertyType.PEOPLE: (ColumnType.LIST, _ids),
+    PagePropertyType.PHONE_NUMBER: (ColumnType.STRING, _identity),
+    PagePropertyType.RELATION: (ColumnType.LIST, _ids),
+    PagePropertyType.RICH_TEXT: (ColumnType.STRING, _plain_text),
+    PagePropertyType.ROLLUP: (ColumnType.INFER, _rollup),
+    PagePropertyType.SELECT: (ColumnType.STRING, _name),
+    PagePropertyType.STATUS: (ColumnType.STRING, _name),
+    PagePropertyType.TITLE: (ColumnType.STRING, _plain_text),
+    PagePropertyType.URL: (ColumnType.STRING, _identity),
+    PagePropertyType.UNIQUE_ID: (ColumnType.STRING, _unique_id),
+}
+
+
+def decode_property(value: dict[str, Any] | None) -> Any:
+    """Flatten one raw property value; unknown property types decode to None."""
+    if not value:
+        return None
+    try:
+        _, decode = PROPERTY_DECODERS[PagePropertyType(value["type"])]
+    except ValueError:
+        return None
+    return decode(value.get(value["type"]))
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output column and how to read it from a raw page dict."""
+
+    name: str
+    type: ColumnType
+    read: Callable[[dict[str, Any]], Any]
+
+
+def _page_field(key: str) -> Callable[[dict[str, Any]], Any]:
+    return lambda page: page.get(key)
+
+
+def _property_reader(name: str, kind: PagePropertyType) -> Column:
+    column_type, decode = PROPERTY_DECODERS[kind]
+    key = kind.value
+
+    def read(page: dict[str, Any]) -> Any:
+        value = page["properties"].get(name)
+        return decode(value.get(key)) if value else None
+
+    return Column(name, column_type, read)
+
+
+PAGE_COLUMNS = (
+    Column("page_id", ColumnType.STRING, _page_field("id")),
+    Column("page_url", ColumnType.STRING, _page_field("url")),
+    Column("created_time", ColumnType.TIMESTAMP, _page_field("created_time")),
+    Column("last_edited_time", ColumnType.TIMESTAMP, _page_field("last_edited_time")),
+)
+
+
+def columns_from_properties(properties: dict[str, dict[str, Any]]) -> list[Column]:
+    """Columns for a database or page `properties` object, after the page columns.
+
+    Properties of a type unknown to this toolkit are skipped, and a page column
+    is dropped when a property has the same name.
+    """
+    columns = []
+    for name, definition in properties.items():
+        try:
+            columns.append(_property_reader(name, PagePropertyType(definition["type"])))
+        except ValueError:
+            continue
+    names = {column.name for column in columns}
+    return [column for column in PAGE_COLUMNS if column.name not in names] + columns
+
+
+def iter_column_batches(
+    pages: Iterable[dict[str, Any]],
+    columns: list[Column],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Batch]:
+    """Decode pages into batches of column buffers of up to `batch_size` rows."""
+    iterator = iter(pages)
+    while rows := list(islice(iterator, batch_size)):
+        yield {column.name: [column.read(page) for page in rows] for column in columns}
+
+
+def write_csv(batches: Iterable[Batch], file: IO[str], columns: list[Column]) -> int:
+    """Write batches as CSV with a header row; lists are joined with ", "."""
+    writer = csv.writer(file)
+    writer.writerow([column.name for column in columns])
+    rows = 0
+    lists = [column.name for column in columns if column.type is ColumnType.LIST]
+    for batch in batches:
+        for name in lists:
+            batch[name] = [", ".join(values) for values in batch[name]]
+        values = [batch[column.name] for column in columns]
+        writer.writerows(zip(*values))
+        rows += len(values[0]) if values else 0
+    return rows
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Arrow and Parquet export need pyarrow: "
+            "pip install notion_toolkit[arrow]"
+        ) from error
+    return pyarrow
+
+
+def _infer_type(pa, array) -> Any:
+    if pa.types.is_integer(array.type):
+        # Number formulas and rollups give ints and floats alike.
+        return pa.float64()
+    return array.type
+
+
+def _inferred_array(pa, values: list[Any], type: Any) -> Any:
+    try:
+        return pa.array(values, type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if not pa.types.is_string(type):
+            raise
+    # A column typed as string while it was empty keeps any later value as text.
+    return pa.array([None if value is None else str(value) for value in values], type)
+
+
+def _arrow_batches(batches: Iterable[Batch], columns: list[Column]) -> Iterator[Any]:
+    """Convert column buffers to `pyarrow.RecordBatch`es sharing one schema.
+
+    The type of an `infer` column comes from its first non-empty values, so
+    batches are held back, up to `MAX_HELD_BATCHES`, while such a column has
+    only seen None. A column still empty then is typed as string.
+    """
+    pa = _require_pyarrow()
+    fixed = {
+        ColumnType.BOOL: pa.bool_(),
+        ColumnType.FLOAT: pa.float64(),
+        ColumnType.LIST: pa.list_(pa.string()),
+        ColumnType.STRING: pa.string(),
+        ColumnType.TIMESTAMP: pa.timestamp("ms", tz="UTC"),
+    }
+    inferred: dict[str, Any] = {}
+    held: list[list[Any]] = []
+    names = [column.name for column in columns]
+    infer = [column.name for column in columns if column.type is ColumnType.INFER]
+
+    def release() -> Iterator[Any]:
+        for arrays in held:
+            for i, column in enumerate(columns):
+                if pa.types.is_null(arrays[i].type):
+                    type = inferred.setdefault(column.name, pa.string())
+                    arrays[i] = arrays[i].cast(type)
+            yield pa.RecordBatch.from_arrays(arrays, names=names)
+        held.clear()
+
+    for batch in batches:
+        arrays = []
+        for column in columns:
+            values = batch[column.name]
+            if column.type is ColumnType.TIMESTAMP:
+                # ISO 8601 strings are parsed by Arrow rather than in Python.
+                array = pa.array(values, pa.string()).cast(fixed[column.type])
+            elif column.type is not ColumnType.INFER:
+                array = pa.array(values, fixed[column.type])
+            elif column.name in inferred:
+                array = _inferred_array(pa, values, inferred[column.name])
+            else:
+                array = pa.array(values)
+                if not pa.types.is_null(array.type):
+                    inferred[column.name] = _infer_type(pa, array)
+                    array = array.cast(inferred[column.name])
+            arrays.append(array)
+        held.append(arrays)
+        if len(held) >= MAX_HELD_BATCHES or all(name in inferred for name in infer):
+            yield from release()
+    yield from release()
+
+
+def write_arrow(batches: Iterable[Batch], path: str, columns: list[Column]) -> int:
+    """Write batches to an Arrow IPC file."""
+    pa = _require_pyarrow()
+    rows = 0
+    writer = None
+    try:
+        for record_batch in _arrow_batches(batches, columns):
+            if writer is None:
+                writer = pa.ipc.new_file(path, record_batch.schema)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_parquet(batches: Iterable[Batch], path: str, columns: list[Column]) -> int:
+    """Write batches to a Parquet file, one row group per batch."""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for record_batch in _arrow_batches(batches, columns):
+            if writer is None:
+                writer = pq.ParquetWriter(path, record_batch.schema)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def export_database(
+    notion: Notion,
+    database_id: str,
+    path: str,
+    format: ColumnarFormat | str = ColumnarFormat.PARQUET,
+    filter: dict[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Export the rows of a database to `path`; return the number of rows.
+
+    Columns follow the database schema, so every batch has the same columns.
+    """
+    format = ColumnarFormat(format)
+    database = notion.retrieve_database(database_id)
+    columns = columns_from_properties(database["properties"])
+    pages = notion.iter_database(database_id, filter=filter)
+    batches = iter_column_batches(pages, columns, batch_size)
+    if format is ColumnarFormat.CSV:
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            return write_csv(batches, file, columns)
+    if format is ColumnarFormat.ARROW:
+        return write_arrow(batches, path, columns)
+    return write_parquet(batches, path, columns)
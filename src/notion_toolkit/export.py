@@ -0,0 +1,149 @@
+"""Streaming page export to Markdown or JSON Lines.
+
+Blocks are written as they arrive from `Notion.iter_block_tree`, which fetches
+at most `max_lookahead` child lists ahead of the writer, so exporting a large
+page holds neither the whole tree nor the whole output in memory.
+
+"""
+
+import json
+from enum import Enum
+from typing import IO, Any, Iterable, Iterator
+
+from notion_toolkit.notion import Notion
+
+BlockTree = Iterable[tuple[int, dict[str, Any]]]
+
+INDENT = "    "
+
+_PREFIXES = {
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "- ",
+    "numbered_list_item": "1. ",
+    "toggle": "- ",
+    "quote": "> ",
+    "callout": "> ",
+    "paragraph": "",
+}
+_LIST_TYPES = {"bulleted_list_item", "numbered_list_item", "to_do", "toggle"}
+
+
+class ExportFormat(str, Enum):
+    """
+    Output format of a page export.
+    """
+
+    MARKDOWN = "markdown"
+    JSONL = "jsonl"
+
+
+def rich_text_to_markdown(spans: list[dict[str, Any]]) -> str:
+    """Render rich text objects as returned by the API to inline Markdown."""
+    parts = []
+    for span in spans:
+        text = span.get("plain_text", "")
+        if span.get("type") == "equation":
+            text = f"${span['equation']['expression']}$"
+        annotations = span.get("annotations") or {}
+        if text.strip():
+            if annotations.get("code"):
+                text = f"`{text}`"
+            if annotations.get("bold"):
+                text = f"**{text}**"
+            if annotations.get("italic"):
+                text = f"*{text}*"
+            if annotations.get("strikethrough"):
+                text = f"~~{text}~~"
+        if span.get("href"):
+            text = f"[{text}]({span['href']})"
+        parts.append(text)
+    return "".join(parts)
+
+
+def block_to_markdown(block: dict[str, Any], depth: int = 0) -> str:
+    """Render one block, without its children, as Markdown ending in a newline.
+
+    Block types without a Markdown form, such as embeds or child databases,
+    render as an empty string.
+    """
+    kind = block.get("type")
+    content = block.get(kind) or {}
+    indent = INDENT * depth
+    text = rich_text_to_markdown(content.get("rich_text", []))
+    if kind == "code":
+        language = content.get("language", "")
+        language = "" if language == "plain text" else language
+        body = "".join(f"{indent}{line}\n" for line in text.split("\n"))
+        return f"{indent}```{language}\n{body}{indent}```\n\n"
+    if kind == "divider":
+        return f"{indent}---\n\n"
+    if kind == "to_do":
+        checked = "x" if content.get("checked") else " "
+        return f"{indent}- [{checked}] {text}\n"
+    if kind == "child_page":
+        return f"{indent}# {content.get('title', '')}\n\n"
+    if kind not in _PREFIXES:
+        return ""
+    prefix = _PREFIXES[kind]
+    lines = text.split("\n")
+    if kind in ("quote", "callout"):
+        rendered = "\n".join(f"{indent}{prefix}{line}" for line in lines)
+    else:
+        continuation = "\n" + indent + " " * len(prefix)
+        rendered = indent + prefix + continuation.join(lines)
+    return rendered + ("\n" if kind in _LIST_TYPES else "\n\n")
+
+
+def iter_markdown(tree: BlockTree) -> Iterator[str]:
+    """Markdown chunks for a `(depth, block)` stream in document order."""
+    previous_list = False
+    for depth, block in tree:
+        is_list = block.get("type") in _LIST_TYPES
+        # A list that ends needs a blank line before the next block.
+        if previous_list and not is_list and depth == 0:
+            yield "\n"
+        previous_list = is_list
+        if chunk := block_to_markdown(block, depth):
+            yield chunk
+    if previous_list:
+        yield "\n"
+
+
+def iter_jsonl(tree: BlockTree) -> Iterator[str]:
+    """One JSON object per block, with its `depth` added, one per line."""
+    for depth, block in tree:
+        yield json.dumps({"depth": depth, **block}, ensure_ascii=False) + "\n"
+
+
+def write_export(
+    tree: BlockTree, file: IO[str], format: ExportFormat | str = ExportFormat.MARKDOWN
+) -> int:
+    """Write a block stream to a text file incrementally; return the block count."""
+    count = 0
+
+    def counted() -> BlockTree:
+        nonlocal count
+        for item in tree:
+            count += 1
+            yield item
+
+    render = iter_jsonl if ExportFormat(format) is ExportFormat.JSONL else iter_markdown
+    for chunk in render(counted()):
+        file.write(chunk)
+    return count
+
+
+def export_page(
+    notion: Notion,
+    page_id: str,
+    file: IO[str],
+    format: ExportFormat | str = ExportFormat.MARKDOWN,
+    max_depth: int | None = None,
+    max_in_flight: int = 4,
+    max_lookahead: int = 64,
+) -> int:
+    """Fetch the block tree of a page concurrently and stream it to `file`."""
+    tree = notion.iter_block_tree(page_id, max_depth, max_in_flight, max_lookahead)
+    return write_export(tree, file, format)
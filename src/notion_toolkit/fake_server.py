@@ -0,0 +1,587 @@
+"""Local stand-in for the Notion API, for load and behavior tests.
+
+`FakeNotionServer` serves the endpoints the toolkit uses from in-memory state,
+with the request and error formats of the real API:
+
+    - POST /v1/pages, GET and PATCH /v1/pages/{id}
+    - GET /v1/databases/{id}, POST /v1/databases/{id}/query
+    - GET and PATCH /v1/blocks/{id}/children
+
+Every response is delayed by `latency` plus up to `jitter` seconds, and
+requests above `rate` per second (after a `burst`) are answered with HTTP 429
+and a `Retry-After` header. Point a client at it with `base_url`:
+
+    with FakeNotionServer(latency=0.05, rate=3) as server:
+        database_id = server.add_database()["id"]
+        notion = Notion(token="secret", base_url=server.base_url)
+
+Run it standalone with `python -m notion_toolkit.fake_server --help`.
+
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlsplit
+
+from notion_toolkit.columnar import decode_property
+from notion_toolkit.query import parse_filter
+from notion_toolkit.schema.constants import MAX_ARRAY_LENGTH, MAX_TEXT_LENGTH
+
+
+class FakeNotionError(Exception):
+    """An API error, sent as a Notion error object."""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")[:-6] + "Z"
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _not_found(object_id: str) -> FakeNotionError:
+    return FakeNotionError(
+        404, "object_not_found", f"Could not find object with ID: {object_id}."
+    )
+
+
+def _invalid(message: str) -> FakeNotionError:
+    return FakeNotionError(400, "validation_error", message)
+
+
+def _rich_text(spans: list[dict[str, Any]], name: str) -> list[dict[str, Any]]:
+    """Check the limits of a rich text array and fill in response fields."""
+    if not isinstance(spans, list):
+        raise _invalid(f"{name} should be an array.")
+    if len(spans) > MAX_ARRAY_LENGTH:
+        raise _invalid(f"{name}.length should be ≤ `{MAX_ARRAY_LENGTH}`.")
+    filled = []
+    for span in spans:
+        if not isinstance(span, dict) or not isinstance(span.get("text") or {}, dict):
+            raise _invalid(f"{name} should be an array of rich text objects.")
+        text = span.get("text") or {}
+        if len(text.get("content", "")) > MAX_TEXT_LENGTH:
+            raise _invalid(
+                f"{name}.text.content.length should be ≤ `{MAX_TEXT_LENGTH}`."
+            )
+        link = text.get("link")
+        filled.append(
+            {
+                "type": span.get("type", "text"),
+                **span,
+                "annotations": {
+                    "bold": False,
+                    "italic": False,
+                    "strikethrough": False,
+                    "underline": False,
+                    "code": False,
+                    "color": "default",
+                    **(span.get("annotations") or {}),
+                },
+                "plain_text": span.get("plain_text", text.get("content", "")),
+                "href": span.get("href", link["url"] if link else None),
+            }
+        )
+    return filled
+
+
+class FakeNotionState:
+    """
+    In-memory pages, databases and blocks behind a `FakeNotionServer`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages: dict[str, dict[str, Any]] = {}
+        self.databases: dict[str, dict[str, Any]] = {}
+        self.blocks: dict[str, dict[str, Any]] = {}
+        self.children: dict[str, list[str]] = {}
+
+    def add_database(
+        self, properties: dict[str, str] | None = None, database_id: str | None = None
+    ) -> dict[str, Any]:
+        """Add a database with properties given as name to type.
+
+        Without `properties`, the schema is learned from the pages created in it.
+        """
+        database_id = database_id or _new_id()
+        database = {
+            "object": "database",
+            "id": database_id,
+            "created_time": _now(),
+            "last_edited_time": _now(),
+            "title": [],
+            "properties": {},
+        }
+        self.databases[database_id] = database
+        for name, kind in (properties or {}).items():
+            self._add_property(database, name, kind)
+        database["learn_schema"] = properties is None
+        return database
+
+    @staticmethod
+    def _add_property(database: dict[str, Any], name: str, kind: str) -> None:
+        database["properties"][name] = {
+            "id": uuid.uuid4().hex[:4],
+            "name": name,
+            "type": kind,
+            kind: {},
+        }
+
+    def _properties(
+        self, database: dict[str, Any] | None, properties: dict[str, Any]
+    ) -> dict[str, Any]:
+        if not isinstance(properties, dict):
+            raise _invalid("body.properties should be an object.")
+        filled = {}
+        for name, value in properties.items():
+            try:
+                kind = value.get("type") or next(k for k in value if k != "id")
+                content = value[kind]
+            except (AttributeError, KeyError, StopIteration):
+                raise _invalid(f"body.properties.{name} should be a property value.")
+            if database is not None:
+                definition = database["properties"].get(name)
+                if definition is None and database["learn_schema"]:
+                    self._add_property(database, name, kind)
+                    definition = database["properties"][name]
+                if definition is None:
+                    raise _invalid(f"{name} is not a property that exists.")
+                if definition["type"] != kind:
+                    raise _invalid(f"{name} is expected to be {definition['type']}.")
+            if kind in ("title", "rich_text"):
+                content = _rich_text(content, f"body.properties.{name}.{kind}")
+            filled[name] = {"id": uuid.uuid4().hex[:4], "type": kind, kind: content}
+        return filled
+
+    def create_page(self, body: dict[str, Any]) -> dict[str, Any]:
+        parent = body.get("parent") or {}
+        database = None
+        if "database_id" in parent:
+            database = self.databases.get(parent["database_id"])
+            if database is None:
+                raise _not_found(parent["database_id"])
+            parent = {"type": "database_id", "database_id": database["id"]}
+        elif "page_id" in parent:
+            if parent["page_id"] not in self.pages:
+                raise _not_found(parent["page_id"])
+            parent = {"type": "page_id", "page_id": parent["page_id"]}
+        else:
+            raise _invalid("body.parent should be defined.")
+        page_id = _new_id()
+        now = _now()
+        page = {
+            "object": "page",
+            "id": page_id,
+            "created_time": now,
+            "last_edited_time": now,
+            "archived": False,
+            "icon": body.get("icon"),
+            "cover": body.get("cover"),
+            "parent": parent,
+            "properties": self._properties(database, body.get("properties", {})),
+            "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+        }
+        self.pages[page_id] = page
+        if body.get("children"):
+            self.append_children(page_id, {"children": body["children"]})
+        return page
+
+    def retrieve_page(self, page_id: str) -> dict[str, Any]:
+        page = self.pages.get(page_id)
+        if page is None:
+            raise _not_found(page_id)
+        return page
+
+    def update_page(self, page_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        page = self.retrieve_page(page_id)
+        parent = page["parent"]
+        database = self.databases.get(parent.get("database_id", ""))
+        page["properties"].update(
+            self._properties(database, body.get("properties", {}))
+        )
+        for key in ("icon", "cover", "archived"):
+            if key in body:
+                page[key] = body[key]
+        page["last_edited_time"] = _now()
+        return page
+
+    def retrieve_database(self, database_id: str) -> dict[str, Any]:
+        database = self.databases.get(database_id)
+        if database is None:
+            raise _not_found(database_id)
+        return {key: value for key, value in database.items() if key != "learn_schema"}
+
+    def query_database(self, database_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        self.retrieve_database(database_id)
+        pages = [
+            page
+            for page in self.pages.values()
+            if page["parent"].get("database_id") == database_id and not page["archived"]
+        ]
+        if body.get("filter"):
+            try:
+                predicate = parse_filter(body["filter"])
+            except (KeyError, StopIteration, ValueError) as error:
+                raise _invalid(f"body.filter is invalid: {error}")
+            pages = [page for page in pages if predicate.matches(page)]
+        for sort in reversed(body.get("sorts") or []):
+            pages.sort(
+                key=_sort_key(sort), reverse=sort.get("direction") == "descending"
+            )
+        return _paginate(pages, body.get("start_cursor"), body.get("page_size"), "page")
+
+    def list_children(
+        self, block_id: str, start_cursor: str | None, page_size: int | None
+    ) -> dict[str, Any]:
+        if block_id not in self.pages and block_id not in self.blocks:
+            raise _not_found(block_id)
+        blocks = [self.blocks[i] for i in self.children.get(block_id, [])]
+        return _paginate(blocks, start_cursor, page_size, "block")
+
+    def append_children(self, block_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        if block_id not in self.pages and block_id not in self.blocks:
+            raise _not_found(block_id)
+        children = body.get("children") or []
+        if len(children) > MAX_ARRAY_LENGTH:
+            raise _invalid(f"body.children.length should be ≤ `{MAX_ARRAY_LENGTH}`.")
+        created = [self._add_block(block_id, block) for block in children]
+        return {
+            "object": "list",
+            "results": created,
+            "next_cursor": None,
+            "has_more": False,
+            "type": "block",
+            "block": {},
+        }
+
+    def _add_block(self, parent_id: str, block: dict[str, Any]) -> dict[str, Any]:
+        try:
+            kind = block.get("type") or next(k for k in block if k != "object")
+            content = dict(block.get(kind) or {})
+        except (AttributeError, StopIteration, TypeError, ValueError):
+            raise _invalid("body.children should be an array of block objects.")
+        nested = content.pop("children", [])
+        for key in ("rich_text", "caption"):
+            if key in content:
+                content[key] = _rich_text(content[key], f"body.children.{kind}.{key}")
+        parent_type = "page_id" if parent_id in self.pages else "block_id"
+        now = _now()
+        created = {
+            "object": "block",
+            "id": _new_id(),
+            "parent": {"type": parent_type, parent_type: parent_id},
+            "created_time": now,
+            "last_edited_time": now,
+            "has_children": False,
+            "archived": False,
+            "type": kind,
+            kind: content,
+        }
+        self.blocks[created["id"]] = created
+        self.children.setdefault(parent_id, []).append(created["id"])
+        if parent_id in self.blocks:
+            self.blocks[parent_id]["has_children"] = True
+        for child in nested:
+            self._add_block(created["id"], child)
+        return created
+
+
+def _sort_key(sort: dict[str, Any]) -> Callable[[dict[str, Any]], Any]:
+    if "timestamp" in sort:
+        return lambda page: page[sort["timestamp"]]
+
+    descending = sort.get("direction") == "descending"
+
+    def key(page: dict[str, Any]) -> Any:
+        value = decode_property(page["properties"].get(sort["property"]))
+        # Empty values come last in either direction, as in `query._sort_key`.
+        if value is None or value == [] or value == "":
+            return (not descending, 0)
+        return (descending, value)
+
+    return key
+
+
+def _paginate(
+    items: list[dict[str, Any]],
+    start_cursor: str | None,
+    page_size: int | None,
+    kind: str,
+) -> dict[str, Any]:
+    page_size = min(int(page_size or MAX_ARRAY_LENGTH), MAX_ARRAY_LENGTH)
+    start = 0
+    if start_cursor:
+        ids = [item["id"] for item in items]
+        if start_cursor not in ids:
+            raise _invalid("start_cursor provided is invalid.")
+        start = ids.index(start_cursor)
+    results = items[start : start + page_size]
+    has_more = start + page_size < len(items)
+    return {
+        "object": "list",
+        "results": results,
+        "next_cursor": items[start + page_size]["id"] if has_more else None,
+        "has_more": has_more,
+        "type": kind,
+        kind: {},
+    }
+
+
+class RateLimiter:
+    """
+    Token bucket answering how long a request over the limit should wait.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token and return 0, or return the seconds until one is free."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+_ROUTES = [
+    ("POST", re.compile(r"/v1/pages/?"), "create_page"),
+    ("GET", re.compile(r"/v1/pages/([\w-]+)"), "retrieve_page"),
+    ("PATCH", re.compile(r"/v1/pages/([\w-]+)"), "update_page"),
+    ("GET", re.compile(r"/v1/databases/([\w-]+)"), "retrieve_database"),
+    ("POST", re.compile(r"/v1/databases/([\w-]+)/query"), "query_database"),
+    ("GET", re.compile(r"/v1/blocks/([\w-]+)/children"), "list_children"),
+    ("PATCH", re.compile(r"/v1/blocks/([\w-]+)/children"), "append_children"),
+]
+
+
+class FakeNotionServer:
+    """
+    Threaded HTTP server emulating the Notion API on localhost.
+
+    `Retry-After` is rounded up to `retry_after_precision` decimals; the real
+    API sends whole seconds, which is the default. `requests` counts served
+    requests per route and `rate_limited` the 429 answers.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate: float | None = None,
+        burst: int = 3,
+        retry_after_precision: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.limiter = RateLimiter(rate, burst) if rate else None
+        self.retry_after_precision = retry_after_precision
+        self.state = FakeNotionState()
+        self.requests: Counter[str] = Counter()
+        self.rate_limited = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_database(
+        self, properties: dict[str, str] | None = None, database_id: str | None = None
+    ) -> dict[str, Any]:
+        with self.state.lock:
+            return self.state.retrieve_database(
+                self.state.add_database(properties, database_id)["id"]
+            )
+
+    def start(self) -> "FakeNotionServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def handle(
+        self, method: str, path: str, query: dict[str, str], body: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """Serve one request and return status, JSON body and extra headers."""
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        for route_method, pattern, name in _ROUTES:
+            if route_method == method and (route := pattern.fullmatch(path)):
+                break
+        else:
+            error = FakeNotionError(400, "invalid_request_url", "Invalid request URL.")
+            return error.status, _error_body(error), {}
+
+        if self.limiter is not None and (wait := self.limiter.acquire()):
+            scale = 10**self.retry_after_precision
+            retry_after = math.ceil(wait * scale) / scale
+            self.rate_limited += 1
+            error = FakeNotionError(
+                429, "rate_limited", "You have been rate limited. Please try again."
+            )
+            header = f"{retry_after:.{self.retry_after_precision}f}"
+            return error.status, _error_body(error), {"Retry-After": header}
+
+        self.requests[name] += 1
+        state = self.state
+        args = route.groups()
+        try:
+            with state.lock:
+                match name:
+                    case "create_page":
+                        result = state.create_page(body)
+                    case "retrieve_page":
+                        result = state.retrieve_page(*args)
+                    case "update_page":
+                        result = state.update_page(*args, body)
+                    case "retrieve_database":
+                        result = state.retrieve_database(*args)
+                    case "query_database":
+                        result = state.query_database(*args, body)
+                    case "list_children":
+                        result = state.list_children(
+                            *args, query.get("start_cursor"), query.get("page_size")
+                        )
+                    case _:
+                        result = state.append_children(*args, body)
+                # Copies, so later updates never race with encoding.
+                return 200, json.loads(json.dumps(result)), {}
+        except FakeNotionError as error:
+            return error.status, _error_body(error), {}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; avoid delayed ACK stalls.
+            disable_nagle_algorithm = True
+
+            def _serve(self) -> None:
+                url = urlsplit(self.path)
+                path, query = url.path, dict(parse_qsl(url.query))
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if not self.headers.get("Authorization", "").startswith("Bearer "):
+                    error = FakeNotionError(
+                        401, "unauthorized", "API token is invalid."
+                    )
+                    status, body, headers = error.status, _error_body(error), {}
+                else:
+                    try:
+                        payload = json.loads(raw) if raw else {}
+                    except json.JSONDecodeError:
+                        error = _invalid("Error parsing JSON body.")
+                        status, body, headers = error.status, _error_body(error), {}
+                    else:
+                        status, body, headers = server.handle(
+                            self.command, path, query, payload
+                        )
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = _serve
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+def _error_body(error: FakeNotionError) -> dict[str, Any]:
+    return {
+        "object": "error",
+        "status": error.status,
+        "code": error.code,
+        "message": error.message,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--rate", type=float, help="requests per second")
+    parser.add_argument("--burst", type=int, default=3)
+    parser.add_argument(
+        "--database", action="append", default=[], help="id of a database to create"
+    )
+    args = parser.parse_args()
+
+    server = FakeNotionServer(
+        args.latency, args.jitter, args.rate, args.burst, host=args.host, port=args.port
+    )
+    for database_id in args.database or [None]:
+        print(f"database {server.add_database(database_id=database_id)['id']}")
+    print(f"serving on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
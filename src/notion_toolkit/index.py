@@ -0,0 +1,73 @@
+"""Local indexes over database pages."""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+
+
+class UrlIndex:
+    """
+    Hash index from the URL property of database pages to their page id.
+
+    Built once from a database query and kept up to date as pages are created,
+    so duplicate URLs are detected in O(1) without asking Notion.
+    """
+
+    def __init__(self, property_name: str = "URL"):
+        self.property_name = property_name
+        self._page_ids: dict[str, str] = {}
+        self._lock = threading.Lock()
+        # Lock and number of holders or waiters, per URL being upserted.
+        self._url_locks: dict[str, tuple[threading.Lock, int]] = {}
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[dict[str, Any]], property_name: str = "URL"
+    ) -> "UrlIndex":
+        index = cls(property_name)
+        for page in pages:
+            index.add_page(page)
+        return index
+
+    def add_page(self, page: dict[str, Any]) -> None:
+        """Index a page object returned by the API."""
+        url = page.get("properties", {}).get(self.property_name, {}).get("url")
+        if url:
+            self.add(url, page["id"])
+
+    def add(self, url: str, page_id: str) -> None:
+        with self._lock:
+            self._page_ids[url] = page_id
+
+    @contextmanager
+    def locked(self, url: str | None) -> Iterator[None]:
+        """Hold the lock of one URL, around a lookup and the page creation.
+
+        Concurrent upserts of the same URL then run one after the other, so
+        the second finds the page the first created instead of duplicating it.
+        """
+        if not url:
+            yield
+            return
+        with self._lock:
+            lock, users = self._url_locks.get(url, (threading.Lock(), 0))
+            self._url_locks[url] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._url_locks[url]
+                if users == 1:
+                    del self._url_locks[url]
+                else:
+                    self._url_locks[url] = (lock, users - 1)
+
+    def get(self, url: str | None) -> str | None:
+        return self._page_ids.get(url) if url else None
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._page_ids
+
+    def __len__(self) -> int:
+        return len(self._page_ids)
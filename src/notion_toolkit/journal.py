@@ -0,0 +1,119 @@
+"""Write-ahead journal for resumable imports."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from enum import Enum
+from os import PathLike
+from typing import Any, Mapping
+
+
+class JournalEvent(str, Enum):
+    """
+    Event recorded for an idempotency key.
+    """
+
+    BEGIN = "begin"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ImportJournal:
+    """
+    Append-only SQLite journal of page creations.
+
+    A `begin` entry is written before a request is sent and a `done` entry
+    with the resulting page id once it succeeds. Rerunning an interrupted
+    import with the same journal skips every row that already has a `done`
+    entry without calling the API. Keys left at `begin` were in flight when
+    the import stopped; their page may or may not exist, see `in_flight`.
+    """
+
+    def __init__(self, path: str | PathLike = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL,
+                event TEXT NOT NULL,
+                page_id TEXT,
+                created_at REAL NOT NULL
+            )
+            """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_key ON entries (key, event)"
+        )
+
+    @staticmethod
+    def key(database_id: str, row: Mapping[str, Any]) -> str:
+        """Idempotency key of the page created from `row` in `database_id`.
+
+        The page payload is a pure function of the database id and the row, so
+        hashing their canonical JSON identifies the payload without building it.
+        """
+        canonical = json.dumps(
+            {"database_id": database_id, "row": row},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def page_id(self, key: str) -> str | None:
+        """Page id recorded for a completed key, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT page_id FROM entries WHERE key = ? AND event = ? LIMIT 1",
+                (key, JournalEvent.DONE.value),
+            ).fetchone()
+        return row[0] if row else None
+
+    def begin(self, key: str) -> None:
+        self._append(key, JournalEvent.BEGIN)
+
+    def done(self, key: str, page_id: str) -> None:
+        self._append(key, JournalEvent.DONE, page_id)
+
+    def failed(self, key: str) -> None:
+        self._append(key, JournalEvent.FAILED)
+
+    def in_flight(self) -> list[str]:
+        """Keys that were started but never completed or failed."""
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT key FROM entries
+                WHERE seq IN (SELECT MAX(seq) FROM entries GROUP BY key)
+                AND event = ?
+                """,
+                (JournalEvent.BEGIN.value,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ImportJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _append(
+        self, key: str, event: JournalEvent, page_id: str | None = None
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO entries (key, event, page_id, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, event.value, page_id, time.time()),
+            )
@@ -0,0 +1,218 @@
+"""Streaming Markdown to Notion rich text and blocks.
+
+The source is read line by line and blocks are yielded as soon as they are
+complete, so documents of any size are converted in a single pass while only
+one block is held in memory. Every span respects the 2000 character
+`text.content` limit and every block the 100 element rich text array limit;
+longer paragraphs and code blocks continue in a new block of the same type.
+
+Supported syntax: ATX headings (`#` to `###`), paragraphs, `-`/`*`/`+` and
+numbered list items, `>` quotes, fenced code blocks, `---` dividers, and inline
+`**bold**`, `*italic*`, `~~strikethrough~~`, `` `code` `` and `[links](url)`.
+
+"""
+
+import io
+import re
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from pydantic import ValidationError
+
+from notion_toolkit.schema.constants import MAX_ARRAY_LENGTH, MAX_TEXT_LENGTH
+from notion_toolkit.schema.rich_text import (
+    Annotations,
+    Link,
+    RichText,
+    RichTextObjectType,
+    TextObject,
+)
+
+# Raw characters buffered per block before it is flushed: a full block holds at
+# most MAX_ARRAY_LENGTH spans of MAX_TEXT_LENGTH characters.
+BLOCK_BUFFER_LENGTH = MAX_TEXT_LENGTH * MAX_ARRAY_LENGTH
+
+_INLINE = re.compile(
+    r"\*\*(?P<bold>.+?)\*\*"
+    r"|__(?P<bold_alt>.+?)__"
+    r"|~~(?P<strikethrough>.+?)~~"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+    r"|(?<![\w*])\*(?P<italic>[^*\s](?:.*?[^*\s])?)\*(?![\w*])"
+    r"|(?<!\w)_(?P<italic_alt>[^_\s](?:.*?[^_\s])?)_(?!\w)",
+    re.DOTALL,
+)
+_HEADING = re.compile(r"(#{1,3})\s+(.*)")
+_BULLET = re.compile(r"[-*+]\s+(.*)")
+_NUMBERED = re.compile(r"\d+[.)]\s+(.*)")
+_QUOTE = re.compile(r">\s?(.*)")
+_FENCE = re.compile(r"(```|~~~)\s*([\w+-]*)\s*$")
+_DIVIDER = re.compile(r"(?:-{3,}|\*{3,}|_{3,})\s*$")
+_LANGUAGE_ALIASES = {
+    "": "plain text",
+    "js": "javascript",
+    "py": "python",
+    "sh": "shell",
+    "ts": "typescript",
+    "yml": "yaml",
+}
+
+
+def split_content(text: str, limit: int = MAX_TEXT_LENGTH) -> Iterator[str]:
+    """Split text into chunks of at most `limit` characters.
+
+    Chunks end after the last whitespace in the window when there is one in its
+    second half, so words are only cut when they are longer than half a chunk.
+    """
+    start = 0
+    while len(text) - start > limit:
+        end = start + limit
+        cut = max(text.rfind(" ", start, end), text.rfind("\n", start, end)) + 1
+        if cut <= start + limit // 2:
+            cut = end
+        yield text[start:cut]
+        start = cut
+    if start < len(text) or not text:
+        yield text[start:]
+
+
+def _text_spans(
+    text: str, annotations: Annotations | None = None, url: str | None = None
+) -> Iterator[RichText]:
+    link = None
+    if url is not None and len(url) <= MAX_TEXT_LENGTH:
+        try:
+            link = Link(url=url)
+        except ValidationError:
+            # Relative links and anchors have no meaning in Notion.
+            link = None
+    for chunk in split_content(text):
+        yield RichText(
+            type=RichTextObjectType.TEXT,
+            text=TextObject(content=chunk, link=link),
+            annotations=annotations or Annotations(),
+            plain_text=chunk,
+            href=str(link.url) if link else None,
+        )
+
+
+def text_to_rich_text(text: str) -> Iterator[RichText]:
+    """Convert inline Markdown to rich text spans within the content limit."""
+    position = 0
+    for match in _INLINE.finditer(text):
+        if match.start() > position:
+            yield from _text_spans(text[position : match.start()])
+        groups = match.groupdict()
+        if groups["link_text"] is not None:
+            yield from _text_spans(groups["link_text"], url=groups["url"])
+        elif groups["code"] is not None:
+            yield from _text_spans(groups["code"], Annotations(code=True))
+        elif groups["strikethrough"] is not None:
+            yield from _text_spans(
+                groups["strikethrough"], Annotations(strikethrough=True)
+            )
+        elif (bold := groups["bold"] or groups["bold_alt"]) is not None:
+            yield from _text_spans(bold, Annotations(bold=True))
+        else:
+            italic = groups["italic"] or groups["italic_alt"]
+            yield from _text_spans(italic, Annotations(italic=True))
+        position = match.end()
+    if position < len(text):
+        yield from _text_spans(text[position:])
+
+
+def _blocks(block_type: str, text: str, **fields: Any) -> Iterator[dict[str, Any]]:
+    spans = text_to_rich_text(text) if block_type != "code" else _text_spans(text)
+    while batch := list(islice(spans, MAX_ARRAY_LENGTH)):
+        yield {
+            "object": "block",
+            "type": block_type,
+            block_type: {"rich_text": batch, **fields},
+        }
+
+
+def _lines(source: str | Iterable[str]) -> Iterator[str]:
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    for line in lines:
+        line = line.rstrip("\r\n")
+        # A single huge line is cut so no buffer outgrows one block.
+        if len(line) > BLOCK_BUFFER_LENGTH:
+            yield from split_content(line, BLOCK_BUFFER_LENGTH)
+        else:
+            yield line
+
+
+def markdown_to_blocks(source: str | Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Convert Markdown, given as a string or an iterable of lines, to blocks.
+
+    Blocks are plain dicts in the API format whose `rich_text` holds `RichText`
+    models, ready for `Notion.request_json` or `schema.encode.dumps`.
+    """
+    paragraph: list[str] = []
+    paragraph_length = 0
+    code: list[str] | None = None
+    code_length = 0
+    language = "plain text"
+
+    def flush_paragraph() -> Iterator[dict[str, Any]]:
+        nonlocal paragraph_length
+        if paragraph:
+            yield from _blocks("paragraph", "\n".join(paragraph))
+            paragraph.clear()
+            paragraph_length = 0
+
+    for line in _lines(source):
+        if code is not None:
+            if _FENCE.match(line.strip()):
+                yield from _blocks("code", "\n".join(code), language=language)
+                code = None
+                continue
+            if code_length + len(line) > BLOCK_BUFFER_LENGTH:
+                yield from _blocks("code", "\n".join(code), language=language)
+                code.clear()
+                code_length = 0
+            code.append(line)
+            code_length += len(line) + 1
+            continue
+
+        stripped = line.strip()
+        if fence := _FENCE.match(stripped):
+            yield from flush_paragraph()
+            code, code_length = [], 0
+            language = fence.group(2).lower()
+            language = _LANGUAGE_ALIASES.get(language, language)
+        elif not stripped:
+            yield from flush_paragraph()
+        elif _DIVIDER.match(stripped):
+            yield from flush_paragraph()
+            yield {"object": "block", "type": "divider", "divider": {}}
+        elif heading := _HEADING.match(stripped):
+            yield from flush_paragraph()
+            yield from _blocks(f"heading_{len(heading.group(1))}", heading.group(2))
+        elif bullet := _BULLET.match(stripped):
+            yield from flush_paragraph()
+            yield from _blocks("bulleted_list_item", bullet.group(1))
+        elif numbered := _NUMBERED.match(stripped):
+            yield from flush_paragraph()
+            yield from _blocks("numbered_list_item", numbered.group(1))
+        elif quote := _QUOTE.match(stripped):
+            yield from flush_paragraph()
+            yield from _blocks("quote", quote.group(1))
+        else:
+            if paragraph_length + len(line) > BLOCK_BUFFER_LENGTH:
+                yield from flush_paragraph()
+            paragraph.append(line)
+            paragraph_length += len(line) + 1
+
+    yield from flush_paragraph()
+    if code is not None:
+        yield from _blocks("code", "\n".join(code), language=language)
+
+
+def batched_blocks(
+    blocks: Iterable[dict[str, Any]], size: int = MAX_ARRAY_LENGTH
+) -> Iterator[list[dict[str, Any]]]:
+    """Group blocks into batches that fit one append children request."""
+    iterator = iter(blocks)
+    while batch := list(islice(iterator, size)):
+        yield batch
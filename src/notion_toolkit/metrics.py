@@ -0,0 +1,316 @@
+"""Client metrics and tracing hooks.
+
+`Notion`, `AsyncNotion` and `RequestScheduler` report each step of an API call
+to an `Instrumentation`:
+
+    - time spent building and encoding the request body (`on_phase`),
+    - time spent waiting for the rate limiter (`on_queue_wait`),
+    - every HTTP exchange, with its latency and byte counts (`on_request`),
+    - 429 answers and the retries they cause (`on_rate_limited`, `on_retry`).
+
+The default instrumentation does nothing and no HTTP hooks are installed for
+it. `Metrics` aggregates the events into histograms and counters and renders
+them in the Prometheus text format:
+
+    metrics = Metrics()
+    notion = Notion(instrumentation=metrics)
+    ...
+    print(metrics.to_prometheus())
+
+Subclass `Instrumentation` to forward events to a tracing system instead.
+
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import TYPE_CHECKING, Iterable
+
+import httpx
+
+if TYPE_CHECKING:
+    from notion_toolkit.scheduler import Priority
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path segments kept as is where an id would otherwise be, e.g. `users/me`.
+_LITERAL_SEGMENTS = {"me"}
+
+
+class Instrumentation:
+    """
+    Hooks called by the clients and the scheduler; they all do nothing here.
+
+    Hooks are called from the threads sending requests, so implementations
+    must be thread-safe, and should be fast since they run on every request.
+    """
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        """A client-side step of a request, `payload` or `encode`, finished."""
+
+    def on_queue_wait(self, priority: "Priority", seconds: float) -> None:
+        """A request waited `seconds` for a rate limiter token."""
+
+    def on_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """An HTTP exchange finished, including reading the response body."""
+
+    def on_rate_limited(self, retry_after: float | None) -> None:
+        """The API answered 429, with a `Retry-After` in seconds if any."""
+
+    def on_retry(self, attempt: int, delay: float) -> None:
+        """A rate limited request will be retried after `delay` seconds."""
+
+
+NOOP = Instrumentation()
+
+
+def endpoint(path: str) -> str:
+    """Path template of an API path, ids replaced by `{id}`.
+
+    Notion paths alternate collections and ids, as in
+    `/v1/blocks/{id}/children`, so ids are found by position.
+    """
+    segments = path.strip("/").split("/")
+    for i in range(2, len(segments), 2):
+        if segments[i] not in _LITERAL_SEGMENTS:
+            segments[i] = "{id}"
+    return "/" + "/".join(segments)
+
+
+def _report(instrumentation: Instrumentation, response: httpx.Response) -> None:
+    request = response.request
+    instrumentation.on_request(
+        request.method,
+        endpoint(request.url.path),
+        response.status_code,
+        response.elapsed.total_seconds(),
+        int(request.headers.get("Content-Length", 0)),
+        response.num_bytes_downloaded,
+    )
+
+
+def install_http_hooks(
+    client: httpx.Client | httpx.AsyncClient, instrumentation: Instrumentation
+) -> None:
+    """Report every response received by an httpx client to `instrumentation`.
+
+    The body is read in the hook so the latency covers the whole exchange.
+    """
+    if isinstance(client, httpx.AsyncClient):
+
+        async def on_response(response: httpx.Response) -> None:
+            await response.aread()
+            _report(instrumentation, response)
+
+    else:
+
+        def on_response(response: httpx.Response) -> None:
+            response.read()
+            _report(instrumentation, response)
+
+    client.event_hooks["response"].append(on_response)
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram over fixed upper bounds, as Prometheus exposes it."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            # One count per bucket, then the values above the last bucket.
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """`(le, count)` pairs, ending with `+Inf`."""
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        total = 0
+        pairs = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class Metrics(Instrumentation):
+    """
+    Aggregate client events into per endpoint histograms and counters.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.queue_wait: dict[str, Histogram] = {}
+        self.phases: dict[str, Histogram] = {}
+        self.requests: Counter[tuple[str, str, int]] = Counter()
+        self.request_bytes: Counter[tuple[str, str]] = Counter()
+        self.response_bytes: Counter[tuple[str, str]] = Counter()
+        self.rate_limited = 0
+        self.retries = 0
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(self.phases, phase).observe(seconds)
+
+    def on_queue_wait(self, priority: "Priority", seconds: float) -> None:
+        with self._lock:
+            self._histogram(self.queue_wait, priority.name.lower()).observe(seconds)
+
+    def on_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        key = (method, endpoint)
+        with self._lock:
+            self._histogram(self.latency, key).observe(seconds)
+            self.requests[(method, endpoint, status)] += 1
+            self.request_bytes[key] += request_bytes
+            self.response_bytes[key] += response_bytes
+
+    def on_rate_limited(self, retry_after: float | None) -> None:
+        with self._lock:
+            self.rate_limited += 1
+
+    def on_retry(self, attempt: int, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def to_prometheus(self, prefix: str = "notion") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            _histogram_lines(
+                lines,
+                f"{prefix}_request_duration_seconds",
+                "Latency of API requests, including the response body.",
+                ("method", "endpoint"),
+                self.latency,
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_requests_total",
+                "API requests by response status.",
+                ("method", "endpoint", "status"),
+                self.requests,
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_request_bytes_total",
+                "Bytes of request bodies sent.",
+                ("method", "endpoint"),
+                self.request_bytes,
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_response_bytes_total",
+                "Bytes of responses received.",
+                ("method", "endpoint"),
+                self.response_bytes,
+            )
+            _histogram_lines(
+                lines,
+                f"{prefix}_queue_wait_seconds",
+                "Time requests waited for the rate limiter.",
+                ("priority",),
+                {(priority,): h for priority, h in self.queue_wait.items()},
+            )
+            _histogram_lines(
+                lines,
+                f"{prefix}_phase_duration_seconds",
+                "Time spent building and encoding request bodies.",
+                ("phase",),
+                {(phase,): h for phase, h in self.phases.items()},
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_rate_limited_total",
+                "Responses with status 429.",
+                (),
+                {(): self.rate_limited},
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_retries_total",
+                "Requests retried after being rate limited.",
+                (),
+                {(): self.retries},
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | PathLike, prefix: str = "notion") -> None:
+        """Atomically write the metrics for the node exporter textfile collector."""
+        temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temporary, path)
+
+    def _histogram(self, histograms: dict, key) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counter_lines(
+    lines: list[str], name: str, help: str, labels: tuple[str, ...], counts: dict
+) -> None:
+    lines += [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+    for values, count in sorted(counts.items()):
+        lines.append(f"{name}{_labels(labels, values)} {count}")
+
+
+def _histogram_lines(
+    lines: list[str],
+    name: str,
+    help: str,
+    labels: tuple[str, ...],
+    histograms: dict[tuple, Histogram],
+) -> None:
+    lines += [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+    for values, histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative():
+            bucket_labels = _labels(labels, values, f'le="{bound}"')
+            lines.append(f"{name}_bucket{bucket_labels} {count}")
+        lines.append(f"{name}_sum{_labels(labels, values)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(labels, values)} {histogram.count}")
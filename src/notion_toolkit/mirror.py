@@ -0,0 +1,156 @@
+"""Local SQLite mirror of Notion databases."""
+
+import json
+import sqlite3
+import time
+from os import PathLike
+from typing import Any, Iterator
+
+from notion_toolkit.notion import Notion, NotionPageResponse
+
+
+class DatabaseMirror:
+    """
+    Mirror the pages of a Notion database into a local SQLite store.
+
+    Each `sync` only queries pages edited at or after the high-water mark of
+    the previous one, sorted by `last_edited_time`, and the mark is committed
+    together with every batch of pages, so an interrupted sync resumes where it
+    stopped. Notion rounds `last_edited_time` to the minute, which is why the
+    boundary is inclusive; re-fetched pages are simply overwritten.
+
+    Pages moved to the trash no longer show up in queries, so deletions are
+    only picked up by a `sync(full=True)`.
+
+    `synced_at` is the time the last `sync` of this instance completed, used
+    by `query.QueryEngine` to decide whether the mirror is fresh.
+    """
+
+    def __init__(
+        self,
+        notion: Notion,
+        database_id: str,
+        path: str | PathLike = ":memory:",
+        batch_size: int = 100,
+    ):
+        self.notion = notion
+        self.database_id = database_id
+        self.batch_size = batch_size
+        self.synced_at: float | None = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS pages (
+                id TEXT PRIMARY KEY,
+                database_id TEXT NOT NULL,
+                last_edited_time TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_database
+                ON pages (database_id, last_edited_time);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                database_id TEXT PRIMARY KEY,
+                high_water_mark TEXT NOT NULL
+            );
+            """)
+
+    @property
+    def high_water_mark(self) -> str | None:
+        """Latest `last_edited_time` mirrored so far."""
+        row = self._connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE database_id = ?",
+            (self.database_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, full: bool = False) -> int:
+        """Pull pages edited since the last sync and return how many were stored."""
+        mark = None if full else self.high_water_mark
+        pages = self.notion.iter_database(
+            self.database_id,
+            filter=(
+                {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": mark},
+                }
+                if mark
+                else None
+            ),
+            sorts=[{"timestamp": "last_edited_time", "direction": "ascending"}],
+            page_size=self.batch_size,
+        )
+
+        seen: set[str] | None = set() if full else None
+        batch: list[NotionPageResponse] = []
+        count = 0
+        for page in pages:
+            batch.append(page)
+            if seen is not None:
+                seen.add(page["id"])
+            if len(batch) >= self.batch_size:
+                count += self._store(batch)
+                batch = []
+        count += self._store(batch)
+
+        if seen is not None:
+            self._delete_missing(seen)
+        self.synced_at = time.time()
+        return count
+
+    def get(self, page_id: str) -> NotionPageResponse | None:
+        row = self._connection.execute(
+            "SELECT data FROM pages WHERE id = ?", (page_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def pages(self) -> Iterator[NotionPageResponse]:
+        """Iterate over the mirrored pages, most recently edited first."""
+        rows = self._connection.execute(
+            "SELECT data FROM pages WHERE database_id = ? "
+            "ORDER BY last_edited_time DESC",
+            (self.database_id,),
+        )
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM pages WHERE database_id = ?", (self.database_id,)
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _store(self, batch: list[NotionPageResponse]) -> int:
+        if not batch:
+            return 0
+        mark = max(page["last_edited_time"] for page in batch)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pages (id, database_id, last_edited_time, data) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        page["id"],
+                        self.database_id,
+                        page["last_edited_time"],
+                        json.dumps(page, separators=(",", ":")),
+                    )
+                    for page in batch
+                ),
+            )
+            self._connection.execute(
+                "INSERT INTO sync_state (database_id, high_water_mark) VALUES (?, ?) "
+                "ON CONFLICT (database_id) DO UPDATE SET high_water_mark = "
+                "MAX(high_water_mark, excluded.high_water_mark)",
+                (self.database_id, mark),
+            )
+        return len(batch)
+
+    def _delete_missing(self, seen: set[str]) -> None:
+        stored = self._connection.execute(
+            "SELECT id FROM pages WHERE database_id = ?", (self.database_id,)
+        ).fetchall()
+        missing = [(page_id,) for (page_id,) in stored if page_id not in seen]
+        with self._connection:
+            self._connection.executemany("DELETE FROM pages WHERE id = ?", missing)
@@ -1,89 +1,684 @@
+import asyncio
 import os
-from notion_client import Client
-from typing_extensions import Unpack
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping
 
-from notion_toolkit.schema.page import ProdCopilotSourceDatabasePageRequestBody
+import httpx
+from notion_client import AsyncClient, Client
+from notion_client.errors import RequestTimeoutError
 
+from notion_toolkit.bulk import BulkCreateResult, stream_bounded
+from notion_toolkit.cache import PageCache
+from notion_toolkit.index import UrlIndex
+from notion_toolkit.journal import ImportJournal
+from notion_toolkit.metrics import NOOP, Instrumentation, install_http_hooks
+from notion_toolkit.scheduler import Priority, RequestScheduler
+from notion_toolkit.schema.constants import MAX_ARRAY_LENGTH
+from notion_toolkit.singleflight import AsyncSingleFlight, SingleFlight
+from notion_toolkit.template import ProdCopilotSourcePropertiesTemplate
 
-class Notion:
+# pydantic and the models are imported where they are used, so that a client
+# which only sends precompiled payloads never imports them.
+if TYPE_CHECKING:
+    from notion_toolkit.registry import CompiledSchema, DatabaseSchemaRegistry
+    from notion_toolkit.schema.block import Block
 
-    def __init__(self, token: str | None = None):
+NotionPageResponse = dict[str, Any]
+
+NOTION_BASE_URL = "https://api.notion.com"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _parent_database(page: NotionPageResponse) -> str | None:
+    return page.get("parent", {}).get("database_id")
+
+
+class BaseNotion:
+    """Payload building shared by the sync and async Notion clients."""
+
+    icon = {"type": "emoji", "emoji": "🎥"}
+    properties_template = ProdCopilotSourcePropertiesTemplate()
+    cache: PageCache | None = None
+    schemas: "DatabaseSchemaRegistry | None" = None
+    instrumentation: Instrumentation = NOOP
+
+    def _create_page_kwargs(
+        self, database_id: str, schema: "CompiledSchema | None" = None, **kwargs
+    ) -> dict:
+        return {
+            "parent": {"database_id": database_id},
+            "properties": self._validated_properties(schema, **kwargs),
+            "icon": self.icon,
+        }
+
+    def _update_page_kwargs(
+        self, page_id: str, schema: "CompiledSchema | None" = None, **kwargs
+    ) -> dict:
+        return {
+            "page_id": page_id,
+            "properties": self._validated_properties(schema, **kwargs),
+        }
+
+    def _validated_properties(self, schema: "CompiledSchema | None", **kwargs) -> dict:
+        """Properties payload, checked against the database `schema` if given."""
+        start = time.perf_counter()
+        properties = self._create_properties(**kwargs)
+        if schema is not None:
+            schema.validate(properties)
+        self.instrumentation.on_phase("payload", time.perf_counter() - start)
+        return properties
+
+    def _create_properties(self, **kwargs) -> dict:
+        """Page properties payload, see `ProdCopilotSourcePropertiesTemplate.render`."""
+        return self.properties_template.render(**kwargs)
+
+    def _cached(self, page: NotionPageResponse) -> NotionPageResponse:
+        """Store a page returned by the API in the cache, if there is one."""
+        if self.cache is not None:
+            self.cache.put(page)
+        return page
+
+    def _encode(self, body: Any) -> bytes:
+        from notion_toolkit.schema.encode import dumps
+
+        start = time.perf_counter()
+        content = dumps(body)
+        self.instrumentation.on_phase("encode", time.perf_counter() - start)
+        return content
+
+    def _instrument(
+        self,
+        instrumentation: Instrumentation | None,
+        scheduler: RequestScheduler | None,
+    ) -> None:
+        """Report requests to `instrumentation`, NOOP by default.
+
+        A scheduler passed in reports queue waits and retries to its own
+        instrumentation, so shared schedulers are not rewired by each client.
+        """
+        self.instrumentation = instrumentation or NOOP
+        self.scheduler = scheduler or RequestScheduler(
+            instrumentation=self.instrumentation
+        )
+        if instrumentation is not None:
+            install_http_hooks(self._client.client, instrumentation)
+
+
+class Notion(BaseNotion):
+
+    def __init__(
+        self,
+        token: str | None = None,
+        scheduler: RequestScheduler | None = None,
+        cache: PageCache | None = None,
+        validate_properties: bool = False,
+        base_url: str = NOTION_BASE_URL,
+        instrumentation: Instrumentation | None = None,
+    ):
         self.token = token or os.environ.get("NOTION_TOKEN")
-        self._client = Client(auth=token)
+        self._client = Client(auth=self.token, base_url=base_url)
+        self._instrument(instrumentation, scheduler)
+        self.cache = cache
+        if validate_properties:
+            from notion_toolkit.registry import DatabaseSchemaRegistry
+
+            self.schemas = DatabaseSchemaRegistry(self.retrieve_database)
+        self._single_flight = SingleFlight()
+        self._url_indexes: dict[str, UrlIndex] = {}
+        self._url_indexes_lock = threading.Lock()
 
     @property
-    def client(self):
+    def client(self) -> Client:
         """Notion client."""
         return self._client
 
-    def create_page(
+    def create_page(self, database_id: str, **kwargs) -> NotionPageResponse:
+        """Create a page in the database."""
+        return self._cached(
+            self._request(
+                self.client.pages.create,
+                **self._create_page_kwargs(
+                    database_id, self._schema(database_id), **kwargs
+                ),
+            )
+        )
+
+    def retrieve_page(self, page_id: str) -> NotionPageResponse:
+        """Retrieve a page by its id, served from the cache when fresh."""
+        if self.cache is not None and (page := self.cache.get(page_id)) is not None:
+            return page
+        return self._cached(
+            self._read(("pages", page_id), self.client.pages.retrieve, page_id=page_id)
+        )
+
+    def retrieve_database(self, database_id: str) -> dict[str, Any]:
+        """Retrieve a database object, including its property schema."""
+        return self._read(
+            ("databases", database_id),
+            self.client.databases.retrieve,
+            database_id=database_id,
+        )
+
+    def list_block_children(
+        self, block_id: str, start_cursor: str | None = None, page_size: int = 100
+    ) -> dict[str, Any]:
+        """Retrieve one page of the children of a block."""
+        return self._read(
+            ("blocks.children", block_id, start_cursor, page_size),
+            self.client.blocks.children.list,
+            block_id=block_id,
+            page_size=page_size,
+            **({"start_cursor": start_cursor} if start_cursor else {}),
+        )
+
+    def update_page(self, page_id: str, **kwargs) -> NotionPageResponse:
+        """Update the properties of a page, see `_create_properties` for kwargs.
+
+        With `validate_properties`, the page is retrieved first to find the
+        database whose schema the properties are checked against.
+        """
+        schema = None
+        if self.schemas is not None:
+            schema = self._schema(_parent_database(self.retrieve_page(page_id)))
+        return self._cached(
+            self._request(
+                self.client.pages.update,
+                **self._update_page_kwargs(page_id, schema, **kwargs),
+            )
+        )
+
+    def _schema(self, database_id: str | None) -> "CompiledSchema | None":
+        """Schema of the database when properties are validated, else None."""
+        if self.schemas is None or database_id is None:
+            return None
+        return self.schemas.get(database_id)
+
+    def iter_database(
+        self,
+        database_id: str,
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        page_size: int = 100,
+    ) -> Iterator[NotionPageResponse]:
+        """Iterate over the pages of a database query, following `next_cursor`.
+
+        The next page of results is requested in the background while the
+        current one is consumed, so at most two pages are held in memory.
+        """
+        body: dict[str, Any] = {"page_size": page_size}
+        if filter is not None:
+            body["filter"] = filter
+        if sorts is not None:
+            body["sorts"] = sorts
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future: Future | None = executor.submit(
+            self._query_database, database_id, **body
+        )
+        try:
+            while future is not None:
+                response = future.result()
+                next_cursor = response.get("next_cursor")
+                future = (
+                    executor.submit(
+                        self._query_database,
+                        database_id,
+                        start_cursor=next_cursor,
+                        **body,
+                    )
+                    if response.get("has_more") and next_cursor
+                    else None
+                )
+                if self.cache is not None:
+                    for page in response["results"]:
+                        self.cache.observe(page)
+                yield from response["results"]
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def iter_block_tree(
+        self,
+        block_id: str,
+        max_depth: int | None = None,
+        max_in_flight: int = 4,
+        max_lookahead: int = 64,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Iterate over the descendants of a page or block as `(depth, block)`.
+
+        Blocks come in document order, depth first, with the direct children
+        at depth 0. Fetching runs breadth first ahead of the iteration: as soon
+        as the children of a block are listed, the children of every one of
+        them that has some are requested on up to `max_in_flight` threads, so
+        a tree costs about its depth in round trips rather than its node
+        count. At most `max_lookahead` child lists are fetched or buffered
+        ahead of the iteration; the rest wait until it catches up. Blocks
+        deeper than `max_depth` are not fetched.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        if max_lookahead < 1:
+            raise ValueError("max_lookahead must be at least 1.")
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        futures: dict[str, Future] = {}
+        # Blocks with children not requested yet, in the order they were seen.
+        deferred: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def schedule() -> None:
+            # Called with the lock held.
+            while deferred and len(futures) < max_lookahead:
+                parent_id = next(iter(deferred))
+                depth = deferred.pop(parent_id)
+                futures[parent_id] = executor.submit(fetch, parent_id, depth)
+
+        def fetch(parent_id: str, depth: int) -> list[dict[str, Any]]:
+            children = list(self._iter_block_children(parent_id))
+            if max_depth is None or depth < max_depth:
+                with lock:
+                    for child in children:
+                        if child.get("has_children"):
+                            deferred[child["id"]] = depth + 1
+                    schedule()
+            return children
+
+        def walk(parent_id: str, depth: int) -> Iterator[tuple[int, dict[str, Any]]]:
+            with lock:
+                future = futures.pop(parent_id, None)
+                if future is None:
+                    del deferred[parent_id]
+                schedule()
+            # A block the lookahead has not reached yet is fetched right here.
+            children = fetch(parent_id, depth) if future is None else future.result()
+            for child in children:
+                yield depth, child
+                with lock:
+                    pending = child["id"] in futures or child["id"] in deferred
+                if pending:
+                    yield from walk(child["id"], depth + 1)
+
+        deferred[block_id] = 0
+        try:
+            yield from walk(block_id, 0)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def url_index(self, database_id: str, property_name: str = "URL") -> UrlIndex:
+        """URL to page id index of the database, built by one query on first use."""
+        with self._url_indexes_lock:
+            if database_id not in self._url_indexes:
+                pages = self.iter_database(
+                    database_id,
+                    filter={"property": property_name, "url": {"is_not_empty": True}},
+                )
+                self._url_indexes[database_id] = UrlIndex.from_pages(
+                    pages, property_name
+                )
+            return self._url_indexes[database_id]
+
+    def upsert_page(self, database_id: str, **kwargs) -> NotionPageResponse:
+        """Update the page with the same `url` if one exists, else create it.
+
+        Existing URLs are looked up in the local `url_index` of the database,
+        which is updated with every page created here.
+        """
+        index = self.url_index(database_id)
+        with index.locked(kwargs.get("url")):
+            page_id = index.get(kwargs.get("url"))
+            if page_id is not None:
+                return self._cached(
+                    self._request(
+                        self.client.pages.update,
+                        **self._update_page_kwargs(
+                            page_id, self._schema(database_id), **kwargs
+                        ),
+                    )
+                )
+            response = self.create_page(database_id, **kwargs)
+            index.add_page(response)
+            return response
+
+    def bulk_create(
         self,
         database_id: str,
-    ) -> NotionPageResponse:
+        rows: Iterable[Mapping[str, Any]],
+        max_in_flight: int = 3,
+        journal: ImportJournal | None = None,
+        upsert: bool = False,
+    ) -> Iterator[BulkCreateResult]:
+        """Create a page per source row and yield each result as it completes.
 
-        request_body = self._create_page_request_body()
-        page_response = self.client.pages.create(
-            parent={"database_id": database_id},
-            properties=self._create_properties(**kwargs),
-            icon={"type": "emoji", "emoji": "🎥"},
+        Rows (title, tags, source_type, url, ...) are consumed lazily and their
+        payloads are only built when a request slot is free. Bulk requests are
+        sent at low priority so interactive calls sharing the scheduler go
+        first. A failed row is reported through `BulkCreateResult.error`
+        instead of aborting the run.
+
+        With a `journal`, every creation is recorded ahead of the request and
+        rows already completed by an earlier run are yielded as `resumed`
+        without any API call. With `upsert`, rows whose URL already exists in
+        the database update that page instead of creating a duplicate.
+        """
+        index = self.url_index(database_id) if upsert else None
+
+        def create(row: Mapping[str, Any]) -> NotionPageResponse:
+            if index is None:
+                return create_or_update(row)
+            # Rows with the same URL wait for each other, or both would miss.
+            with index.locked(row.get("url")):
+                return create_or_update(row)
+
+        def create_or_update(row: Mapping[str, Any]) -> NotionPageResponse:
+            page_id = index.get(row.get("url")) if index is not None else None
+            schema = self._schema(database_id)
+            if page_id is not None:
+                return self._request(
+                    self.client.pages.update,
+                    priority=Priority.LOW,
+                    **self._update_page_kwargs(page_id, schema, **row),
+                )
+            response = self._request(
+                self.client.pages.create,
+                priority=Priority.LOW,
+                **self._create_page_kwargs(database_id, schema, **row),
+            )
+            if index is not None:
+                index.add_page(response)
+            return response
+
+        if journal is None:
+            return stream_bounded(create, rows, max_in_flight)
+
+        def lookup(row: Mapping[str, Any]) -> NotionPageResponse | None:
+            page_id = journal.page_id(journal.key(database_id, row))
+            return None if page_id is None else {"object": "page", "id": page_id}
+
+        def journaled_create(row: Mapping[str, Any]) -> NotionPageResponse:
+            key = journal.key(database_id, row)
+            journal.begin(key)
+            try:
+                response = create(row)
+            except Exception:
+                journal.failed(key)
+                raise
+            journal.done(key, response["id"])
+            return response
+
+        return stream_bounded(journaled_create, rows, max_in_flight, lookup)
+
+    def append_blocks(
+        self,
+        block_id: str,
+        blocks: Iterable["Block | dict[str, Any]"],
+        max_in_flight: int = 3,
+    ) -> list[dict[str, Any]]:
+        """Append a tree of blocks to a page or block and return the top level.
+
+        Blocks are `Block` models or dicts in the API format, such as the output
+        of `markdown.markdown_to_blocks`, and are consumed lazily. Children are
+        sent 100 per request, in order. Nested children are appended as soon as
+        the request creating their parent returns its id, and the children of
+        different parents are uploaded concurrently on up to `max_in_flight`
+        threads, so a document costs one round trip per 100 children of each
+        parent and its depth bounds the sequential latency.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            root = executor.submit(self._append_children, block_id, blocks)
+            pending = {root}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for created, block in future.result():
+                            if block.children:
+                                pending.add(
+                                    executor.submit(
+                                        self._append_children,
+                                        created["id"],
+                                        block.children,
+                                    )
+                                )
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return [created for created, _ in root.result()]
+
+    def request_json(
+        self,
+        path: str,
+        body: Any,
+        method: str = "POST",
+        priority: Priority = Priority.NORMAL,
+    ) -> dict[str, Any]:
+        """Send a request body encoded once, straight to JSON bytes.
+
+        `body` may mix `schema` models with plain dicts; see `schema.encode.dumps`.
+        Use it for bodies built from models to skip `model_dump` and re-encoding.
+        """
+        return self._request(
+            self._send_json, path, method, self._encode(body), priority=priority
+        )
+
+    def _send_json(self, path: str, method: str, content: bytes) -> dict[str, Any]:
+        client = self.client.client
+        request = client.build_request(
+            method, path, content=content, headers=JSON_HEADERS
         )
+        try:
+            response = client.send(request)
+        except httpx.TimeoutException:
+            raise RequestTimeoutError()
+        return self.client._parse_response(response)
 
-        return page_response
+    def _append_children(
+        self, block_id: str, blocks: Iterable["Block | dict[str, Any]"]
+    ) -> list[tuple[dict[str, Any], "Block"]]:
+        """Append the direct children of one block, 100 per request."""
+        from notion_toolkit.schema.block import Block
 
-    def _create_page_request_body(
+        created = []
+        models = map(Block.model_validate, blocks)
+        while batch := list(islice(models, MAX_ARRAY_LENGTH)):
+            response = self.request_json(
+                f"blocks/{block_id}/children", {"children": batch}, method="PATCH"
+            )
+            created.extend(zip(response["results"], batch))
+        return created
+
+    def _iter_block_children(self, block_id: str) -> Iterator[dict[str, Any]]:
+        """Iterate over all the direct children of a block, page after page."""
+        start_cursor = None
+        while True:
+            response = self.list_block_children(block_id, start_cursor)
+            yield from response["results"]
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not start_cursor:
+                return
+
+    def _query_database(self, database_id: str, **kwargs) -> dict[str, Any]:
+        return self._request(
+            self.client.databases.query, database_id=database_id, **kwargs
+        )
+
+    def _read(self, key: tuple, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Send a read, sharing it with identical reads already in flight."""
+        return self._single_flight.do(key, self._request, func, **kwargs)
+
+    def _request(
         self,
-        title: str,
-    ) -> ProdCopilotSourceDatabasePageRequestBody:
-        return ProdCopilotSourceDatabasePageRequestBody()
+        func: Callable[..., Any],
+        *args: Any,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> Any:
+        """Send an API call through the rate limit scheduler."""
+        return self.scheduler.call(func, *args, priority=priority, **kwargs)
+
+
+class AsyncNotion(BaseNotion):
+    """Asyncio counterpart of `Notion` built on `notion_client.AsyncClient`."""
 
-    def _create_properties(
+    def __init__(
         self,
-        title: str,
-        text_link: str | None = None,
-        bold: bool = False,
-        italic: bool = False,
-        strikethrough: bool = False,
-        underline: bool = False,
-        code: bool = False,
-        color: str = "default",
-        href: str | None = None,
-        archived: bool = False,
-        source_type: ProdCopilotSourceType = ProdCopilotSourceType.WEBPAGE,
-        tags: list[str] | None = None,
-        url: str | None = None,
-    ) -> dict:
-        return {
-            "Name": {
-                "id": "title",
-                "type": "title",
-                "title": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": title,
-                            "link": text_link,
-                        },
-                        "annotations": {
-                            "bold": bold,
-                            "italic": italic,
-                            "strikethrough": strikethrough,
-                            "underline": underline,
-                            "code": code,
-                            "color": color,
-                        },
-                        "plain_text": title,
-                        "href": href,
-                    }
-                ],
-            },
-            "Archived": {"checkbox": archived},
-            "Tags": {
-                "type": "multi_select",
-                "multi_select": [{"name": tag} for tag in tags or {}],
-            },
-            "Source_Type": {
-                "type": "select",
-                "select": {"name": source_type},
-            },
-            "URL": {"url": url},
-        }
+        token: str | None = None,
+        scheduler: RequestScheduler | None = None,
+        cache: PageCache | None = None,
+        validate_properties: bool = False,
+        base_url: str = NOTION_BASE_URL,
+        instrumentation: Instrumentation | None = None,
+    ):
+        self.token = token or os.environ.get("NOTION_TOKEN")
+        self._client = AsyncClient(auth=self.token, base_url=base_url)
+        self._instrument(instrumentation, scheduler)
+        self.cache = cache
+        if validate_properties:
+            from notion_toolkit.registry import DatabaseSchemaRegistry
+
+            self.schemas = DatabaseSchemaRegistry(self.retrieve_database)
+        self._single_flight = AsyncSingleFlight()
+
+    @property
+    def client(self) -> AsyncClient:
+        """Notion async client."""
+        return self._client
+
+    async def create_page(self, database_id: str, **kwargs) -> NotionPageResponse:
+        """Create a page in the database."""
+        schema = await self._schema(database_id)
+        return self._cached(
+            await self._request(
+                self.client.pages.create,
+                **self._create_page_kwargs(database_id, schema, **kwargs),
+            )
+        )
+
+    async def retrieve_page(self, page_id: str) -> NotionPageResponse:
+        """Retrieve a page by its id, served from the cache when fresh."""
+        if self.cache is not None and (page := self.cache.get(page_id)) is not None:
+            return page
+        return self._cached(
+            await self._read(
+                ("pages", page_id), self.client.pages.retrieve, page_id=page_id
+            )
+        )
+
+    async def retrieve_database(self, database_id: str) -> dict[str, Any]:
+        """Retrieve a database object, including its property schema."""
+        return await self._read(
+            ("databases", database_id),
+            self.client.databases.retrieve,
+            database_id=database_id,
+        )
+
+    async def list_block_children(
+        self, block_id: str, start_cursor: str | None = None, page_size: int = 100
+    ) -> dict[str, Any]:
+        """Retrieve one page of the children of a block."""
+        return await self._read(
+            ("blocks.children", block_id, start_cursor, page_size),
+            self.client.blocks.children.list,
+            block_id=block_id,
+            page_size=page_size,
+            **({"start_cursor": start_cursor} if start_cursor else {}),
+        )
+
+    async def update_page(self, page_id: str, **kwargs) -> NotionPageResponse:
+        """Update the properties of a page, see `_create_properties` for kwargs.
+
+        With `validate_properties`, the page is retrieved first to find the
+        database whose schema the properties are checked against.
+        """
+        schema = None
+        if self.schemas is not None:
+            page = await self.retrieve_page(page_id)
+            schema = await self._schema(_parent_database(page))
+        return self._cached(
+            await self._request(
+                self.client.pages.update,
+                **self._update_page_kwargs(page_id, schema, **kwargs),
+            )
+        )
+
+    async def _schema(self, database_id: str | None) -> "CompiledSchema | None":
+        """Schema of the database when properties are validated, else None."""
+        if self.schemas is None or database_id is None:
+            return None
+        return await self.schemas.aget(database_id)
+
+    async def request_json(
+        self,
+        path: str,
+        body: Any,
+        method: str = "POST",
+        priority: Priority = Priority.NORMAL,
+    ) -> dict[str, Any]:
+        """Send a request body encoded once, straight to JSON bytes."""
+        return await self._request(
+            self._send_json, path, method, self._encode(body), priority=priority
+        )
+
+    async def _send_json(
+        self, path: str, method: str, content: bytes
+    ) -> dict[str, Any]:
+        client = self.client.client
+        request = client.build_request(
+            method, path, content=content, headers=JSON_HEADERS
+        )
+        try:
+            response = await client.send(request)
+        except httpx.TimeoutException:
+            raise RequestTimeoutError()
+        return self.client._parse_response(response)
+
+    async def _read(self, key: tuple, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Send a read, sharing it with identical reads already in flight."""
+        return await self._single_flight.do(key, self._request, func, **kwargs)
+
+    async def _request(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> Any:
+        """Send an API call through the rate limit scheduler."""
+        return await self.scheduler.acall(func, *args, priority=priority, **kwargs)
+
+    async def create_pages(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        max_in_flight: int = 3,
+    ) -> list[NotionPageResponse]:
+        """Create a page for every row, keeping at most `max_in_flight` requests open.
+
+        Each row holds the keyword arguments of `create_page`. Rows are pulled
+        from the iterable only when a request slot frees up, and the responses
+        are returned in input order.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        pending = enumerate(rows)
+        responses: dict[int, NotionPageResponse] = {}
+
+        async def worker() -> None:
+            for index, row in pending:
+                responses[index] = await self.create_page(**row)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max_in_flight)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+
+        return [responses[index] for index in range(len(responses))]
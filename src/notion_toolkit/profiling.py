@@ -0,0 +1,218 @@
+"""CPU and memory profiling of a toolkit run.
+
+`profiled` wraps a block in cProfile and `traced_memory` in tracemalloc; on
+exit both print a report where functions and allocation sites are split by
+area, so it is clear whether a slow run is spent in toolkit code, in pydantic
+validation or in HTTP:
+
+    with profiled(top=10):
+        notion.bulk_create(database_id, rows)
+
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Iterator, TextIO
+
+
+class Area(str, Enum):
+    """
+    Part of the stack a function or allocation site belongs to.
+    """
+
+    TOOLKIT = "toolkit"
+    PYDANTIC = "pydantic"
+    HTTP = "http"
+    OTHER = "other"
+
+
+_PACKAGES = {
+    "notion_toolkit": Area.TOOLKIT,
+    "pydantic": Area.PYDANTIC,
+    "pydantic_core": Area.PYDANTIC,
+    "notion_client": Area.HTTP,
+    "httpx": Area.HTTP,
+    "httpcore": Area.HTTP,
+    "h11": Area.HTTP,
+    "h2": Area.HTTP,
+    "anyio": Area.HTTP,
+    "certifi": Area.HTTP,
+}
+_STDLIB_HTTP_MODULES = {"ssl", "socket", "selectors", "select"}
+# Built-in functions have no file, only a name such as
+# "<method 'recv_into' of '_socket.socket' objects>".
+_BUILTIN_MARKERS = {
+    "pydantic_core": Area.PYDANTIC,
+    "_socket": Area.HTTP,
+    "_ssl": Area.HTTP,
+    "select.": Area.HTTP,
+}
+# From Python 3.12 cProfile is built on sys.monitoring: one profiler sees every
+# thread, and enabling a second one raises "Another profiling tool is already
+# active". Before it, a profiler only sees the thread that enabled it.
+PER_THREAD_PROFILERS = sys.version_info < (3, 12)
+
+
+def area_of(filename: str, function: str = "") -> Area:
+    """Area of a function from its source file, or its name for built-ins."""
+    if filename == "~":
+        for marker, area in _BUILTIN_MARKERS.items():
+            if marker in function:
+                return area
+        return Area.OTHER
+    path = PurePath(filename)
+    for part in reversed(path.parts[:-1]):
+        if part in _PACKAGES:
+            return _PACKAGES[part]
+        if part == "http" and "site-packages" not in path.parts:
+            return Area.HTTP
+    if path.stem in _STDLIB_HTTP_MODULES and "site-packages" not in path.parts:
+        return Area.HTTP
+    return Area.OTHER
+
+
+def _location(filename: str, line: int, function: str = "") -> str:
+    if filename == "~":
+        return function
+    parts = PurePath(filename).parts
+    # Trim the path down to the package it belongs to.
+    for i, part in enumerate(parts):
+        if part in _PACKAGES:
+            filename = "/".join(parts[i:])
+            break
+    return f"{filename}:{line}({function})" if function else f"{filename}:{line}"
+
+
+def print_profile(
+    stats: pstats.Stats, top: int = 10, file: TextIO | None = None
+) -> None:
+    """Print own time per area, then the `top` functions of each area."""
+    file = file or sys.stderr
+    entries = stats.stats  # type: ignore[attr-defined]
+    rows: dict[Area, list[tuple[float, float, int, str]]] = {area: [] for area in Area}
+    for (filename, line, function), (_, calls, own, cumulative, _) in entries.items():
+        rows[area_of(filename, function)].append(
+            (own, cumulative, calls, _location(filename, line, function))
+        )
+    total = sum(row[0] for area_rows in rows.values() for row in area_rows) or 1.0
+
+    print("\nCPU time by area (own time, summed over threads):", file=file)
+    for area, area_rows in rows.items():
+        own = sum(row[0] for row in area_rows)
+        print(f"  {area.value:<10} {own:9.3f}s {own / total:7.1%}", file=file)
+    for area, area_rows in rows.items():
+        if not area_rows:
+            continue
+        print(f"\nTop {area.value} functions:", file=file)
+        print(f"  {'own':>9} {'cumulative':>11} {'calls':>8}  function", file=file)
+        for own, cumulative, calls, location in sorted(area_rows, reverse=True)[:top]:
+            print(
+                f"  {own:8.3f}s {cumulative:10.3f}s {calls:8d}  {location}", file=file
+            )
+
+
+def print_memory(
+    snapshot: tracemalloc.Snapshot,
+    peak: int,
+    top: int = 10,
+    file: TextIO | None = None,
+) -> None:
+    """Print memory still allocated per area, then the `top` sites of each."""
+    file = file or sys.stderr
+    # Leave out the tracing and reporting itself.
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    rows: dict[Area, list[tuple[int, int, str]]] = {area: [] for area in Area}
+    for statistic in snapshot.statistics("lineno"):
+        frame = statistic.traceback[0]
+        rows[area_of(frame.filename)].append(
+            (
+                statistic.size,
+                statistic.count,
+                _location(frame.filename, frame.lineno),
+            )
+        )
+
+    print(f"\nPeak traced memory: {peak / 1024:.1f} KiB", file=file)
+    print("Memory still allocated by area:", file=file)
+    for area, area_rows in rows.items():
+        size = sum(row[0] for row in area_rows)
+        count = sum(row[1] for row in area_rows)
+        print(
+            f"  {area.value:<10} {size / 1024:10.1f} KiB {count:9d} blocks", file=file
+        )
+    for area, area_rows in rows.items():
+        if not area_rows:
+            continue
+        print(f"\nTop {area.value} allocation sites:", file=file)
+        for size, count, location in sorted(area_rows, reverse=True)[:top]:
+            print(f"  {size / 1024:10.1f} KiB {count:9d} blocks  {location}", file=file)
+
+
+@contextmanager
+def profiled(
+    top: int = 10, file: TextIO | None = None, output: str | None = None
+) -> Iterator[list[cProfile.Profile]]:
+    """Profile the block with cProfile and print a report on exit.
+
+    Threads started inside the block, such as the workers of `bulk_create`,
+    are profiled too: before Python 3.12 each gets its own profiler, which is
+    disabled and merged into the report on exit, while from 3.12 the one
+    profiler already covers every thread. `output` also saves the raw stats,
+    for `pstats` or snakeviz.
+    """
+    profilers = [cProfile.Profile()]
+    lock = threading.Lock()
+
+    def profile_thread(*_: Any) -> None:
+        profiler = cProfile.Profile()
+        with lock:
+            profilers.append(profiler)
+        profiler.enable()
+
+    if PER_THREAD_PROFILERS:
+        threading.setprofile(profile_thread)
+    profilers[0].enable()
+    try:
+        yield profilers
+    finally:
+        if PER_THREAD_PROFILERS:
+            threading.setprofile(None)  # type: ignore[arg-type]
+        # Disabling a worker profiler from this thread flushes the calls the
+        # worker has not returned from. A worker still running after the block
+        # keeps its hook until it ends, but what it does then is not reported.
+        profilers[0].disable()
+        with lock:
+            for profiler in profilers[1:]:
+                profiler.disable()
+            stats = pstats.Stats(*profilers)
+        if output is not None:
+            stats.dump_stats(output)
+        print_profile(stats, top, file)
+
+
+@contextmanager
+def traced_memory(top: int = 10, file: TextIO | None = None) -> Iterator[None]:
+    """Trace allocations of the block with tracemalloc and print a report on exit.
+
+    Allocations are attributed to the line that made them, so memory still
+    held at the end of the block shows up under the area that allocated it.
+    """
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print_memory(snapshot, peak, top, file)
@@ -0,0 +1,526 @@
+"""Filter and sort DSL over database properties.
+
+    from notion_toolkit.query import Property
+
+    status = Property("Status", "select")
+    tags = Property("Tags", "multi_select")
+    expression = (status == "Done") & tags.contains("python")
+
+Every expression compiles to the Notion filter JSON with `to_notion` and to a
+local predicate with `matches`, so the same query runs against the API or
+offline against a `DatabaseMirror` through `QueryEngine`.
+
+Official Notion API
+    - https://developers.notion.com/reference/post-database-query-filter
+    - https://developers.notion.com/reference/post-database-query-sort
+
+"""
+
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Iterable, Sequence
+
+from notion_toolkit.columnar import decode_property
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import Notion, NotionPageResponse
+from notion_toolkit.schema.page_properties import PagePropertyType
+
+
+class Operator(str, Enum):
+    """
+    Filter condition operators.
+    """
+
+    AFTER = "after"
+    BEFORE = "before"
+    CONTAINS = "contains"
+    DOES_NOT_CONTAIN = "does_not_contain"
+    DOES_NOT_EQUAL = "does_not_equal"
+    ENDS_WITH = "ends_with"
+    EQUALS = "equals"
+    GREATER_THAN = "greater_than"
+    GREATER_THAN_OR_EQUAL_TO = "greater_than_or_equal_to"
+    IS_EMPTY = "is_empty"
+    IS_NOT_EMPTY = "is_not_empty"
+    LESS_THAN = "less_than"
+    LESS_THAN_OR_EQUAL_TO = "less_than_or_equal_to"
+    ON_OR_AFTER = "on_or_after"
+    ON_OR_BEFORE = "on_or_before"
+    STARTS_WITH = "starts_with"
+
+
+_EMPTINESS = {Operator.IS_EMPTY, Operator.IS_NOT_EMPTY}
+_TEXT = _EMPTINESS | {
+    Operator.EQUALS,
+    Operator.DOES_NOT_EQUAL,
+    Operator.CONTAINS,
+    Operator.DOES_NOT_CONTAIN,
+    Operator.STARTS_WITH,
+    Operator.ENDS_WITH,
+}
+_NUMBER = _EMPTINESS | {
+    Operator.EQUALS,
+    Operator.DOES_NOT_EQUAL,
+    Operator.GREATER_THAN,
+    Operator.GREATER_THAN_OR_EQUAL_TO,
+    Operator.LESS_THAN,
+    Operator.LESS_THAN_OR_EQUAL_TO,
+}
+_OPTION = _EMPTINESS | {Operator.EQUALS, Operator.DOES_NOT_EQUAL}
+_LIST = _EMPTINESS | {Operator.CONTAINS, Operator.DOES_NOT_CONTAIN}
+_DATE = _EMPTINESS | {
+    Operator.EQUALS,
+    Operator.BEFORE,
+    Operator.AFTER,
+    Operator.ON_OR_BEFORE,
+    Operator.ON_OR_AFTER,
+}
+
+OPERATORS: dict[PagePropertyType, set[Operator]] = {
+    PagePropertyType.CHECKBOX: {Operator.EQUALS, Operator.DOES_NOT_EQUAL},
+    PagePropertyType.CREATED_TIME: _DATE,
+    PagePropertyType.DATE: _DATE,
+    PagePropertyType.EMAIL: _TEXT,
+    PagePropertyType.LAST_EDITED_TIME: _DATE,
+    PagePropertyType.MULTI_SELECT: _LIST,
+    PagePropertyType.NUMBER: _NUMBER,
+    PagePropertyType.PEOPLE: _LIST,
+    PagePropertyType.PHONE_NUMBER: _TEXT,
+    PagePropertyType.RELATION: _LIST,
+    PagePropertyType.RICH_TEXT: _TEXT,
+    PagePropertyType.SELECT: _OPTION,
+    PagePropertyType.STATUS: _OPTION,
+    PagePropertyType.TITLE: _TEXT,
+    PagePropertyType.URL: _TEXT,
+}
+
+_CASELESS = {
+    Operator.CONTAINS,
+    Operator.DOES_NOT_CONTAIN,
+    Operator.STARTS_WITH,
+    Operator.ENDS_WITH,
+}
+_DATE_TYPES = {
+    PagePropertyType.CREATED_TIME,
+    PagePropertyType.DATE,
+    PagePropertyType.LAST_EDITED_TIME,
+}
+# Comparison operators of numbers and dates, as used by `<`, `<=`, `>`, `>=`.
+_ORDERING = {
+    Operator.GREATER_THAN: Operator.AFTER,
+    Operator.GREATER_THAN_OR_EQUAL_TO: Operator.ON_OR_AFTER,
+    Operator.LESS_THAN: Operator.BEFORE,
+    Operator.LESS_THAN_OR_EQUAL_TO: Operator.ON_OR_BEFORE,
+}
+# Sorts after every ISO 8601 string starting with the same date.
+_END_OF_DAY = "\uffff"
+
+
+class Filter(ABC):
+    """
+    Base class of filter expressions; combine them with `&` and `|`.
+    """
+
+    @abstractmethod
+    def to_notion(self) -> dict[str, Any]:
+        """The filter object of a Notion database query."""
+
+    @abstractmethod
+    def matches(self, page: NotionPageResponse) -> bool:
+        """Whether a raw page satisfies the filter."""
+
+    def __and__(self, other: "Filter") -> "And":
+        return And(*(self.filters if isinstance(self, And) else (self,)), other)
+
+    def __or__(self, other: "Filter") -> "Or":
+        return Or(*(self.filters if isinstance(self, Or) else (self,)), other)
+
+
+class And(Filter):
+    """
+    Pages matching every filter.
+    """
+
+    def __init__(self, *filters: Filter):
+        self.filters = filters
+
+    def to_notion(self) -> dict[str, Any]:
+        return {"and": [filter.to_notion() for filter in self.filters]}
+
+    def matches(self, page: NotionPageResponse) -> bool:
+        return all(filter.matches(page) for filter in self.filters)
+
+
+class Or(Filter):
+    """
+    Pages matching at least one filter.
+    """
+
+    def __init__(self, *filters: Filter):
+        self.filters = filters
+
+    def to_notion(self) -> dict[str, Any]:
+        return {"or": [filter.to_notion() for filter in self.filters]}
+
+    def matches(self, page: NotionPageResponse) -> bool:
+        return any(filter.matches(page) for filter in self.filters)
+
+
+class Condition(Filter):
+    """
+    One operator applied to one property.
+
+    Local evaluation follows the API: text `contains`, `starts_with` and
+    `ends_with` ignore case, and a date-only value compares calendar dates.
+    """
+
+    def __init__(self, property: "Property", operator: Operator, value: Any = True):
+        self.property = property
+        self.operator = operator
+        self.value = value
+
+    def to_notion(self) -> dict[str, Any]:
+        return {
+            **self.property.reference(),
+            self.property.type.value: {self.operator.value: self.value},
+        }
+
+    def matches(self, page: NotionPageResponse) -> bool:
+        actual = self.property.value(page)
+        operator, expected = self.operator, self.value
+        empty = actual is None or actual == "" or actual == []
+        if operator in _EMPTINESS:
+            return empty is (operator is Operator.IS_EMPTY)
+        if empty:
+            return operator in (Operator.DOES_NOT_EQUAL, Operator.DOES_NOT_CONTAIN)
+        if self.property.type in _DATE_TYPES:
+            actual, expected = _comparable_dates(actual, expected)
+        elif isinstance(actual, str) and operator in _CASELESS:
+            actual, expected = actual.lower(), str(expected).lower()
+        match operator:
+            case Operator.EQUALS:
+                return actual == expected
+            case Operator.DOES_NOT_EQUAL:
+                return actual != expected
+            case Operator.CONTAINS:
+                return expected in actual
+            case Operator.DOES_NOT_CONTAIN:
+                return expected not in actual
+            case Operator.STARTS_WITH:
+                return actual.startswith(expected)
+            case Operator.ENDS_WITH:
+                return actual.endswith(expected)
+            case Operator.GREATER_THAN | Operator.AFTER:
+                return actual > expected
+            case Operator.GREATER_THAN_OR_EQUAL_TO | Operator.ON_OR_AFTER:
+                return actual >= expected
+            case Operator.LESS_THAN | Operator.BEFORE:
+                return actual < expected
+            case Operator.LESS_THAN_OR_EQUAL_TO | Operator.ON_OR_BEFORE:
+                return actual <= expected
+        return False
+
+    def __repr__(self) -> str:
+        return f"Condition({self.to_notion()!r})"
+
+
+def _comparable_dates(actual: str, expected: str) -> tuple[Any, Any]:
+    if len(expected) == 10 or len(actual) == 10:
+        return actual[:10], expected[:10]
+    actual_time, expected_time = (
+        datetime.fromisoformat(actual),
+        datetime.fromisoformat(expected),
+    )
+    if (actual_time.tzinfo is None) != (expected_time.tzinfo is None):
+        actual_time, expected_time = (
+            value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+            for value in (actual_time, expected_time)
+        )
+    return actual_time, expected_time
+
+
+class Sort:
+    """
+    Sort by a property or timestamp, in ascending or descending order.
+    """
+
+    def __init__(self, property: "Property", descending: bool = False):
+        self.property = property
+        self.descending = descending
+
+    def to_notion(self) -> dict[str, Any]:
+        direction = "descending" if self.descending else "ascending"
+        return {**self.property.reference(), "direction": direction}
+
+
+class Property:
+    """
+    Reference to a database property, building conditions and sorts.
+
+    The comparison operators build conditions rather than comparing
+    properties, e.g. `Property("Score", "number") >= 3`.
+    """
+
+    def __init__(self, name: str, type: PagePropertyType | str):
+        self.name = name
+        self.type = PagePropertyType(type)
+        if self.type not in OPERATORS:
+            raise ValueError(f"Filtering on {self.type.value} is not supported.")
+
+    __hash__ = object.__hash__
+
+    def reference(self) -> dict[str, Any]:
+        return {"property": self.name}
+
+    def value(self, page: NotionPageResponse) -> Any:
+        """The property value of a raw page, flattened like in `columnar`."""
+        return decode_property(page["properties"].get(self.name))
+
+    def condition(self, operator: Operator | str, value: Any = True) -> Condition:
+        operator = Operator(operator)
+        if operator in _ORDERING and self.type in _DATE_TYPES:
+            operator = _ORDERING[operator]
+        if operator not in OPERATORS[self.type]:
+            raise ValueError(
+                f"{operator.value} is not a filter of {self.type.value} properties."
+            )
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        return Condition(self, operator, value)
+
+    def __eq__(self, value: Any) -> Condition:  # type: ignore[override]
+        return self.condition(Operator.EQUALS, value)
+
+    def __ne__(self, value: Any) -> Condition:  # type: ignore[override]
+        return self.condition(Operator.DOES_NOT_EQUAL, value)
+
+    def __gt__(self, value: Any) -> Condition:
+        return self.condition(Operator.GREATER_THAN, value)
+
+    def __ge__(self, value: Any) -> Condition:
+        return self.condition(Operator.GREATER_THAN_OR_EQUAL_TO, value)
+
+    def __lt__(self, value: Any) -> Condition:
+        return self.condition(Operator.LESS_THAN, value)
+
+    def __le__(self, value: Any) -> Condition:
+        return self.condition(Operator.LESS_THAN_OR_EQUAL_TO, value)
+
+    def contains(self, value: Any) -> Condition:
+        return self.condition(Operator.CONTAINS, value)
+
+    def does_not_contain(self, value: Any) -> Condition:
+        return self.condition(Operator.DOES_NOT_CONTAIN, value)
+
+    def starts_with(self, value: str) -> Condition:
+        return self.condition(Operator.STARTS_WITH, value)
+
+    def ends_with(self, value: str) -> Condition:
+        return self.condition(Operator.ENDS_WITH, value)
+
+    def is_empty(self) -> Condition:
+        return self.condition(Operator.IS_EMPTY)
+
+    def is_not_empty(self) -> Condition:
+        return self.condition(Operator.IS_NOT_EMPTY)
+
+    def asc(self) -> Sort:
+        return Sort(self)
+
+    def desc(self) -> Sort:
+        return Sort(self, descending=True)
+
+
+class Timestamp(Property):
+    """
+    Reference to the `created_time` or `last_edited_time` of pages.
+    """
+
+    def __init__(self, type: PagePropertyType | str):
+        super().__init__(PagePropertyType(type).value, type)
+        if self.type not in (
+            PagePropertyType.CREATED_TIME,
+            PagePropertyType.LAST_EDITED_TIME,
+        ):
+            raise ValueError(f"{self.type.value} is not a page timestamp.")
+
+    def reference(self) -> dict[str, Any]:
+        return {"timestamp": self.name}
+
+    def value(self, page: NotionPageResponse) -> Any:
+        return page.get(self.name)
+
+
+def parse_filter(data: dict[str, Any]) -> Filter:
+    """Build a filter from Notion filter JSON, the inverse of `to_notion`."""
+    if "and" in data:
+        return And(*map(parse_filter, data["and"]))
+    if "or" in data:
+        return Or(*map(parse_filter, data["or"]))
+    if "timestamp" in data:
+        kind = data["timestamp"]
+        property: Property = Timestamp(kind)
+    else:
+        kind = next(key for key in data if key not in ("property", "type"))
+        property = Property(data["property"], kind)
+    ((operator, value),) = data[kind].items()
+    return property.condition(operator, value)
+
+
+_HASHED = {
+    PagePropertyType.CHECKBOX: Operator.EQUALS,
+    PagePropertyType.MULTI_SELECT: Operator.CONTAINS,
+    PagePropertyType.SELECT: Operator.EQUALS,
+    PagePropertyType.STATUS: Operator.EQUALS,
+}
+
+
+class LocalIndex:
+    """
+    Pages held in memory with indexes for offline queries.
+
+    Select, status, multi-select and checkbox properties get a hash index of
+    value to page ids, and date properties a sorted index of start dates, so
+    conditions on them select their candidates without a scan. Every other
+    condition, and every candidate, is checked with the local predicate.
+    """
+
+    def __init__(self, pages: Iterable[NotionPageResponse]):
+        self.pages: dict[str, NotionPageResponse] = {}
+        self._order: dict[str, int] = {}
+        self._hashed: dict[str, dict[Any, set[str]]] = {}
+        self._dates: dict[str, tuple[list[str], list[str]]] = {}
+        dates: dict[str, list[tuple[str, str]]] = {}
+        for page in pages:
+            page_id = page["id"]
+            self._order[page_id] = len(self.pages)
+            self.pages[page_id] = page
+            for name, value in page.get("properties", {}).items():
+                kind = value.get("type")
+                if kind == PagePropertyType.DATE:
+                    if start := decode_property(value):
+                        dates.setdefault(name, []).append((start, page_id))
+                elif kind in _HASHED:
+                    decoded = decode_property(value)
+                    index = self._hashed.setdefault(name, {})
+                    for key in decoded if isinstance(decoded, list) else [decoded]:
+                        index.setdefault(key, set()).add(page_id)
+        for name, entries in dates.items():
+            entries.sort()
+            self._dates[name] = (
+                [start for start, _ in entries],
+                [i for _, i in entries],
+            )
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def query(
+        self, filter: Filter | None = None, sorts: Sequence[Sort] = ()
+    ) -> list[NotionPageResponse]:
+        """Pages matching `filter`, in `sorts` order or mirror order."""
+        candidates = self.candidates(filter) if filter is not None else None
+        if candidates is None:
+            pages = list(self.pages.values())
+        else:
+            pages = [self.pages[i] for i in sorted(candidates, key=self._order.get)]
+        if filter is not None:
+            pages = [page for page in pages if filter.matches(page)]
+        for sort in reversed(sorts):
+            pages.sort(key=lambda page: _sort_key(sort, page), reverse=sort.descending)
+        return pages
+
+    def candidates(self, filter: Filter) -> set[str] | None:
+        """Superset of the ids of the pages matching `filter`, or None to scan."""
+        if isinstance(filter, And):
+            sets = [s for s in map(self.candidates, filter.filters) if s is not None]
+            return set.intersection(*sets) if sets else None
+        if isinstance(filter, Or):
+            sets = list(map(self.candidates, filter.filters))
+            return None if None in sets else set().union(*sets)
+        if not isinstance(filter, Condition) or isinstance(filter.property, Timestamp):
+            return None
+        name, kind, value = filter.property.name, filter.property.type, filter.value
+        if _HASHED.get(kind) is filter.operator:
+            return set(self._hashed.get(name, {}).get(value, ()))
+        if kind is PagePropertyType.DATE and len(str(value)) == 10:
+            return self._date_range(name, filter.operator, value)
+        return None
+
+    def _date_range(self, name: str, operator: Operator, day: str) -> set[str] | None:
+        starts, ids = self._dates.get(name, ([], []))
+        first, after = bisect_left(starts, day), bisect_left(starts, day + _END_OF_DAY)
+        match operator:
+            case Operator.EQUALS:
+                return set(ids[first:after])
+            case Operator.BEFORE:
+                return set(ids[:first])
+            case Operator.ON_OR_BEFORE:
+                return set(ids[:after])
+            case Operator.AFTER:
+                return set(ids[after:])
+            case Operator.ON_OR_AFTER:
+                return set(ids[first:])
+        return None
+
+
+def _sort_key(sort: Sort, page: NotionPageResponse) -> tuple[bool, Any]:
+    value = sort.property.value(page)
+    # Empty values come last in either direction, as in the API.
+    # They are not compared to each other, since None, "" and [] do not order.
+    if value is None or value == [] or value == "":
+        return (False, 0) if sort.descending else (True, 0)
+    return (True, value) if sort.descending else (False, value)
+
+
+class QueryEngine:
+    """
+    Run queries offline against a mirror, or through the API when it is stale.
+
+    The mirror is fresh for `max_age` seconds after its last `sync`; its pages
+    are loaded into a `LocalIndex` once per sync. Without a fresh mirror, the
+    filter and sorts are compiled to JSON and sent as a database query.
+    """
+
+    def __init__(
+        self,
+        notion: Notion,
+        database_id: str,
+        mirror: DatabaseMirror | None = None,
+        max_age: float = 300.0,
+    ):
+        self.notion = notion
+        self.database_id = database_id
+        self.mirror = mirror
+        self.max_age = max_age
+        self._index: LocalIndex | None = None
+        self._indexed_at: float | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        synced_at = self.mirror.synced_at if self.mirror is not None else None
+        return synced_at is not None and time.time() - synced_at <= self.max_age
+
+    def query(
+        self, filter: Filter | None = None, sorts: Sort | Sequence[Sort] = ()
+    ) -> list[NotionPageResponse]:
+        sorts = [sorts] if isinstance(sorts, Sort) else list(sorts)
+        if self.is_fresh:
+            return self.local_index().query(filter, sorts)
+        return list(
+            self.notion.iter_database(
+                self.database_id,
+                filter=filter.to_notion() if filter is not None else None,
+                sorts=[sort.to_notion() for sort in sorts] or None,
+            )
+        )
+
+    def local_index(self) -> LocalIndex:
+        """Index of the mirrored pages, rebuilt after every sync."""
+        if self._index is None or self._indexed_at != self.mirror.synced_at:
+            self._indexed_at = self.mirror.synced_at
+            self._index = LocalIndex(self.mirror.pages())
+        return self._index
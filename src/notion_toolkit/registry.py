@@ -0,0 +1,242 @@
+"""Database schema registry and compiled property validators."""
+
+import threading
+import time
+from typing import Any, Callable
+
+from notion_toolkit.schema.constants import MAX_ARRAY_LENGTH, MAX_TEXT_LENGTH
+from notion_toolkit.schema.page_properties import PagePropertyType
+
+Validator = Callable[[str, dict[str, Any]], list[str]]
+
+READ_ONLY_TYPES = {
+    PagePropertyType.CREATED_BY,
+    PagePropertyType.CREATED_TIME,
+    PagePropertyType.FORMULA,
+    PagePropertyType.LAST_EDITED_BY,
+    PagePropertyType.LAST_EDITED_TIME,
+    PagePropertyType.ROLLUP,
+    PagePropertyType.UNIQUE_ID,
+}
+
+
+class PropertyValidationError(ValueError):
+    """Raised when a page properties payload does not match the database schema."""
+
+    def __init__(self, database_id: str, errors: list[str]):
+        self.database_id = database_id
+        self.errors = errors
+        super().__init__(
+            f"Invalid properties for database {database_id}: " + "; ".join(errors)
+        )
+
+
+def _check_rich_text(name: str, spans: Any) -> list[str]:
+    if not isinstance(spans, list):
+        return [f"{name}: expected a list of rich text objects"]
+    errors = []
+    if len(spans) > MAX_ARRAY_LENGTH:
+        errors.append(f"{name}: more than {MAX_ARRAY_LENGTH} rich text objects")
+    for span in spans:
+        if not isinstance(span, dict):
+            errors.append(f"{name}: rich text objects must be dicts")
+            continue
+        text = span.get("text")
+        if text is None:
+            continue
+        if not isinstance(text, dict) or not isinstance(text.get("content", ""), str):
+            errors.append(f"{name}: text must be {{'content': str}}")
+        elif len(text.get("content", "")) > MAX_TEXT_LENGTH:
+            errors.append(f"{name}: text content longer than {MAX_TEXT_LENGTH}")
+    return errors
+
+
+def _check_type(*kinds: type, nullable: bool = True) -> Validator:
+    expected = " or ".join(kind.__name__ for kind in kinds)
+
+    def check(name: str, value: Any) -> list[str]:
+        if value is None and nullable:
+            return []
+        # bool is an int subclass, but True is not a valid number.
+        if not isinstance(value, kinds) or (
+            isinstance(value, bool) and bool not in kinds
+        ):
+            return [f"{name}: expected {expected}, got {type(value).__name__}"]
+        return []
+
+    return check
+
+
+def _check_options(options: set[str], multiple: bool, strict: bool) -> Validator:
+    def check(name: str, value: Any) -> list[str]:
+        if value is None:
+            return []
+        values = value if multiple else [value]
+        if not isinstance(values, list):
+            return [f"{name}: expected a list of options"]
+        errors = []
+        for option in values:
+            if not isinstance(option, dict) or "name" not in option:
+                errors.append(f"{name}: options must be given as {{'name': ...}}")
+            elif strict and option["name"] not in options:
+                errors.append(f"{name}: unknown option {option['name']!r}")
+        return errors
+
+    return check
+
+
+def _check_url(name: str, value: Any) -> list[str]:
+    if errors := _check_type(str)(name, value):
+        return errors
+    if value is not None and len(value) > MAX_TEXT_LENGTH:
+        return [f"{name}: URL longer than {MAX_TEXT_LENGTH}"]
+    return []
+
+
+def _check_date(name: str, value: Any) -> list[str]:
+    if value is not None and not (isinstance(value, dict) and "start" in value):
+        return [f"{name}: expected a date object with a start"]
+    return []
+
+
+class CompiledSchema:
+    """
+    Validator compiled from the property definitions of one database.
+
+    Each property gets a closure checking its value locally, so invalid
+    payloads are rejected before they spend a round trip or a rate limit token.
+    Select and multi-select options are checked against the known options
+    unless `allow_new_options` is set; Notion would create them on the fly.
+    """
+
+    def __init__(self, database: dict[str, Any], allow_new_options: bool = False):
+        self.database_id = database["id"]
+        self.types: dict[str, PagePropertyType] = {}
+        self._validators: dict[str, Validator] = {}
+        for name, definition in database["properties"].items():
+            try:
+                kind = PagePropertyType(definition["type"])
+            except ValueError:
+                # Property types unknown to this toolkit are passed through.
+                continue
+            self.types[name] = kind
+            self._validators[name] = self._compile(
+                kind, definition.get(definition["type"]) or {}, allow_new_options
+            )
+
+    @staticmethod
+    def _compile(
+        kind: PagePropertyType, config: dict[str, Any], allow_new_options: bool
+    ) -> Validator:
+        if kind in READ_ONLY_TYPES:
+            return lambda name, value: [f"{name}: {kind.value} is read-only"]
+        options = {option["name"] for option in config.get("options", [])}
+        match kind:
+            case PagePropertyType.TITLE | PagePropertyType.RICH_TEXT:
+                return _check_rich_text
+            case PagePropertyType.CHECKBOX:
+                return _check_type(bool, nullable=False)
+            case PagePropertyType.NUMBER:
+                return _check_type(int, float)
+            case PagePropertyType.URL:
+                return _check_url
+            case PagePropertyType.EMAIL | PagePropertyType.PHONE_NUMBER:
+                return _check_type(str)
+            case PagePropertyType.DATE:
+                return _check_date
+            case PagePropertyType.SELECT:
+                return _check_options(options, False, not allow_new_options)
+            case PagePropertyType.MULTI_SELECT:
+                return _check_options(options, True, not allow_new_options)
+            case PagePropertyType.STATUS:
+                return _check_options(options, False, True)
+            case (
+                PagePropertyType.PEOPLE
+                | PagePropertyType.RELATION
+                | PagePropertyType.FILES
+            ):
+                return _check_type(list, nullable=False)
+            case _:
+                return lambda name, value: []
+
+    def errors(self, properties: dict[str, Any]) -> list[str]:
+        """Every problem found in a page properties payload."""
+        errors = []
+        for name, value in properties.items():
+            kind = self.types.get(name)
+            if kind is None:
+                errors.append(f"{name}: unknown property")
+                continue
+            if not isinstance(value, dict):
+                errors.append(f"{name}: expected a property value object")
+                continue
+            declared = value.get("type")
+            if declared is not None and declared != kind.value:
+                errors.append(f"{name}: expected {kind.value}, got {declared}")
+                continue
+            if kind.value not in value:
+                errors.append(f"{name}: missing {kind.value!r} value")
+                continue
+            errors.extend(self._validators[name](name, value[kind.value]))
+        return errors
+
+    def validate(self, properties: dict[str, Any]) -> None:
+        if errors := self.errors(properties):
+            raise PropertyValidationError(self.database_id, errors)
+
+
+class DatabaseSchemaRegistry:
+    """
+    TTL cache of compiled database schemas.
+
+    `fetch` is called with a database id and returns the database object, for
+    example `Notion.retrieve_database`; `aget` awaits it instead, for
+    `AsyncNotion.retrieve_database`. Each database is fetched once per `ttl`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        ttl: float = 600.0,
+        allow_new_options: bool = False,
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.allow_new_options = allow_new_options
+        self._schemas: dict[str, tuple[float, CompiledSchema]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, database_id: str) -> CompiledSchema:
+        if (schema := self._cached(database_id)) is not None:
+            return schema
+        return self._store(database_id, self.fetch(database_id))
+
+    async def aget(self, database_id: str) -> CompiledSchema:
+        """`get` for a coroutine `fetch`, such as `AsyncNotion.retrieve_database`."""
+        if (schema := self._cached(database_id)) is not None:
+            return schema
+        return self._store(database_id, await self.fetch(database_id))
+
+    def validate(self, database_id: str, properties: dict[str, Any]) -> None:
+        self.get(database_id).validate(properties)
+
+    def invalidate(self, database_id: str | None = None) -> None:
+        with self._lock:
+            if database_id is None:
+                self._schemas.clear()
+            else:
+                self._schemas.pop(database_id, None)
+
+    def _cached(self, database_id: str) -> CompiledSchema | None:
+        with self._lock:
+            cached = self._schemas.get(database_id)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        return None
+
+    def _store(self, database_id: str, database: dict[str, Any]) -> CompiledSchema:
+        schema = CompiledSchema(database, self.allow_new_options)
+        with self._lock:
+            self._schemas[database_id] = (time.monotonic(), schema)
+        return schema
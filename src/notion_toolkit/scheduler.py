@@ -0,0 +1,236 @@
+"""Rate limit aware request scheduler.
+
+Notion allows an average of three requests per second per integration and
+answers bursts above that with HTTP 429 and a `Retry-After` header.
+
+Official Notion API
+    - https://developers.notion.com/reference/request-limits
+
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, TypeVar
+
+from notion_client.errors import HTTPResponseError
+
+from notion_toolkit.metrics import NOOP, Instrumentation
+
+T = TypeVar("T")
+
+RATE_LIMITED_STATUS = 429
+
+
+class Priority(IntEnum):
+    """
+    Priority of a scheduled request, lower values are sent first.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request is still rate limited after all retries."""
+
+
+class TokenBucket:
+    """
+    Token bucket whose refill rate adapts to observed rate limiting.
+
+    The rate is cut multiplicatively on every 429 and grows back additively on
+    every success (AIMD), so throughput settles just under the real limit.
+    """
+
+    def __init__(
+        self,
+        rate: float = 3.0,
+        burst: float = 3.0,
+        min_rate: float = 0.25,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+    ):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.tokens = burst
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token can be taken, 0 when one is available."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_rate_limited(self, now: float, retry_after: float | None) -> None:
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.tokens = 0.0
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RequestScheduler:
+    """
+    Schedule Notion API calls through a shared token bucket and priority queue.
+
+    The same scheduler can serve sync and async callers, and several clients
+    using the same integration token should share one instance.
+    """
+
+    def __init__(
+        self,
+        rate: float = 3.0,
+        burst: float = 3.0,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        bucket: TokenBucket | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
+        self.bucket = bucket or TokenBucket(rate=rate, burst=burst)
+        self.instrumentation = instrumentation or NOOP
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limited_count = 0
+        self._lock = threading.Lock()
+        self._queue: list[tuple[int, int]] = []
+        self._abandoned: set[tuple[int, int]] = set()
+        self._counter = itertools.count()
+
+    @property
+    def rate(self) -> float:
+        """Current adaptive request rate in requests per second."""
+        return self.bucket.rate
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> T:
+        """Call `func` once a token is granted, retrying on rate limiting."""
+        for attempt in itertools.count():
+            ticket = self._enqueue(priority)
+            queued = time.monotonic()
+            try:
+                while (wait := self._acquire(ticket)) > 0:
+                    time.sleep(wait)
+            except BaseException:
+                self._abandon(ticket)
+                raise
+            self.instrumentation.on_queue_wait(priority, time.monotonic() - queued)
+            try:
+                result = func(*args, **kwargs)
+            except HTTPResponseError as error:
+                time.sleep(self._on_error(error, attempt))
+                continue
+            self._on_success()
+            return result
+
+    async def acall(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> T:
+        """Async counterpart of `call`."""
+        for attempt in itertools.count():
+            ticket = self._enqueue(priority)
+            queued = time.monotonic()
+            try:
+                while (wait := self._acquire(ticket)) > 0:
+                    await asyncio.sleep(wait)
+            except BaseException:
+                self._abandon(ticket)
+                raise
+            self.instrumentation.on_queue_wait(priority, time.monotonic() - queued)
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPResponseError as error:
+                await asyncio.sleep(self._on_error(error, attempt))
+                continue
+            self._on_success()
+            return result
+
+    def _enqueue(self, priority: Priority) -> tuple[int, int]:
+        ticket = (int(priority), next(self._counter))
+        with self._lock:
+            heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _abandon(self, ticket: tuple[int, int]) -> None:
+        with self._lock:
+            self._abandoned.add(ticket)
+
+    def _acquire(self, ticket: tuple[int, int]) -> float:
+        """Take a token for `ticket` or return how long to wait before retrying."""
+        with self._lock:
+            while self._queue and self._queue[0] in self._abandoned:
+                self._abandoned.discard(heapq.heappop(self._queue))
+            now = time.monotonic()
+            self.bucket.refill(now)
+            delay = self.bucket.delay(now)
+            if self._queue[0] != ticket:
+                # Leave the next token to the head of the queue.
+                return delay + 1.0 / self.bucket.rate
+            if delay > 0:
+                return delay
+            self.bucket.tokens -= 1.0
+            heapq.heappop(self._queue)
+            return 0.0
+
+    def _on_success(self) -> None:
+        with self._lock:
+            self.bucket.on_success()
+
+    def _on_error(self, error: HTTPResponseError, attempt: int) -> float:
+        """Record a failed call and return the backoff delay, or re-raise."""
+        if error.status != RATE_LIMITED_STATUS:
+            raise error
+        retry_after = parse_retry_after(error.headers.get("Retry-After"))
+        with self._lock:
+            self.rate_limited_count += 1
+            self.bucket.on_rate_limited(time.monotonic(), retry_after)
+        self.instrumentation.on_rate_limited(retry_after)
+        if attempt >= self.max_retries:
+            raise RateLimitExceeded(
+                f"Still rate limited after {self.max_retries} retries."
+            ) from error
+        # Full jitter keeps retrying callers from waking up in lockstep.
+        backoff = min(self.backoff_max, self.backoff_base * 2**attempt)
+        delay = random.uniform(0, backoff)
+        self.instrumentation.on_retry(attempt + 1, delay)
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given in seconds."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
@@ -1,8 +1,48 @@
-from .rich_text import Color
-from .rich_text import Annotations
+"""Notion object models.
+
+Names are imported from their submodule on first access, so importing the
+package loads none of the models.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .block import Block, BlockType
+    from .compact import CompactAnnotations, CompactRichText
+    from .lazy import LazyPage
+    from .rich_text import Annotations, Color
+
+_EXPORTS = {
+    "Color": ".rich_text",
+    "Annotations": ".rich_text",
+    "CompactAnnotations": ".compact",
+    "CompactRichText": ".compact",
+    "LazyPage": ".lazy",
+    "Block": ".block",
+    "BlockType": ".block",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
 
 
 __all__ = [
     "Color",
     "Annotations",
+    "CompactAnnotations",
+    "CompactRichText",
+    "LazyPage",
+    "Block",
+    "BlockType",
 ]
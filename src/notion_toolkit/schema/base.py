@@ -0,0 +1,15 @@
+"""Base model of the schema."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SchemaModel(BaseModel):
+    """
+    Base of the schema models.
+
+    Validators and serializers are built on first use instead of at import, so
+    importing the schema is cheap and models never used cost nothing; e.g.
+    `email-validator` is only loaded once a model with an email is validated.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -5,13 +5,148 @@ Official Notion API
 
 """
 
-from pydantic import BaseModel, Field
+from enum import Enum
+from typing import Any
 
+from pydantic import Field, model_validator
 
-class RichText(BaseModel):
-    """Rich Text.
+from .base import SchemaModel
+from .rich_text import Color, NotionObjectType, RichText
 
-    Official Notion API
-        - https://developers.notion.com/reference/rich-text
 
+class BlockType(str, Enum):
     """
+    Block types supported by the toolkit.
+    """
+
+    BULLETED_LIST_ITEM = "bulleted_list_item"
+    CALLOUT = "callout"
+    CODE = "code"
+    DIVIDER = "divider"
+    HEADING_1 = "heading_1"
+    HEADING_2 = "heading_2"
+    HEADING_3 = "heading_3"
+    NUMBERED_LIST_ITEM = "numbered_list_item"
+    PARAGRAPH = "paragraph"
+    QUOTE = "quote"
+    TO_DO = "to_do"
+    TOGGLE = "toggle"
+
+
+class BlockContent(SchemaModel):
+    """
+    Type-specific content of a block.
+
+    Nested `children` follow the API layout but are never serialized: they are
+    appended in their own requests once their parent exists, see
+    `Notion.append_blocks`.
+    """
+
+    children: list["Block"] = Field(default_factory=list, exclude=True)
+
+
+class TextContent(BlockContent):
+    """
+    Content of paragraph, list item, quote and toggle blocks.
+    """
+
+    rich_text: list[RichText]
+    color: Color = Color.DEFAULT
+
+
+class HeadingContent(TextContent):
+    """
+    Content of heading blocks.
+    """
+
+    is_toggleable: bool = False
+
+
+class ToDoContent(TextContent):
+    """
+    Content of to do blocks.
+    """
+
+    checked: bool = False
+
+
+class CalloutContent(TextContent):
+    """
+    Content of callout blocks.
+    """
+
+    icon: dict[str, Any] | None = None
+
+
+class CodeContent(TextContent):
+    """
+    Content of code blocks.
+    """
+
+    language: str = Field(
+        ...,
+        description="Coding language of the code block.",
+        examples=["plain text", "python"],
+    )
+    caption: list[RichText] = Field(default_factory=list)
+
+
+class Block(SchemaModel):
+    """
+    Block object.
+
+    The content lives in the field named after `type`, as in the API.
+
+    Limits:
+        - Any array of all block types, including children: 100 elements
+    """
+
+    object: NotionObjectType = NotionObjectType.BLOCK
+    id: str | None = None
+    type: BlockType
+    has_children: bool = False
+    bulleted_list_item: TextContent | None = None
+    callout: CalloutContent | None = None
+    code: CodeContent | None = None
+    divider: BlockContent | None = None
+    heading_1: HeadingContent | None = None
+    heading_2: HeadingContent | None = None
+    heading_3: HeadingContent | None = None
+    numbered_list_item: TextContent | None = None
+    paragraph: TextContent | None = None
+    quote: TextContent | None = None
+    to_do: ToDoContent | None = None
+    toggle: TextContent | None = None
+
+    @model_validator(mode="after")
+    def _check_content(self) -> "Block":
+        if self.content is None:
+            raise ValueError(f"{self.type.value} block without {self.type.value!r}")
+        return self
+
+    @property
+    def content(self) -> BlockContent:
+        return getattr(self, self.type.value)
+
+    @property
+    def children(self) -> list["Block"]:
+        return self.content.children
+
+    @classmethod
+    def create(
+        cls,
+        type: BlockType | str,
+        text: str | list[RichText] = "",
+        children: list["Block"] | None = None,
+        **fields: Any,
+    ) -> "Block":
+        """Build a block from plain text or rich text spans."""
+        type = BlockType(type)
+        content: dict[str, Any] = {"children": children or [], **fields}
+        if type is not BlockType.DIVIDER:
+            content["rich_text"] = (
+                [RichText.create_for_text(text)] if isinstance(text, str) else text
+            )
+        if type is BlockType.CODE:
+            content.setdefault("language", "plain text")
+        return cls.model_validate({"type": type, type.value: content})
@@ -3,11 +3,12 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import Field, HttpUrl
+from .base import SchemaModel
 from .rich_text import RichText
 
 
-class FileField(BaseModel):
+class FileField(SchemaModel):
     """File field."""
 
     url: HttpUrl = Field(
@@ -22,21 +23,21 @@ class FileField(BaseModel):
     )
 
 
-class File(BaseModel):
+class File(SchemaModel):
     """File object."""
 
     type: str = "file"
     file: FileField = Field(description="File object.")
 
 
-class Emoji(BaseModel):
+class Emoji(SchemaModel):
     """Emoji object."""
 
     type: str = "emoji"
     emoji: str = Field(description="The emoji character.", examples=["😻"])
 
 
-class Date(BaseModel):
+class Date(SchemaModel):
     """
     Date mention object.
     """
@@ -79,7 +80,7 @@ class Color(str, Enum):
     YELLOW_BACKGROUND = "yellow_background"
 
 
-class Title(BaseModel):
+class Title(SchemaModel):
     """Title object."""
 
     id: str = "title"
@@ -87,9 +88,7 @@ class Title(BaseModel):
     title: RichText
 
 
-class Checkbox(BaseModel):
+class Checkbox(SchemaModel):
     """Checkbox object."""
 
     checkbox: bool
-
-class 
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""Compact rich text representation.
+
+Memory-lean counterparts of `Annotations` and `RichText` for holding large
+numbers of spans, such as the content of synced pages. Both convert losslessly
+to and from the pydantic models in `rich_text.py`.
+
+"""
+
+from typing import Any
+
+from .rich_text import (
+    Annotations,
+    Color,
+    EquationObject,
+    Link,
+    MentionObject,
+    RichText,
+    RichTextObjectType,
+    TextObject,
+)
+
+_FLAGS = ("bold", "italic", "strikethrough", "underline", "code")
+_COLORS = tuple(Color)
+_COLOR_INDEX = {color: index for index, color in enumerate(_COLORS)}
+_COLOR_SHIFT = len(_FLAGS)
+
+
+class CompactAnnotations:
+    """
+    Interned, bit-packed annotations.
+
+    The five style flags take the low bits and the color index the bits above
+    them. Instances are immutable and shared: there is exactly one object per
+    distinct annotation set, so the default annotations of millions of spans
+    cost a single object.
+    """
+
+    __slots__ = ("bits",)
+    _interned: dict[int, "CompactAnnotations"] = {}
+
+    bits: int
+
+    def __new__(cls, bits: int = 0) -> "CompactAnnotations":
+        instance = cls._interned.get(bits)
+        if instance is None:
+            if not 0 <= bits >> _COLOR_SHIFT < len(_COLORS):
+                raise ValueError(f"Invalid annotation bits: {bits}")
+            instance = super().__new__(cls)
+            object.__setattr__(instance, "bits", bits)
+            instance = cls._interned.setdefault(bits, instance)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CompactAnnotations is immutable")
+
+    def __reduce__(self):
+        return (CompactAnnotations, (self.bits,))
+
+    @classmethod
+    def of(
+        cls,
+        bold: bool = False,
+        italic: bool = False,
+        strikethrough: bool = False,
+        underline: bool = False,
+        code: bool = False,
+        color: Color | str = Color.DEFAULT,
+    ) -> "CompactAnnotations":
+        bits = (
+            bold
+            | italic << 1
+            | strikethrough << 2
+            | underline << 3
+            | code << 4
+            | _COLOR_INDEX[Color(color)] << _COLOR_SHIFT
+        )
+        return cls(bits)
+
+    @classmethod
+    def from_dict(cls, annotations: dict[str, Any]) -> "CompactAnnotations":
+        return cls.of(**annotations)
+
+    @classmethod
+    def from_model(cls, annotations: Annotations) -> "CompactAnnotations":
+        return cls.of(
+            annotations.bold,
+            annotations.italic,
+            annotations.strikethrough,
+            annotations.underline,
+            annotations.code,
+            annotations.color,
+        )
+
+    @property
+    def bold(self) -> bool:
+        return bool(self.bits & 1)
+
+    @property
+    def italic(self) -> bool:
+        return bool(self.bits & 2)
+
+    @property
+    def strikethrough(self) -> bool:
+        return bool(self.bits & 4)
+
+    @property
+    def underline(self) -> bool:
+        return bool(self.bits & 8)
+
+    @property
+    def code(self) -> bool:
+        return bool(self.bits & 16)
+
+    @property
+    def color(self) -> Color:
+        return _COLORS[self.bits >> _COLOR_SHIFT]
+
+    @property
+    def is_default(self) -> bool:
+        return self.bits == DEFAULT_ANNOTATIONS.bits
+
+    def to_dict(self) -> dict[str, Any]:
+        annotations: dict[str, Any] = {
+            flag: bool(self.bits & 1 << i) for i, flag in enumerate(_FLAGS)
+        }
+        annotations["color"] = self.color.value
+        return annotations
+
+    def to_model(self) -> Annotations:
+        return Annotations(**self.to_dict())
+
+    def __repr__(self) -> str:
+        fields = [flag for i, flag in enumerate(_FLAGS) if self.bits & 1 << i]
+        fields.append(f"color={self.color.value!r}")
+        return f"CompactAnnotations({', '.join(fields)})"
+
+
+DEFAULT_ANNOTATIONS = CompactAnnotations.of()
+
+
+class CompactRichText:
+    """
+    Lightweight `__slots__` rich text span.
+
+    Text spans keep only their strings and an interned `CompactAnnotations`.
+    Mention and equation spans keep their type-specific object as a plain dict,
+    in the API layout, i.e. the value of the `mention` or `equation` key.
+    """
+
+    __slots__ = ("type", "content", "link", "annotations", "plain_text", "href", "data")
+
+    def __init__(
+        self,
+        type: RichTextObjectType,
+        content: str | None = None,
+        link: str | None = None,
+        annotations: CompactAnnotations = DEFAULT_ANNOTATIONS,
+        plain_text: str | None = None,
+        href: str | None = None,
+        data: dict[str, Any] | None = None,
+    ):
+        self.type = RichTextObjectType(type)
+        self.content = content
+        self.link = link
+        self.annotations = annotations
+        self.plain_text = content if plain_text is None else plain_text
+        self.href = href
+        self.data = data
+
+    @classmethod
+    def from_dict(cls, span: dict[str, Any]) -> "CompactRichText":
+        """Build from a rich text object as returned by the API, without pydantic."""
+        kind = RichTextObjectType(span["type"])
+        annotations = span.get("annotations")
+        compact = CompactAnnotations.from_dict(annotations) if annotations else None
+        text = span.get("text") if kind is RichTextObjectType.TEXT else None
+        link = (text or {}).get("link")
+        return cls(
+            type=kind,
+            content=text["content"] if text else None,
+            link=link["url"] if link else None,
+            annotations=compact or DEFAULT_ANNOTATIONS,
+            plain_text=span.get("plain_text"),
+            href=span.get("href"),
+            data=None if text else span.get(kind.value),
+        )
+
+    @classmethod
+    def from_model(cls, rich_text: RichText) -> "CompactRichText":
+        text = rich_text.text
+        data = None
+        # The models wrap the API objects in one more level, with a type.
+        if rich_text.mention is not None:
+            data = rich_text.mention.mention.model_dump(mode="json")
+        elif rich_text.equation is not None:
+            data = rich_text.equation.model_dump(mode="json", exclude={"type"})
+        return cls(
+            type=rich_text.type,
+            content=text.content if text else None,
+            link=str(text.link.url) if text and text.link else None,
+            annotations=CompactAnnotations.from_model(rich_text.annotations),
+            plain_text=rich_text.plain_text,
+            href=rich_text.href,
+            data=data,
+        )
+
+    def to_model(self) -> RichText:
+        fields: dict[str, Any] = {}
+        if self.content is not None:
+            fields["text"] = TextObject(
+                content=self.content,
+                link=Link(url=self.link) if self.link else None,
+            )
+        if self.type is RichTextObjectType.MENTION and self.data is not None:
+            fields["mention"] = MentionObject.model_validate({"mention": self.data})
+        if self.type is RichTextObjectType.EQUATION and self.data is not None:
+            fields["equation"] = EquationObject.model_validate(self.data)
+        return RichText(
+            type=self.type,
+            annotations=self.annotations.to_model(),
+            plain_text=self.plain_text,
+            href=self.href,
+            **fields,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        span: dict[str, Any] = {"type": self.type.value}
+        if self.content is not None:
+            span["text"] = {
+                "content": self.content,
+                "link": {"url": self.link} if self.link else None,
+            }
+        elif self.data is not None:
+            span[self.type.value] = self.data
+        span["annotations"] = self.annotations.to_dict()
+        span["plain_text"] = self.plain_text
+        span["href"] = self.href
+        return span
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactRichText):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactRichText(type={self.type.value!r}, "
+            f"plain_text={self.plain_text!r}, annotations={self.annotations!r})"
+        )
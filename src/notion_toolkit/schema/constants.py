@@ -0,0 +1,24 @@
+"""Constants and enums of the schema that do not need pydantic.
+
+Modules on the import path of the clients take them from here, so creating a
+page does not import pydantic or build any model.
+
+Official Notion API
+    - https://developers.notion.com/reference/request-limits
+
+"""
+
+from enum import Enum
+
+MAX_TEXT_LENGTH = 2000
+MAX_ARRAY_LENGTH = 100
+
+
+class ProdCopilotSourceType(str, Enum):
+    """
+    The source type of a page in the ProdCopilot source database.
+    """
+
+    WEBPAGE = "webpage"
+    YOUTUBE = "youtube"
+    PDF = "pdf"
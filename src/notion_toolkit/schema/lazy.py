@@ -0,0 +1,111 @@
+"""Lazy page response models.
+
+Official Notion API
+    - https://developers.notion.com/reference/page
+
+"""
+
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+from .page_properties import PROPERTY_MODELS, PagePropertyType, PropertyValue
+
+
+class LazyProperties(Mapping[str, PropertyValue | dict[str, Any]]):
+    """
+    Read-only mapping of property name to its validated property value.
+
+    Each property is validated with its `PagePropertyType` model the first time
+    it is accessed and the result is cached; properties that are never read are
+    never validated. Properties of a type without a model, such as `button`,
+    are returned as the raw dict.
+    """
+
+    __slots__ = ("_raw", "_validated")
+
+    def __init__(self, raw: dict[str, dict[str, Any]]):
+        self._raw = raw
+        self._validated: dict[str, PropertyValue] = {}
+
+    def __getitem__(self, name: str) -> PropertyValue | dict[str, Any]:
+        value = self._validated.get(name)
+        if value is None:
+            raw = self._raw[name]
+            try:
+                model = PROPERTY_MODELS[PagePropertyType(raw["type"])]
+            except ValueError:
+                return raw
+            value = self._validated[name] = model.model_validate(raw)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def raw(self, name: str) -> dict[str, Any]:
+        """The unvalidated property value as returned by the API."""
+        return self._raw[name]
+
+    @property
+    def validated_count(self) -> int:
+        return len(self._validated)
+
+
+class LazyPage:
+    """
+    Page response that keeps the raw dict and validates on access.
+
+    Top level fields are read straight from the raw dict, and properties are
+    validated one at a time through `properties`, so a scan that reads two
+    fields out of thirty only pays for those two.
+    """
+
+    __slots__ = ("raw", "_properties")
+
+    def __init__(self, raw: dict[str, Any]):
+        self.raw = raw
+        self._properties: LazyProperties | None = None
+
+    @property
+    def id(self) -> str:
+        return self.raw["id"]
+
+    @property
+    def object(self) -> str:
+        return self.raw.get("object", "page")
+
+    @property
+    def url(self) -> str | None:
+        return self.raw.get("url")
+
+    @property
+    def archived(self) -> bool:
+        return self.raw.get("archived", False)
+
+    @property
+    def created_time(self) -> datetime | None:
+        return _parse_datetime(self.raw.get("created_time"))
+
+    @property
+    def last_edited_time(self) -> datetime | None:
+        return _parse_datetime(self.raw.get("last_edited_time"))
+
+    @property
+    def properties(self) -> LazyProperties:
+        if self._properties is None:
+            self._properties = LazyProperties(self.raw.get("properties", {}))
+        return self._properties
+
+    def __getitem__(self, name: str) -> PropertyValue | dict[str, Any]:
+        """Shortcut for `page.properties[name]`."""
+        return self.properties[name]
+
+    def __repr__(self) -> str:
+        return f"LazyPage(id={self.raw.get('id')!r})"
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
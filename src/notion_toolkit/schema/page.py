@@ -1,9 +1,11 @@
 from enum import Enum
 from uuid import uuid4, UUID
 from datetime import datetime
-from pydantic import BaseModel, Field, UUID4, HttpUrl
+from pydantic import Field, UUID4, HttpUrl
+from .base import SchemaModel
+from .constants import ProdCopilotSourceType
 from .rich_text import NotionObjectType
-from .common import File, Emoji
+from .common import File, Emoji, Title, Checkbox
 from .parent import DatabaseParent, PageParent, WorkspaceParent, BlockParent
 
 
@@ -15,7 +17,7 @@ class PagePropertyType(str, Enum):
     CHECKBOX = "checkbox"
 
 
-class PageProperties(BaseModel):
+class PageProperties(SchemaModel):
     """
     Property values of this page. As of version 2022-06-28, properties only contains the ID of the property; in prior versions properties contained the values as well.
 
@@ -30,12 +32,12 @@ class PageProperties(BaseModel):
     type: str
 
 
-class ProdCopilotSourceDatabasePageProperties(BaseModel):
+class ProdCopilotSourceDatabasePageProperties(SchemaModel):
     Name: Title
     Archived: Checkbox
 
 
-class BasePageRequestBody(BaseModel):
+class BasePageRequestBody(SchemaModel):
     """
     The Page object contains the page property values of a single Notion page.
     """
@@ -107,7 +109,7 @@ class ProdCopilotSourceDatabasePageRequestBody(BasePageRequestBody):
     properties: PageProperties
 
 
-class PageResponseBody(PageRequestBody):
+class PageResponseBody(BasePageRequestBody):
     """
     The Page object contains the page property values of a single Notion page.
     """
@@ -1,7 +1,13 @@
 """Page Properties schema."""
 
+from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, EmailStr
+from typing import Any, Literal
+
+from pydantic import EmailStr, Field
+
+from .base import SchemaModel
+from .rich_text import RichText as RichTextObject
 
 
 class PagePropertyType(str, Enum):
@@ -32,56 +38,230 @@ class PagePropertyType(str, Enum):
     UNIQUE_ID = "unique_id"
 
 
-class Checkbox(BaseModel): ...
+class PropertyValue(SchemaModel):
+    """
+    Property value object of a page.
+
+    Official Notion API
+        - https://developers.notion.com/reference/page-property-values
+
+    """
+
+    id: str | None = Field(
+        default=None,
+        description="Underlying identifier of the property, stable across renames.",
+        examples=["title", "%3AUPp"],
+    )
+    type: PagePropertyType
+
+
+class PartialUser(SchemaModel):
+    """
+    User reference inside a property value.
+    """
+
+    object: str = "user"
+    id: str
+
+
+class SelectOption(SchemaModel):
+    """
+    Option of a select, multi-select or status property.
+    """
+
+    id: str | None = None
+    name: str
+    color: str | None = None
+
+
+class DateValue(SchemaModel):
+    """
+    Date or date range of a date property.
+    """
+
+    start: str
+    end: str | None = None
+    time_zone: str | None = None
+
+
+class FileValue(SchemaModel):
+    """
+    File attached to a files property, either uploaded to Notion or external.
+    """
+
+    name: str | None = None
+    type: str
+    file: dict[str, Any] | None = None
+    external: dict[str, Any] | None = None
+
+
+class FormulaValue(SchemaModel):
+    """
+    Computed value of a formula property.
+    """
+
+    type: str
+    string: str | None = None
+    number: float | None = None
+    boolean: bool | None = None
+    date: DateValue | None = None
+
+
+class RelationReference(SchemaModel):
+    """
+    Page referenced by a relation property.
+    """
+
+    id: str
+
+
+class RollupValue(SchemaModel):
+    """
+    Computed value of a rollup property.
+    """
+
+    type: str
+    function: str | None = None
+    number: float | None = None
+    date: DateValue | None = None
+    array: list[dict[str, Any]] | None = None
+
+
+class UniqueIdValue(SchemaModel):
+    """
+    Auto-incremented identifier of a unique id property.
+    """
+
+    prefix: str | None = None
+    number: int | None = None
+
+
+class Checkbox(PropertyValue):
+    type: Literal[PagePropertyType.CHECKBOX] = PagePropertyType.CHECKBOX
+    checkbox: bool
+
+
+class CreatedBy(PropertyValue):
+    type: Literal[PagePropertyType.CREATED_BY] = PagePropertyType.CREATED_BY
+    created_by: PartialUser
+
+
+class CreatedTime(PropertyValue):
+    type: Literal[PagePropertyType.CREATED_TIME] = PagePropertyType.CREATED_TIME
+    created_time: datetime
+
+
+class Date(PropertyValue):
+    type: Literal[PagePropertyType.DATE] = PagePropertyType.DATE
+    date: DateValue | None = None
+
+
+class Email(PropertyValue):
+    type: Literal[PagePropertyType.EMAIL] = PagePropertyType.EMAIL
+    email: EmailStr | None = None
 
 
-class CreatedBy(BaseModel): ...
+class Files(PropertyValue):
+    type: Literal[PagePropertyType.FILES] = PagePropertyType.FILES
+    files: list[FileValue] = Field(default_factory=list)
 
 
-class CreatedTime(BaseModel): ...
+class Formula(PropertyValue):
+    type: Literal[PagePropertyType.FORMULA] = PagePropertyType.FORMULA
+    formula: FormulaValue
 
 
-class Date(BaseModel): ...
+class LastEditedBy(PropertyValue):
+    type: Literal[PagePropertyType.LAST_EDITED_BY] = PagePropertyType.LAST_EDITED_BY
+    last_edited_by: PartialUser
 
 
-class Email(BaseModel):
-    email: EmailStr
+class LastEditedTime(PropertyValue):
+    type: Literal[PagePropertyType.LAST_EDITED_TIME] = PagePropertyType.LAST_EDITED_TIME
+    last_edited_time: datetime
 
 
-class Formula(BaseModel): ...
+class MultiSelect(PropertyValue):
+    type: Literal[PagePropertyType.MULTI_SELECT] = PagePropertyType.MULTI_SELECT
+    multi_select: list[SelectOption] = Field(default_factory=list)
 
 
-class LastEditedBy(BaseModel): ...
+class Number(PropertyValue):
+    type: Literal[PagePropertyType.NUMBER] = PagePropertyType.NUMBER
+    number: float | None = None
 
 
-class LastEditedTime(BaseModel): ...
+class People(PropertyValue):
+    type: Literal[PagePropertyType.PEOPLE] = PagePropertyType.PEOPLE
+    people: list[PartialUser] = Field(default_factory=list)
 
 
-class MultiSelect(BaseModel): ...
+class PhoneNumber(PropertyValue):
+    type: Literal[PagePropertyType.PHONE_NUMBER] = PagePropertyType.PHONE_NUMBER
+    phone_number: str | None = None
 
 
-class Number(BaseModel): ...
+class Relation(PropertyValue):
+    type: Literal[PagePropertyType.RELATION] = PagePropertyType.RELATION
+    relation: list[RelationReference] = Field(default_factory=list)
+    has_more: bool = False
 
 
-class People(BaseModel): ...
+class RichText(PropertyValue):
+    type: Literal[PagePropertyType.RICH_TEXT] = PagePropertyType.RICH_TEXT
+    rich_text: list[RichTextObject] = Field(default_factory=list)
 
 
-class PhoneNumber(BaseModel): ...
+class Rollup(PropertyValue):
+    type: Literal[PagePropertyType.ROLLUP] = PagePropertyType.ROLLUP
+    rollup: RollupValue
 
 
-class Relation(BaseModel): ...
+class Select(PropertyValue):
+    type: Literal[PagePropertyType.SELECT] = PagePropertyType.SELECT
+    select: SelectOption | None = None
 
 
-class Rollup(BaseModel): ...
+class Status(PropertyValue):
+    type: Literal[PagePropertyType.STATUS] = PagePropertyType.STATUS
+    status: SelectOption | None = None
 
 
-class Select(BaseModel): ...
+class Title(PropertyValue):
+    type: Literal[PagePropertyType.TITLE] = PagePropertyType.TITLE
+    title: list[RichTextObject] = Field(default_factory=list)
 
 
-class Status(BaseModel): ...
+class Url(PropertyValue):
+    type: Literal[PagePropertyType.URL] = PagePropertyType.URL
+    url: str | None = None
 
 
-class Title(BaseModel): ...
+class UniqueId(PropertyValue):
+    type: Literal[PagePropertyType.UNIQUE_ID] = PagePropertyType.UNIQUE_ID
+    unique_id: UniqueIdValue
 
 
-class Url(BaseModel): ...
+PROPERTY_MODELS: dict[PagePropertyType, type[PropertyValue]] = {
+    PagePropertyType.CHECKBOX: Checkbox,
+    PagePropertyType.CREATED_BY: CreatedBy,
+    PagePropertyType.CREATED_TIME: CreatedTime,
+    PagePropertyType.DATE: Date,
+    PagePropertyType.EMAIL: Email,
+    PagePropertyType.FILES: Files,
+    PagePropertyType.FORMULA: Formula,
+    PagePropertyType.LAST_EDITED_BY: LastEditedBy,
+    PagePropertyType.LAST_EDITED_TIME: LastEditedTime,
+    PagePropertyType.MULTI_SELECT: MultiSelect,
+    PagePropertyType.NUMBER: Number,
+    PagePropertyType.PEOPLE: People,
+    PagePropertyType.PHONE_NUMBER: PhoneNumber,
+    PagePropertyType.RELATION: Relation,
+    PagePropertyType.RICH_TEXT: RichText,
+    PagePropertyType.ROLLUP: Rollup,
+    PagePropertyType.SELECT: Select,
+    PagePropertyType.STATUS: Status,
+    PagePropertyType.TITLE: Title,
+    PagePropertyType.URL: Url,
+    PagePropertyType.UNIQUE_ID: UniqueId,
+}
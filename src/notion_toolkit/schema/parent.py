@@ -1,30 +1,32 @@
 """Parent object schema."""
 
-from pydantic import BaseModel, UUID4
+from pydantic import UUID4
 
+from .base import SchemaModel
 
-class DatabaseParent(BaseModel):
+
+class DatabaseParent(SchemaModel):
     """Database parent object."""
 
     type: str = "database_id"
     database_id: str | UUID4
 
 
-class PageParent(BaseModel):
+class PageParent(SchemaModel):
     """Page parent object."""
 
     type: str = "page_id"
     page_id: str | UUID4
 
 
-class WorkspaceParent(BaseModel):
+class WorkspaceParent(SchemaModel):
     """Workspace parent object."""
 
     type: str = "workspace"
     workspace: bool
 
 
-class BlockParent(BaseModel):
+class BlockParent(SchemaModel):
     """Block parent object."""
 
     type: str = "block_id"
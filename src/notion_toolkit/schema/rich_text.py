@@ -1,7 +1,8 @@
 """Common schema."""
 
 from enum import Enum
-from pydantic import BaseModel, Field, HttpUrl, UUID4
+from pydantic import Field, HttpUrl, UUID4
+from .base import SchemaModel
 
 
 class NotionObjectType(str, Enum):
@@ -53,7 +54,7 @@ class Color(str, Enum):
     YELLOW_BACKGROUND = "yellow_background"
 
 
-class Annotations(BaseModel):
+class Annotations(SchemaModel):
     """
     The information used to style the rich text object.Refer to the annotation object section below for details.
     """
@@ -103,7 +104,7 @@ class MentionType(str, Enum):
     USER = "user"
 
 
-class Link(BaseModel):
+class Link(SchemaModel):
     """
     An object with information about any inline link in this text, if included.
     """
@@ -115,7 +116,7 @@ class Link(BaseModel):
     )
 
 
-class ID(BaseModel):
+class ID(SchemaModel):
     """
     Database mentions contain a database reference within the corresponding database field. A database reference is an object with an id key and a string value (UUIDv4) corresponding to a database ID.
     """
@@ -123,12 +124,12 @@ class ID(BaseModel):
     id: UUID4
 
 
-class DatabaseMentionObject(BaseModel):
+class DatabaseMentionObject(SchemaModel):
     """
     Database mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.DATABASE)
+    type: MentionType = Field(default=MentionType.DATABASE)
     database: ID = Field(
         ...,
         description="The database object.",
@@ -136,7 +137,7 @@ class DatabaseMentionObject(BaseModel):
     )
 
 
-class Date(BaseModel):
+class Date(SchemaModel):
     """
     Date mention object.
     """
@@ -146,19 +147,19 @@ class Date(BaseModel):
         description="start date",
         examples=["2022-01-01"],
     )
-    end: str = Field(
+    end: str | None = Field(
         default=None,
         description="end date",
         examples=["2022-01-02", None],
     )
 
 
-class DateMentionObject(BaseModel):
+class DateMentionObject(SchemaModel):
     """
     Date mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.DATE)
+    type: MentionType = Field(default=MentionType.DATE)
     date: Date = Field(
         ...,
         description="The date object.",
@@ -166,12 +167,12 @@ class DateMentionObject(BaseModel):
     )
 
 
-class LinkPreviewMentionObject(BaseModel):
+class LinkPreviewMentionObject(SchemaModel):
     """
     Link preview mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.LINK_PREVIEW)
+    type: MentionType = Field(default=MentionType.LINK_PREVIEW)
     link_preview: Link = Field(
         ...,
         description="The link preview object.",
@@ -179,12 +180,12 @@ class LinkPreviewMentionObject(BaseModel):
     )
 
 
-class PageMentionObject(BaseModel):
+class PageMentionObject(SchemaModel):
     """
     Page mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.PAGE)
+    type: MentionType = Field(default=MentionType.PAGE)
     page: ID = Field(
         ...,
         description="The page object.",
@@ -214,30 +215,30 @@ class TempalteMentionUserType(str, Enum):
     ME = "me"
 
 
-class TemplateMentionFieldObject(BaseModel):
+class TemplateMentionFieldObject(SchemaModel):
     """
     Template mention rich text objects contain a template_mention object with a nested type key that is either "template_mention_date" or "template_mention_user".
     """
 
     type: TempalteMentionType = Field(default=TempalteMentionType.TEMPLATE_MENTION_DATE)
-    template_mention_date: TempalteMentionDateType = Field(
+    template_mention_date: TempalteMentionDateType | None = Field(
         default=None,
         description="The type of the date mention.",
         examples=[TempalteMentionDateType.TODAY, TempalteMentionDateType.NOW],
     )
-    template_mention_user: TempalteMentionUserType = Field(
+    template_mention_user: TempalteMentionUserType | None = Field(
         default=None,
         description="The type of the user mention.",
         examples=[TempalteMentionUserType.ME],
     )
 
 
-class TemplateMentionObject(BaseModel):
+class TemplateMentionObject(SchemaModel):
     """
     Template mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.TEMPLATE_MENTION)
+    type: MentionType = Field(default=MentionType.TEMPLATE_MENTION)
     template_mention: TemplateMentionFieldObject = Field(
         ...,
         description="The template field object.",
@@ -245,7 +246,7 @@ class TemplateMentionObject(BaseModel):
     )
 
 
-class User(BaseModel):
+class User(SchemaModel):
     """
     User mention object.
     """
@@ -254,12 +255,12 @@ class User(BaseModel):
     id: UUID4
 
 
-class UserMentionObject(BaseModel):
+class UserMentionObject(SchemaModel):
     """
     User mention object.
     """
 
-    type: RichTextObjectType = Field(default=MentionType.USER)
+    type: MentionType = Field(default=MentionType.USER)
     user: User = Field(
         ...,
         description="The user object.",
@@ -267,7 +268,7 @@ class UserMentionObject(BaseModel):
     )
 
 
-class MentionObject(BaseModel):
+class MentionObject(SchemaModel):
     """
     Rich text mention object.
     Mention objects represent an inline mention of a database, date, link preview mention, page, template mention, or user. A mention is created in the Notion UI when a user types @ followed by the name of the reference.
@@ -293,7 +294,7 @@ class MentionObject(BaseModel):
     )
 
 
-class EquationObject(BaseModel):
+class EquationObject(SchemaModel):
     """
     Rich text equation object.
     Notion supports inline LaTeX equations as rich text object’s with a type value of "equation".
@@ -307,7 +308,7 @@ class EquationObject(BaseModel):
     )
 
 
-class TextObject(BaseModel):
+class TextObject(SchemaModel):
     """
     Rich text text object.
     """
@@ -324,7 +325,7 @@ class TextObject(BaseModel):
     )
 
 
-class RichText(BaseModel):
+class RichText(SchemaModel):
     """
     Rich Text.
 
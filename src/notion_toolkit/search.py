@@ -0,0 +1,340 @@
+"""Offline full-text search over synced pages.
+
+`SearchIndex` is an inverted index of the `plain_text` of page titles, text
+properties and blocks, with token positions for phrase queries. Queries are
+ranked with BM25:
+
+    index.search('"release notes" python deploy*')
+
+Quoted phrases must appear as is, a trailing `*` matches every term with that
+prefix, and every part of the query must match.
+
+"""
+
+import json
+import math
+import re
+import struct
+import zlib
+from bisect import bisect_left
+from dataclasses import dataclass
+from os import PathLike
+from typing import Any, Callable, Iterable
+
+from notion_toolkit.columnar import decode_property
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import NotionPageResponse
+from notion_toolkit.schema.page_properties import PagePropertyType
+
+Postings = dict[int, list[int]]
+
+MAGIC = b"NTSI1\n"
+
+_TOKEN = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+_TEXT_PROPERTIES = {PagePropertyType.TITLE.value, PagePropertyType.RICH_TEXT.value}
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def page_text(
+    page: NotionPageResponse, blocks: Iterable[dict[str, Any]] = ()
+) -> list[str]:
+    """Text segments of a page: its title and text properties, then its blocks."""
+    segments = [
+        decode_property(value)
+        for value in page.get("properties", {}).values()
+        if value.get("type") in _TEXT_PROPERTIES
+    ]
+    for block in blocks:
+        content = block.get(block.get("type")) or {}
+        for key in ("rich_text", "caption"):
+            if spans := content.get(key):
+                segments.append("".join(span.get("plain_text", "") for span in spans))
+    return [segment for segment in segments if segment]
+
+
+@dataclass
+class SearchHit:
+    """A matching page and its BM25 score."""
+
+    page_id: str
+    score: float
+
+
+class SearchIndex:
+    """
+    Inverted index with positions, updated incrementally.
+
+    Documents are numbered internally. Replacing or removing a page leaves a
+    tombstone on its old number instead of rewriting every posting list;
+    tombstones are purged when the index is saved. Saved indexes load without
+    decoding their posting lists, which are decoded per term on first use.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        # Posting lists, still varint encoded for terms not used since `load`.
+        self._postings: dict[str, Postings | bytes] = {}
+        self._vocabulary: list[str] | None = None
+        self._pages: dict[str, int] = {}
+        self._docs: dict[int, tuple[str, str | None, int]] = {}
+        self._deleted: set[int] = set()
+        self._next_doc = 0
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self._pages
+
+    def version(self, page_id: str) -> str | None:
+        """The version, e.g. `last_edited_time`, a page was indexed at."""
+        doc = self._pages.get(page_id)
+        return self._docs[doc][1] if doc is not None else None
+
+    def add(
+        self, page_id: str, segments: Iterable[str], version: str | None = None
+    ) -> None:
+        """Index the text segments of a page, replacing any earlier version."""
+        self.remove(page_id)
+        doc = self._next_doc
+        self._next_doc += 1
+        positions: dict[str, list[int]] = {}
+        position = 0
+        for segment in segments:
+            for token in tokenize(segment):
+                positions.setdefault(token, []).append(position)
+                position += 1
+            # Phrases do not match across segments.
+            position += 1
+        for token, token_positions in positions.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {doc: token_positions}
+                self._vocabulary = None
+            else:
+                self._term(token)[doc] = token_positions
+        self._pages[page_id] = doc
+        self._docs[doc] = (page_id, version, position)
+        self._total_length += position
+
+    def add_page(
+        self, page: NotionPageResponse, blocks: Iterable[dict[str, Any]] = ()
+    ) -> bool:
+        """Index a page unless it is unchanged; return whether it was indexed.
+
+        `blocks` are block dicts of its content, e.g. from `Notion.iter_block_tree`.
+        """
+        version = page.get("last_edited_time")
+        if version is not None and self.version(page["id"]) == version:
+            return False
+        self.add(page["id"], page_text(page, blocks), version)
+        return True
+
+    def remove(self, page_id: str) -> None:
+        doc = self._pages.pop(page_id, None)
+        if doc is not None:
+            self._deleted.add(doc)
+            self._total_length -= self._docs.pop(doc)[2]
+
+    def update_from_mirror(
+        self,
+        mirror: DatabaseMirror,
+        blocks: Callable[[str], Iterable[dict[str, Any]]] | None = None,
+    ) -> int:
+        """Index the pages of a mirror changed since they were last indexed.
+
+        Pages no longer in the mirror are removed. `blocks` returns the block
+        dicts of a page id; content is only fetched for changed pages.
+        """
+        count = 0
+        seen = set()
+        for page in mirror.pages():
+            seen.add(page["id"])
+            version = page.get("last_edited_time")
+            if version is not None and self.version(page["id"]) == version:
+                continue
+            content = blocks(page["id"]) if blocks is not None else ()
+            count += self.add_page(page, content)
+        for page_id in [page_id for page_id in self._pages if page_id not in seen]:
+            self.remove(page_id)
+        return count
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """Pages matching every phrase, term and prefix of `query`, best first."""
+        clauses = []
+        for phrase, word in _QUERY.findall(query):
+            if phrase:
+                clauses.append(self._phrase(tokenize(phrase)))
+            elif word.endswith("*") and (prefix := tokenize(word)):
+                clauses.append(self._prefix(prefix[-1]))
+            else:
+                clauses.extend(
+                    self._term_frequencies(token) for token in tokenize(word)
+                )
+        if not clauses:
+            return []
+        docs = set.intersection(*(set(clause) for clause in clauses))
+        if not docs:
+            return []
+
+        count = len(self._docs)
+        average = self._total_length / count
+        scores = dict.fromkeys(docs, 0.0)
+        for clause in clauses:
+            idf = math.log(1 + (count - len(clause) + 0.5) / (len(clause) + 0.5))
+            for doc in docs:
+                frequency = clause[doc]
+                length = self._docs[doc][2]
+                norm = self.k1 * (1 - self.b + self.b * length / average)
+                scores[doc] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [SearchHit(self._docs[doc][0], score) for doc, score in ranked[:limit]]
+
+    def _term(self, term: str) -> Postings:
+        postings = self._postings.get(term)
+        if postings is None:
+            postings = {}
+        elif isinstance(postings, bytes):
+            postings = self._postings[term] = _decode(postings)
+        return postings
+
+    def _term_frequencies(self, term: str) -> dict[int, int]:
+        return {
+            doc: len(positions)
+            for doc, positions in self._term(term).items()
+            if doc not in self._deleted
+        }
+
+    def _prefix(self, prefix: str) -> dict[int, int]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        frequencies: dict[int, int] = {}
+        start = bisect_left(self._vocabulary, prefix)
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            for doc, frequency in self._term_frequencies(term).items():
+                frequencies[doc] = frequencies.get(doc, 0) + frequency
+        return frequencies
+
+    def _phrase(self, terms: list[str]) -> dict[int, int]:
+        if len(terms) <= 1:
+            return self._term_frequencies(terms[0]) if terms else {}
+        postings = [self._term(term) for term in terms]
+        docs = set.intersection(*(set(p) for p in postings)) - self._deleted
+        frequencies = {}
+        for doc in docs:
+            following = [set(p[doc]) for p in postings[1:]]
+            frequency = sum(
+                all(start + i in positions for i, positions in enumerate(following, 1))
+                for start in postings[0][doc]
+            )
+            if frequency:
+                frequencies[doc] = frequency
+        return frequencies
+
+    def save(self, path: str | PathLike) -> None:
+        """Write the index to one compressed file, purging removed pages."""
+        if self._deleted:
+            for term in list(self._postings):
+                postings = self._term(term)
+                for doc in self._deleted.intersection(postings):
+                    del postings[doc]
+                if not postings:
+                    del self._postings[term]
+            self._deleted.clear()
+            self._vocabulary = None
+        terms, blobs = [], []
+        for term, postings in self._postings.items():
+            blob = postings if isinstance(postings, bytes) else _encode(postings)
+            terms.append([term, len(blob)])
+            blobs.append(blob)
+        header = json.dumps(
+            {
+                "next_doc": self._next_doc,
+                "docs": [[doc, *entry] for doc, entry in self._docs.items()],
+                "terms": terms,
+            },
+            separators=(",", ":"),
+        ).encode()
+        body = struct.pack("<I", len(header)) + header + b"".join(blobs)
+        with open(path, "wb") as file:
+            file.write(MAGIC + zlib.compress(body))
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> "SearchIndex":
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a search index file.")
+        body = zlib.decompress(data[len(MAGIC) :])
+        (header_length,) = struct.unpack_from("<I", body)
+        offset = 4 + header_length
+        header = json.loads(body[4:offset])
+
+        index = cls()
+        index._next_doc = header["next_doc"]
+        for doc, page_id, version, length in header["docs"]:
+            index._docs[doc] = (page_id, version, length)
+            index._pages[page_id] = doc
+            index._total_length += length
+        for term, size in header["terms"]:
+            index._postings[term] = body[offset : offset + size]
+            offset += size
+        return index
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode(postings: Postings) -> bytes:
+    """Varint encode doc number and position deltas."""
+    out = bytearray()
+    previous_doc = 0
+    for doc in sorted(postings):
+        positions = postings[doc]
+        _write_varint(out, doc - previous_doc)
+        _write_varint(out, len(positions))
+        previous = 0
+        for position in positions:
+            _write_varint(out, position - previous)
+            previous = position
+        previous_doc = doc
+    return bytes(out)
+
+
+def _decode(data: bytes) -> Postings:
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    postings: Postings = {}
+    doc = i = 0
+    while i < len(values):
+        doc += values[i]
+        count = values[i + 1]
+        i += 2
+        positions = []
+        position = 0
+        for delta in values[i : i + count]:
+            position += delta
+            positions.append(position)
+        postings[doc] = positions
+        i += count
+    return postings
@@ -0,0 +1,103 @@
+"""Precompiled page property payload templates."""
+
+from functools import lru_cache
+
+from notion_toolkit.schema.constants import ProdCopilotSourceType
+
+
+# Room for every flag combination of the 19 Notion colors; colors are caller
+# supplied strings, so the cache is bounded rather than keyed without limit.
+@lru_cache(maxsize=1024)
+def _annotations(
+    bold: bool,
+    italic: bool,
+    strikethrough: bool,
+    underline: bool,
+    code: bool,
+    color: str,
+) -> dict:
+    return {
+        "bold": bold,
+        "italic": italic,
+        "strikethrough": strikethrough,
+        "underline": underline,
+        "code": code,
+        "color": color,
+    }
+
+
+class ProdCopilotSourcePropertiesTemplate:
+    """
+    Compiled payload template for `ProdCopilotSourceDatabasePageProperties`.
+
+    The invariant parts of the payload (annotations, checkbox and select
+    values, empty tag lists) are built once and shared between rendered
+    payloads, so a row only allocates the dicts holding its own values.
+    Rendered payloads must therefore be treated as read-only.
+    """
+
+    def __init__(self):
+        self._default_annotations = _annotations(
+            False, False, False, False, False, "default"
+        )
+        self._archived = {True: {"checkbox": True}, False: {"checkbox": False}}
+        self._empty_tags = {"type": "multi_select", "multi_select": []}
+        self._source_types = {
+            source_type: {"type": "select", "select": {"name": source_type}}
+            for source_type in ProdCopilotSourceType
+        }
+
+    def render(
+        self,
+        title: str,
+        text_link: str | None = None,
+        bold: bool = False,
+        italic: bool = False,
+        strikethrough: bool = False,
+        underline: bool = False,
+        code: bool = False,
+        color: str = "default",
+        href: str | None = None,
+        archived: bool = False,
+        source_type: ProdCopilotSourceType = ProdCopilotSourceType.WEBPAGE,
+        tags: list[str] | None = None,
+        url: str | None = None,
+    ) -> dict:
+        """Fill the template with the values of one page."""
+        if bold or italic or strikethrough or underline or code or color != "default":
+            annotations = _annotations(
+                bold, italic, strikethrough, underline, code, color
+            )
+        else:
+            annotations = self._default_annotations
+
+        source_type_value = self._source_types.get(source_type)
+        if source_type_value is None:
+            source_type_value = {"type": "select", "select": {"name": source_type}}
+
+        return {
+            "Name": {
+                "id": "title",
+                "type": "title",
+                "title": [
+                    {
+                        "type": "text",
+                        "text": {"content": title, "link": text_link},
+                        "annotations": annotations,
+                        "plain_text": title,
+                        "href": href,
+                    }
+                ],
+            },
+            "Archived": self._archived[bool(archived)],
+            "Tags": (
+                {
+                    "type": "multi_select",
+                    "multi_select": [{"name": tag} for tag in tags],
+                }
+                if tags
+                else self._empty_tags
+            ),
+            "Source_Type": source_type_value,
+            "URL": {"url": url},
+        }
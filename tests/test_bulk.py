@@ -0,0 +1,46 @@
+"""Testing bulk import."""
+
+import threading
+import time
+
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def test_bulk_create_streams_with_backpressure(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    consumed = 0
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def rows():
+        nonlocal consumed
+        for i in range(50):
+            consumed += 1
+            yield {"title": str(i), "tags": ["x"], "url": f"https://example.com/{i}"}
+
+    def create(**kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.001)
+        with lock:
+            in_flight -= 1
+        title = kwargs["properties"]["Name"]["title"][0]["plain_text"]
+        if title == "7":
+            raise ValueError("boom")
+        return {"id": title}
+
+    mocker.patch.object(notion.client.pages, "create", side_effect=create)
+
+    results = notion.bulk_create("db", rows(), max_in_flight=4)
+    first = next(results)
+    assert consumed <= 4
+    results = [first, *results]
+
+    assert sorted(result.index for result in results) == list(range(50))
+    assert peak <= 4
+    failed = [result for result in results if not result.ok]
+    assert [result.row["title"] for result in failed] == ["7"]
+    assert isinstance(failed[0].error, ValueError)
@@ -0,0 +1,65 @@
+"""Testing page cache."""
+
+import pytest
+
+from notion_toolkit.cache import DiskBackend, LRUBackend, PageCache
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def page(page_id, edited="2024-01-01T00:00:00.000Z", title="a"):
+    return {"object": "page", "id": page_id, "last_edited_time": edited, "t": title}
+
+
+def test_lru_backend_evicts_least_recently_used():
+    cache = PageCache(LRUBackend(maxsize=2))
+    cache.put(page("a"))
+    cache.put(page("b"))
+    cache.get("a")
+    cache.put(page("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats.evictions == 1
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_ttl_and_revalidation(mocker):
+    clock = mocker.patch("notion_toolkit.cache.time.time", return_value=0.0)
+    cache = PageCache(ttl=10)
+    cache.put(page("a"))
+
+    clock.return_value = 8.0
+    cache.observe(page("a"))
+    clock.return_value = 15.0
+    assert cache.get("a") is not None
+    assert cache.stats.revalidated == 1
+
+    cache.observe(page("a", edited="2024-01-02T00:00:00.000Z", title="new"))
+    assert cache.get("a")["t"] == "new"
+
+    clock.return_value = 30.0
+    assert cache.get("a") is None
+    assert cache.stats.expired == 1
+
+
+def test_disk_backend_persists(tmp_path):
+    PageCache(DiskBackend(tmp_path / "cache.db")).put(page("a-b"))
+
+    assert PageCache(DiskBackend(tmp_path / "cache.db")).get("AB")["id"] == "a-b"
+
+
+@pytest.mark.parametrize("backend", [None, "disk"])
+def test_retrieve_page_reads_through(mocker, tmp_path, backend):
+    backend = DiskBackend(tmp_path / "cache.db") if backend else None
+    notion = Notion(
+        token="secret",
+        scheduler=RequestScheduler(rate=1000),
+        cache=PageCache(backend),
+    )
+    retrieve = mocker.patch.object(
+        notion.client.pages, "retrieve", return_value=page("a")
+    )
+
+    assert notion.retrieve_page("a") == notion.retrieve_page("a") == page("a")
+    assert retrieve.call_count == 1
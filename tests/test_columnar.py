@@ -0,0 +1,149 @@
+"""Testing columnar database export."""
+
+import csv
+import io
+
+import pytest
+
+from notion_toolkit.columnar import (
+    Column,
+    ColumnType,
+    columns_from_properties,
+    decode_property,
+    export_database,
+    iter_column_batches,
+    write_csv,
+    write_parquet,
+)
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+DATABASE = {
+    "id": "db",
+    "properties": {
+        "Name": {"type": "title", "title": {}},
+        "Tags": {"type": "multi_select", "multi_select": {"options": []}},
+        "Score": {"type": "number", "number": {}},
+        "Done": {"type": "checkbox", "checkbox": {}},
+        "Due": {"type": "date", "date": {}},
+        "Ticket": {"type": "unique_id", "unique_id": {"prefix": "T"}},
+        "Button": {"type": "button", "button": {}},
+    },
+}
+
+
+def page(i):
+    return {
+        "id": f"page-{i}",
+        "url": f"https://www.notion.so/page-{i}",
+        "created_time": "2024-01-01T00:00:00.000Z",
+        "last_edited_time": "2024-01-02T00:00:00.000Z",
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": f"row {i}"}]},
+            "Tags": {"type": "multi_select", "multi_select": [{"name": "a"}]},
+            "Score": {"type": "number", "number": i / 2},
+            "Done": {"type": "checkbox", "checkbox": i % 2 == 0},
+            "Due": {"type": "date", "date": None},
+            "Ticket": {"type": "unique_id", "unique_id": {"prefix": "T", "number": i}},
+        },
+    }
+
+
+def test_decode_property():
+    assert decode_property({"type": "select", "select": {"name": "x"}}) == "x"
+    assert decode_property({"type": "people", "people": [{"id": "u"}]}) == ["u"]
+    assert decode_property(
+        {"type": "formula", "formula": {"type": "date", "date": {"start": "2024"}}}
+    ) == ("2024")
+    assert decode_property(
+        {
+            "type": "rollup",
+            "rollup": {
+                "type": "array",
+                "array": [{"type": "number", "number": 1.0}],
+            },
+        }
+    ) == ["1.0"]
+    assert decode_property({"type": "button", "button": {}}) is None
+
+
+def test_iter_column_batches():
+    columns = columns_from_properties(DATABASE["properties"])
+
+    batches = list(iter_column_batches(map(page, range(5)), columns, batch_size=2))
+
+    assert [column.name for column in columns] == [
+        "page_id",
+        "page_url",
+        "created_time",
+        "last_edited_time",
+        "Name",
+        "Tags",
+        "Score",
+        "Done",
+        "Due",
+        "Ticket",
+    ]
+    assert [len(batch["page_id"]) for batch in batches] == [2, 2, 1]
+    assert batches[0]["Name"] == ["row 0", "row 1"]
+    assert batches[0]["Tags"] == [["a"], ["a"]]
+    assert batches[1]["Ticket"] == ["T-2", "T-3"]
+    assert columns[6].type is ColumnType.FLOAT
+
+
+def test_write_csv():
+    columns = columns_from_properties(DATABASE["properties"])
+    output = io.StringIO()
+
+    rows = write_csv(iter_column_batches(map(page, range(3)), columns), output, columns)
+
+    records = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert rows == len(records) == 3
+    assert records[1]["Name"] == "row 1"
+    assert records[1]["Tags"] == "a"
+    assert records[1]["Done"] == "False"
+    assert records[1]["Due"] == ""
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_export_database_arrow_formats(mocker, tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    mocker.patch.object(notion, "retrieve_database", return_value=DATABASE)
+    mocker.patch.object(notion, "iter_database", return_value=map(page, range(5)))
+    path = tmp_path / f"rows.{format}"
+
+    assert export_database(notion, "db", str(path), format, batch_size=2) == 5
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(str(path)).read_all()
+    assert table.num_rows == 5
+    assert table.schema.field("Score").type == pa.float64()
+    assert table.schema.field("Tags").type == pa.list_(pa.string())
+    assert pa.types.is_timestamp(table.schema.field("created_time").type)
+    assert table.column("Ticket").to_pylist()[-1] == "T-4"
+
+
+def test_write_parquet_infers_type_after_empty_batches(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    columns = [
+        Column("Total", ColumnType.INFER, lambda page: page),
+        Column("Empty", ColumnType.INFER, lambda page: None),
+    ]
+    pages = [None, None, 3, None, 4.5]
+    path = tmp_path / "rows.parquet"
+
+    assert (
+        write_parquet(iter_column_batches(pages, columns, 2), str(path), columns) == 5
+    )
+
+    table = pq.read_table(path)
+    assert table.schema.field("Total").type == pa.float64()
+    assert table.schema.field("Empty").type == pa.string()
+    assert table.column("Total").to_pylist() == [None, None, 3.0, None, 4.5]
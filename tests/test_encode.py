@@ -0,0 +1,72 @@
+"""Testing request body serialization."""
+
+import json
+
+import httpx
+
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.schema.encode import dumps
+from notion_toolkit.schema.parent import DatabaseParent
+from notion_toolkit.schema.rich_text import Annotations, RichText, TextObject
+
+
+def test_dumps_omits_unset_fields():
+    span = RichText.create_for_text("hello")
+
+    assert dumps(span) == (
+        b'{"type":"text","text":{"content":"hello"},"plain_text":"hello"}'
+    )
+    assert json.loads(dumps(span, exclude_unset=False))["annotations"] == (
+        Annotations().model_dump(mode="json")
+    )
+
+
+def test_dumps_sends_defaults_set_explicitly():
+    span = RichText(
+        type="text",
+        text=TextObject(content="a", link=None),
+        annotations=Annotations(bold=False),
+        plain_text="a",
+    )
+
+    assert json.loads(dumps(span)) == {
+        "type": "text",
+        "text": {"content": "a", "link": None},
+        "annotations": {"bold": False},
+        "plain_text": "a",
+    }
+
+
+def test_dumps_mixed_body_matches_model_dump():
+    styled = RichText.create_for_text("bold", link="https://example.com")
+    styled.annotations = Annotations(bold=True)
+    body = {
+        "parent": DatabaseParent(database_id="db"),
+        "properties": {"Name": {"title": [styled]}},
+    }
+
+    assert json.loads(dumps(body)) == {
+        "parent": {"database_id": "db"},
+        "properties": {
+            "Name": {"title": [styled.model_dump(mode="json", exclude_unset=True)]}
+        },
+    }
+
+
+def test_request_json_sends_encoded_bytes():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"object": "page", "id": "1"})
+
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    notion.client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    response = notion.request_json("pages", {"title": [RichText.create_for_text("a")]})
+
+    assert response == {"object": "page", "id": "1"}
+    assert requests[0].url == "https://api.notion.com/v1/pages"
+    assert requests[0].headers["Authorization"] == "Bearer secret"
+    assert requests[0].content == dumps({"title": [RichText.create_for_text("a")]})
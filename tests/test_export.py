@@ -0,0 +1,164 @@
+"""Testing block tree fetch and page export."""
+
+import io
+import json
+import time
+
+from notion_toolkit.export import export_page, iter_markdown
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def span(text, **annotations):
+    return {"type": "text", "plain_text": text, "annotations": annotations}
+
+
+def block(id, type="paragraph", text="", has_children=False, **content):
+    return {
+        "id": id,
+        "type": type,
+        "has_children": has_children,
+        type: {"rich_text": [span(text or id)], **content},
+    }
+
+
+def fake_children(mocker, notion, tree, latency=0.0):
+    """Serve `tree` (parent id -> children) one block per page of results."""
+
+    def list_block_children(block_id, start_cursor=None):
+        time.sleep(latency)
+        children = tree.get(block_id, [])
+        index = int(start_cursor or 0)
+        more = index + 1 < len(children)
+        return {
+            "results": children[index : index + 1],
+            "has_more": more,
+            "next_cursor": str(index + 1) if more else None,
+        }
+
+    return mocker.patch.object(
+        notion, "list_block_children", side_effect=list_block_children
+    )
+
+
+def wide_tree(width, depth):
+    tree = {}
+    parents = ["page"]
+    for level in range(depth):
+        children = []
+        for parent in parents:
+            tree[parent] = [
+                block(f"{parent}.{i}", has_children=level + 1 < depth)
+                for i in range(width)
+            ]
+            children.extend(child["id"] for child in tree[parent])
+        parents = children
+    return tree
+
+
+def test_iter_block_tree_document_order_and_max_depth(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    fake_children(mocker, notion, wide_tree(width=2, depth=3))
+
+    tree = list(notion.iter_block_tree("page"))
+
+    assert len(tree) == 2 + 4 + 8
+    assert [(depth, b["id"]) for depth, b in tree[:4]] == [
+        (0, "page.0"),
+        (1, "page.0.0"),
+        (2, "page.0.0.0"),
+        (2, "page.0.0.1"),
+    ]
+    assert {depth for depth, _ in notion.iter_block_tree("page", max_depth=1)} == {
+        0,
+        1,
+    }
+
+
+def test_iter_block_tree_fetches_levels_concurrently(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    tree = wide_tree(width=4, depth=3)
+    calls = fake_children(mocker, notion, tree, latency=0.02)
+
+    start = time.perf_counter()
+    blocks = list(notion.iter_block_tree("page", max_in_flight=16))
+    elapsed = time.perf_counter() - start
+
+    assert len(blocks) == 4 + 16 + 64
+    assert calls.call_count == sum(len(children) for children in tree.values())
+    # 84 sequential calls would take at least 1.7s.
+    assert elapsed < calls.call_count * 0.02 / 3
+
+
+def test_iter_block_tree_bounds_lookahead(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    tree = wide_tree(width=4, depth=3)
+    calls = fake_children(mocker, notion, tree)
+
+    blocks = notion.iter_block_tree("page", max_in_flight=4, max_lookahead=2)
+    first = next(blocks)
+    time.sleep(0.1)
+
+    def fetched():
+        return {call.args[0] for call in calls.call_args_list}
+
+    assert first == (0, tree["page"][0])
+    # The page itself, then no more than two lists ahead of the iteration.
+    assert len(fetched()) == 3
+    assert len([first, *blocks]) == 4 + 16 + 64
+    assert fetched() == set(tree)
+
+
+def test_export_page_markdown(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    code = {"rich_text": [span("x = 1")], "language": "python"}
+    fake_children(
+        mocker,
+        notion,
+        {
+            "page": [
+                block("h", "heading_1", "Title"),
+                block("li", "bulleted_list_item", "item", has_children=True),
+                {"id": "c", "type": "code", "has_children": False, "code": code},
+                {
+                    "id": "p",
+                    "type": "paragraph",
+                    "has_children": False,
+                    "paragraph": {
+                        "rich_text": [span("bold", bold=True), span(" and plain")]
+                    },
+                },
+            ],
+            "li": [block("todo", "to_do", "done", checked=True)],
+        },
+    )
+    output = io.StringIO()
+
+    assert export_page(notion, "page", output) == 5
+    assert output.getvalue() == (
+        "# Title\n\n- item\n    - [x] done\n\n```python\nx = 1\n```\n\n"
+        "**bold** and plain\n\n"
+    )
+
+
+def test_export_page_jsonl(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    fake_children(
+        mocker, notion, {"page": [block("a", has_children=True)], "a": [block("b")]}
+    )
+    output = io.StringIO()
+
+    export_page(notion, "page", output, format="jsonl")
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [(line["depth"], line["id"]) for line in lines] == [(0, "a"), (1, "b")]
+
+
+def test_iter_markdown_is_incremental():
+    def tree():
+        yield 0, block("one")
+        raise RuntimeError("stream interrupted")
+
+    chunks = iter_markdown(tree())
+
+    assert next(chunks) == "one\n\n"
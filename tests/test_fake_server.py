@@ -0,0 +1,198 @@
+"""Testing the local Notion API stand-in."""
+
+import time
+
+import httpx
+import pytest
+from notion_client.errors import APIResponseError
+
+from notion_toolkit.fake_server import FakeNotionServer
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.schema.block import Block
+
+
+@pytest.fixture
+def server():
+    with FakeNotionServer() as server:
+        yield server
+
+
+def client(server, **kwargs):
+    scheduler = RequestScheduler(rate=1000, backoff_base=0.01, **kwargs)
+    return Notion(token="secret", scheduler=scheduler, base_url=server.base_url)
+
+
+def test_pages_round_trip(server):
+    database_id = server.add_database()["id"]
+    notion = client(server)
+
+    created = notion.create_page(database_id, title="hello", tags=["a", "b"])
+    retrieved = notion.retrieve_page(created["id"])
+
+    assert retrieved["id"] == created["id"]
+    assert retrieved["properties"]["Name"]["title"][0]["plain_text"] == "hello"
+    assert [
+        option["name"] for option in retrieved["properties"]["Tags"]["multi_select"]
+    ] == [
+        "a",
+        "b",
+    ]
+    assert notion.retrieve_database(database_id)["properties"]["Tags"]["type"] == (
+        "multi_select"
+    )
+    with pytest.raises(APIResponseError) as error:
+        notion.retrieve_page("00000000-0000-0000-0000-000000000000")
+    assert error.value.code == "object_not_found"
+
+
+def test_query_filters_sorts_and_pages(server):
+    database_id = server.add_database()["id"]
+    notion = client(server)
+    for i in range(150):
+        notion.create_page(
+            database_id, title=f"page {i}", tags=["even" if i % 2 else "odd"]
+        )
+
+    pages = list(
+        notion.iter_database(
+            database_id,
+            filter={"property": "Tags", "multi_select": {"contains": "odd"}},
+            sorts=[{"property": "Name", "direction": "descending"}],
+        )
+    )
+
+    assert len(pages) == 75
+    titles = [page["properties"]["Name"]["title"][0]["plain_text"] for page in pages]
+    assert titles == sorted(titles, reverse=True)
+    assert server.requests["query_database"] == 1
+
+    mirror = DatabaseMirror(notion, database_id)
+    assert mirror.sync() == 150
+    assert server.requests["query_database"] == 3
+
+
+def test_block_children_append_and_list(server):
+    database_id = server.add_database()["id"]
+    notion = client(server)
+    page_id = notion.create_page(database_id, title="doc")["id"]
+    blocks = [
+        Block.create(
+            "toggle", f"section {i}", children=[Block.create("paragraph", "x")]
+        )
+        for i in range(120)
+    ]
+
+    created = notion.append_blocks(page_id, blocks)
+    tree = list(notion.iter_block_tree(page_id))
+
+    assert len(created) == 120
+    assert [depth for depth, _ in tree[:2]] == [0, 1]
+    assert len(tree) == 240
+    assert server.requests["append_children"] == 2 + 120
+    with pytest.raises(APIResponseError) as error:
+        notion.request_json(
+            f"blocks/{page_id}/children",
+            {"children": [Block.create("paragraph", "x" * 2001)]},
+            method="PATCH",
+        )
+    assert error.value.code == "validation_error"
+
+
+def test_sorts_put_empty_values_last(server):
+    database_id = server.add_database({"Name": "title", "Score": "number"})["id"]
+    for i, score in enumerate([2, None, 1]):
+        server.state.create_page(
+            {
+                "parent": {"database_id": database_id},
+                "properties": {
+                    "Name": {"title": [{"text": {"content": str(i)}}]},
+                    "Score": {"number": score},
+                },
+            }
+        )
+
+    def names(direction):
+        response = httpx.post(
+            f"{server.base_url}/v1/databases/{database_id}/query",
+            headers={"Authorization": "Bearer x"},
+            json={"sorts": [{"property": "Score", "direction": direction}]},
+        )
+        return [
+            page["properties"]["Name"]["title"][0]["plain_text"]
+            for page in response.json()["results"]
+        ]
+
+    assert names("ascending") == ["2", "0", "1"]
+    assert names("descending") == ["0", "2", "1"]
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("pages", {"properties": "x"}),
+        ("pages", {"properties": {"Name": "x"}}),
+        ("pages", {"properties": {"Name": {}}}),
+        ("pages", {"properties": {"Name": {"type": "title"}}}),
+        ("pages", {"properties": {"Name": {"title": "x"}}}),
+        ("pages", {"properties": {"Name": {"title": ["x"]}}}),
+        ("children", {"children": ["x"]}),
+        ("children", {"children": [{}]}),
+        ("children", {"children": [{"paragraph": "x"}]}),
+        ("children", {"children": [{"paragraph": {"rich_text": "x"}}]}),
+    ],
+)
+def test_malformed_bodies_are_validation_errors(server, path, body):
+    database_id = server.add_database()["id"]
+    page_id = server.state.create_page({"parent": {"database_id": database_id}})["id"]
+    headers = {"Authorization": "Bearer x"}
+
+    if path == "pages":
+        body = {"parent": {"database_id": database_id}, **body}
+        response = httpx.post(f"{server.base_url}/v1/pages", headers=headers, json=body)
+    else:
+        response = httpx.patch(
+            f"{server.base_url}/v1/blocks/{page_id}/children",
+            headers=headers,
+            json=body,
+        )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "validation_error"
+
+
+def test_rate_limit_with_retry_after():
+    # Slow enough that no token comes back between the two requests.
+    with FakeNotionServer(rate=0.5, burst=1, retry_after_precision=2) as slow:
+        response = httpx.post(
+            f"{slow.base_url}/v1/pages", headers={"Authorization": "Bearer x"}
+        )
+        assert response.status_code == 400
+        response = httpx.post(
+            f"{slow.base_url}/v1/pages", headers={"Authorization": "Bearer x"}
+        )
+        assert response.status_code == 429
+        assert float(response.headers["Retry-After"]) > 0
+
+    with FakeNotionServer(rate=2, burst=1, retry_after_precision=2) as limited:
+        database_id = limited.add_database()["id"]
+        notion = client(limited)
+        # Take the only token, so the create is answered 429 before it succeeds.
+        assert limited.limiter.acquire() == 0
+
+        notion.create_page(database_id, title="page")
+
+        assert notion.scheduler.rate_limited_count == 1
+        assert limited.requests["create_page"] == 1
+
+
+def test_latency_and_jitter():
+    with FakeNotionServer(latency=0.05, jitter=0.02) as server:
+        notion = client(server)
+        database_id = server.add_database()["id"]
+
+        start = time.perf_counter()
+        notion.retrieve_database(database_id)
+
+        assert 0.05 <= time.perf_counter() - start < 0.5
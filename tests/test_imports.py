@@ -0,0 +1,55 @@
+"""Testing lazy imports and deferred model building."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import notion_toolkit.schema
+
+
+def loaded_after(code: str) -> set[str]:
+    """Modules loaded by running `code` in a fresh interpreter."""
+    probe = f"import sys\n{code}\nimport json\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(output))
+
+
+def test_schema_package_loads_no_models():
+    loaded = loaded_after("import notion_toolkit.schema")
+
+    assert "pydantic" not in loaded
+    assert "notion_toolkit.schema.rich_text" not in loaded
+
+
+def test_client_import_skips_pydantic():
+    loaded = loaded_after("import notion_toolkit.notion")
+
+    assert "notion_client" in loaded
+    assert "pydantic" not in loaded
+    assert "email_validator" not in loaded
+
+
+def test_models_build_on_first_use():
+    loaded = loaded_after(
+        "from notion_toolkit.schema.page_properties import Email\n"
+        "assert not Email.__pydantic_complete__\n"
+        "import sys; assert 'email_validator' not in sys.modules\n"
+        "Email.model_validate({'type': 'email', 'email': 'a@example.com'})\n"
+        "assert Email.__pydantic_complete__"
+    )
+
+    assert "email_validator" in loaded
+
+
+def test_lazy_names():
+    from notion_toolkit.schema.block import Block
+
+    assert notion_toolkit.schema.Block is Block
+    assert "LazyPage" in dir(notion_toolkit.schema)
+    assert set(notion_toolkit.schema.__all__) <= set(dir(notion_toolkit.schema))
+    with pytest.raises(AttributeError):
+        notion_toolkit.schema.Missing
@@ -0,0 +1,75 @@
+"""Testing local indexes."""
+
+import time
+
+from notion_toolkit.index import UrlIndex
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def page(page_id, url):
+    return {"object": "page", "id": page_id, "properties": {"URL": {"url": url}}}
+
+
+def test_url_index_from_pages():
+    index = UrlIndex.from_pages([page("1", "https://a"), page("2", None)])
+
+    assert index.get("https://a") == "1"
+    assert index.get(None) is None
+    assert "https://b" not in index
+    assert len(index) == 1
+
+
+def test_upsert_page_updates_existing_url(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    query = mocker.patch.object(
+        notion.client.databases,
+        "query",
+        side_effect=[
+            {"results": [page("1", "https://a")], "has_more": True, "next_cursor": "c"},
+            {"results": [page("2", "https://b")], "has_more": False},
+        ],
+    )
+    update = mocker.patch.object(notion.client.pages, "update", return_value={})
+    create = mocker.patch.object(
+        notion.client.pages,
+        "create",
+        side_effect=lambda **kwargs: page("3", kwargs["properties"]["URL"]["url"]),
+    )
+
+    notion.upsert_page("db", title="a", url="https://b")
+    notion.upsert_page("db", title="c", url="https://c")
+    notion.upsert_page("db", title="c again", url="https://c")
+
+    assert query.call_count == 2
+    assert create.call_count == 1
+    assert [call.kwargs["page_id"] for call in update.call_args_list] == ["2", "3"]
+
+
+def test_bulk_upsert_creates_duplicate_urls_once(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000, burst=8))
+    mocker.patch.object(
+        notion.client.databases,
+        "query",
+        return_value={"results": [], "has_more": False},
+    )
+    update = mocker.patch.object(notion.client.pages, "update", return_value={})
+
+    def slow_create(**kwargs):
+        time.sleep(0.05)
+        url = kwargs["properties"]["URL"]["url"]
+        return page(f"page-{url}", url)
+
+    create = mocker.patch.object(notion.client.pages, "create", side_effect=slow_create)
+    rows = [{"title": str(i), "url": f"https://{i % 2}"} for i in range(6)]
+
+    results = list(notion.bulk_create("db", rows, max_in_flight=6, upsert=True))
+
+    assert all(result.ok for result in results)
+    assert create.call_count == 2
+    assert sorted(call.kwargs["page_id"] for call in update.call_args_list) == [
+        "page-https://0",
+        "page-https://0",
+        "page-https://1",
+        "page-https://1",
+    ]
@@ -0,0 +1,58 @@
+"""Testing import journal."""
+
+from notion_toolkit.journal import ImportJournal
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def test_key_is_stable_and_order_independent():
+    assert ImportJournal.key("db", {"title": "a", "url": "u"}) == ImportJournal.key(
+        "db", {"url": "u", "title": "a"}
+    )
+    assert ImportJournal.key("db", {"title": "a"}) != ImportJournal.key(
+        "other", {"title": "a"}
+    )
+
+
+def test_in_flight_keys(tmp_path):
+    with ImportJournal(tmp_path / "journal.db") as journal:
+        journal.begin("a")
+        journal.done("a", "page-a")
+        journal.begin("b")
+        journal.failed("c")
+        journal.begin("c")
+
+        assert journal.page_id("a") == "page-a"
+        assert journal.page_id("b") is None
+        assert sorted(journal.in_flight()) == ["b", "c"]
+
+
+def test_bulk_create_resumes_from_journal(mocker, tmp_path):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    rows = [{"title": str(i)} for i in range(10)]
+    calls = 0
+
+    def create(**kwargs):
+        nonlocal calls
+        calls += 1
+        title = kwargs["properties"]["Name"]["title"][0]["plain_text"]
+        if calls > 6:
+            raise RuntimeError("crash")
+        return {"object": "page", "id": f"page-{title}"}
+
+    mocker.patch.object(notion.client.pages, "create", side_effect=create)
+    path = tmp_path / "journal.db"
+
+    with ImportJournal(path) as journal:
+        first_run = list(notion.bulk_create("db", rows, 1, journal=journal))
+    assert sum(result.ok for result in first_run) == 6
+
+    calls = -100
+    with ImportJournal(path) as journal:
+        second_run = list(notion.bulk_create("db", rows, 1, journal=journal))
+
+    assert calls == -96
+    assert [result.resumed for result in second_run] == [True] * 6 + [False] * 4
+    assert {result.response["id"] for result in second_run} == {
+        f"page-{i}" for i in range(10)
+    }
@@ -0,0 +1,82 @@
+"""Testing lazy page responses."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from notion_toolkit.schema import LazyPage
+from notion_toolkit.schema.page_properties import MultiSelect, Title
+
+RAW_PAGE = {
+    "object": "page",
+    "id": "59833787-2cf9-4fdf-8782-e53db20768a5",
+    "created_time": "2022-03-01T19:05:00.000Z",
+    "last_edited_time": "2022-07-06T20:25:00.000Z",
+    "archived": False,
+    "url": "https://www.notion.so/59833787",
+    "properties": {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [
+                {
+                    "type": "text",
+                    "text": {"content": "Tuscan kale", "link": None},
+                    "annotations": {
+                        "bold": False,
+                        "italic": False,
+                        "strikethrough": False,
+                        "underline": False,
+                        "code": False,
+                        "color": "default",
+                    },
+                    "plain_text": "Tuscan kale",
+                    "href": None,
+                }
+            ],
+        },
+        "Tags": {
+            "id": "a",
+            "type": "multi_select",
+            "multi_select": [{"id": "1", "name": "ml", "color": "red"}],
+        },
+        "Price": {"id": "b", "type": "number", "number": "not a number"},
+        "Order": {"id": "c", "type": "button", "button": {}},
+    },
+}
+
+
+def test_top_level_fields():
+    page = LazyPage(RAW_PAGE)
+
+    assert page.id == RAW_PAGE["id"]
+    assert page.last_edited_time == datetime(2022, 7, 6, 20, 25, tzinfo=timezone.utc)
+    assert page.properties.validated_count == 0
+
+
+def test_properties_are_validated_on_first_access_only():
+    page = LazyPage(RAW_PAGE)
+
+    title = page["Name"]
+    assert isinstance(title, Title)
+    assert title.title[0].plain_text == "Tuscan kale"
+    assert page.properties["Name"] is title
+    assert isinstance(page.properties["Tags"], MultiSelect)
+    assert page.properties.validated_count == 2
+    assert set(page.properties) == {"Name", "Tags", "Price", "Order"}
+
+
+def test_invalid_property_fails_only_when_read():
+    page = LazyPage(RAW_PAGE)
+
+    assert page["Tags"].multi_select[0].name == "ml"
+    with pytest.raises(ValidationError):
+        page["Price"]
+
+
+def test_unknown_property_type_is_returned_raw():
+    page = LazyPage(RAW_PAGE)
+
+    assert page.properties.get("Order") == RAW_PAGE["properties"]["Order"]
+    assert page.properties.validated_count == 0
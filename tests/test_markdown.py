@@ -0,0 +1,91 @@
+"""Testing Markdown conversion."""
+
+import io
+
+from notion_toolkit.markdown import (
+    batched_blocks,
+    markdown_to_blocks,
+    split_content,
+    text_to_rich_text,
+)
+from notion_toolkit.schema.constants import MAX_ARRAY_LENGTH, MAX_TEXT_LENGTH
+
+
+def texts(block):
+    return [span.plain_text for span in block[block["type"]]["rich_text"]]
+
+
+def test_split_content_respects_limit_and_words():
+    text = "word " * 1000
+
+    chunks = list(split_content(text))
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= MAX_TEXT_LENGTH for chunk in chunks)
+    assert all(chunk.endswith(" ") for chunk in chunks[:-1])
+    assert list(split_content("x" * 4500)) == ["x" * 2000, "x" * 2000, "x" * 500]
+
+
+def test_inline_annotations_and_links():
+    spans = list(
+        text_to_rich_text(
+            "a **b** *c* `d` ~~e~~ [f](https://example.com) [g](#anchor) snake_case"
+        )
+    )
+
+    styled = {
+        span.plain_text: span.annotations for span in spans if span.plain_text.strip()
+    }
+    assert styled["b"].bold
+    assert styled["c"].italic
+    assert styled["d"].code
+    assert styled["e"].strikethrough
+    assert [span.href for span in spans if span.plain_text in "fg"] == [
+        "https://example.com/",
+        None,
+    ]
+    assert spans[-1].plain_text == " snake_case"
+
+
+def test_block_types():
+    source = io.StringIO(
+        "# Title\n\nfirst line\nsecond line\n\n- item\n1. step\n> quote\n---\n"
+        "```py\nprint(1)\n```\n"
+    )
+
+    blocks = list(markdown_to_blocks(source))
+
+    assert [block["type"] for block in blocks] == [
+        "heading_1",
+        "paragraph",
+        "bulleted_list_item",
+        "numbered_list_item",
+        "quote",
+        "divider",
+        "code",
+    ]
+    assert texts(blocks[1]) == ["first line\nsecond line"]
+    assert blocks[-1]["code"]["language"] == "python"
+    assert texts(blocks[-1]) == ["print(1)"]
+
+
+def test_long_paragraphs_are_split_across_blocks():
+    source = " ".join(["**bold** plain"] * 150)
+
+    blocks = list(markdown_to_blocks(source))
+
+    assert len(blocks) == 3
+    assert all(len(texts(block)) <= MAX_ARRAY_LENGTH for block in blocks)
+    assert "".join("".join(texts(block)) for block in blocks) == source.replace(
+        "**", ""
+    )
+
+
+def test_huge_lines_stay_within_limits():
+    line = "x" * (MAX_TEXT_LENGTH * MAX_ARRAY_LENGTH * 2 + 10)
+
+    blocks = list(markdown_to_blocks(iter([line])))
+
+    assert len(blocks) == 3
+    assert sum(len("".join(texts(block))) for block in blocks) == len(line)
+    assert [len(batch) for batch in batched_blocks(range(250))] == [100, 100, 50]
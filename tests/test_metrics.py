@@ -0,0 +1,112 @@
+"""Testing client metrics and tracing hooks."""
+
+import asyncio
+
+import pytest
+
+from notion_toolkit.fake_server import FakeNotionServer
+from notion_toolkit.metrics import Histogram, Metrics, endpoint
+from notion_toolkit.notion import AsyncNotion, Notion
+from notion_toolkit.scheduler import Priority, RequestScheduler
+
+
+def test_endpoint_replaces_ids():
+    assert endpoint("/v1/pages") == "/v1/pages"
+    assert endpoint("/v1/pages/abc-123") == "/v1/pages/{id}"
+    assert endpoint("/v1/blocks/abc/children") == "/v1/blocks/{id}/children"
+    assert endpoint("/v1/pages/abc/properties/title") == (
+        "/v1/pages/{id}/properties/{id}"
+    )
+    assert endpoint("/v1/users/me") == "/v1/users/me"
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.65)
+
+
+def test_prometheus_text():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.on_request("POST", "/v1/pages", 200, 0.05, 120, 800)
+    metrics.on_request("POST", "/v1/pages", 429, 0.5, 120, 90)
+    metrics.on_queue_wait(Priority.LOW, 2.0)
+    metrics.on_rate_limited(1.0)
+    metrics.on_retry(1, 0.3)
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE notion_request_duration_seconds histogram" in text
+    assert (
+        'notion_request_duration_seconds_bucket{method="POST",'
+        'endpoint="/v1/pages",le="0.1"} 1'
+    ) in text
+    assert (
+        'notion_request_duration_seconds_count{method="POST",endpoint="/v1/pages"} 2'
+    ) in text
+    assert (
+        'notion_requests_total{method="POST",endpoint="/v1/pages",status="429"} 1'
+    ) in text
+    assert 'notion_request_bytes_total{method="POST",endpoint="/v1/pages"} 240' in text
+    assert 'notion_queue_wait_seconds_bucket{priority="low",le="1"} 0' in text
+    assert "notion_rate_limited_total 1" in text
+    assert "notion_retries_total 1" in text
+
+
+def test_client_reports_requests_and_retries():
+    metrics = Metrics()
+    with FakeNotionServer(rate=20, burst=1, retry_after_precision=2) as server:
+        database_id = server.add_database()["id"]
+        scheduler = RequestScheduler(
+            rate=1000, backoff_base=0.01, instrumentation=metrics
+        )
+        notion = Notion(
+            token="secret",
+            scheduler=scheduler,
+            base_url=server.base_url,
+            instrumentation=metrics,
+        )
+
+        created = [notion.create_page(database_id, title=str(i)) for i in range(4)]
+        notion.retrieve_page(created[0]["id"])
+
+    assert metrics.rate_limited > 0
+    assert metrics.retries == metrics.rate_limited
+    assert metrics.requests[("POST", "/v1/pages", 200)] == 4
+    assert (
+        sum(count for key, count in metrics.requests.items() if key[2] == 429)
+        == metrics.rate_limited
+    )
+    assert metrics.requests[("GET", "/v1/pages/{id}", 200)] == 1
+    assert (
+        sum(histogram.count for histogram in metrics.latency.values())
+        == 5 + metrics.rate_limited
+    )
+    assert metrics.request_bytes[("POST", "/v1/pages")] > 0
+    assert metrics.response_bytes[("GET", "/v1/pages/{id}")] > 0
+    assert metrics.queue_wait["normal"].count == 5 + metrics.rate_limited
+    assert metrics.phases["payload"].count == 4
+
+
+def test_async_client_reports_requests():
+    metrics = Metrics()
+    with FakeNotionServer() as server:
+        database_id = server.add_database()["id"]
+        notion = AsyncNotion(
+            token="secret", base_url=server.base_url, instrumentation=metrics
+        )
+
+        asyncio.run(notion.retrieve_database(database_id))
+
+    assert metrics.requests[("GET", "/v1/databases/{id}", 200)] == 1
+    assert metrics.queue_wait["normal"].count == 1
+
+
+def test_no_http_hooks_without_instrumentation():
+    notion = Notion(token="secret")
+
+    assert notion.client.client.event_hooks["response"] == []
@@ -0,0 +1,49 @@
+"""Testing local database mirror."""
+
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+
+
+def page(page_id, edited):
+    return {"object": "page", "id": page_id, "last_edited_time": edited}
+
+
+def results(*pages):
+    return {"results": list(pages), "has_more": False, "next_cursor": None}
+
+
+def test_incremental_sync(mocker, tmp_path):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    query = mocker.patch.object(
+        notion.client.databases,
+        "query",
+        side_effect=[
+            results(
+                page("a", "2024-01-01T00:00:00.000Z"),
+                page("b", "2024-01-02T00:00:00.000Z"),
+            ),
+            results(
+                page("b", "2024-01-02T00:00:00.000Z"),
+                page("c", "2024-01-03T00:00:00.000Z"),
+            ),
+            results(page("c", "2024-01-03T00:00:00.000Z")),
+        ],
+    )
+    mirror = DatabaseMirror(notion, "db", tmp_path / "mirror.db", batch_size=1)
+
+    assert mirror.sync() == 2
+    assert "filter" not in query.call_args.kwargs
+    assert mirror.sync() == 2
+    assert query.call_args.kwargs["filter"] == {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": "2024-01-02T00:00:00.000Z"},
+    }
+    assert mirror.high_water_mark == "2024-01-03T00:00:00.000Z"
+    assert len(mirror) == 3
+    assert [p["id"] for p in mirror.pages()] == ["c", "b", "a"]
+
+    assert mirror.sync(full=True) == 1
+    assert len(mirror) == 1
+    assert mirror.get("a") is None
+    assert mirror.get("c")["last_edited_time"] == "2024-01-03T00:00:00.000Z"
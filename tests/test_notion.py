@@ -0,0 +1,116 @@
+"""Testing notion clients."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from notion_toolkit.notion import AsyncNotion, Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.schema.block import Block
+
+
+def test_create_page(mocker):
+    notion = Notion(token="secret")
+    create = mocker.patch.object(
+        notion.client.pages, "create", return_value={"id": "1"}
+    )
+
+    assert notion.create_page(database_id="db", title="hello", tags=["a"]) == {
+        "id": "1"
+    }
+
+    kwargs = create.call_args.kwargs
+    assert kwargs["parent"] == {"database_id": "db"}
+    assert kwargs["properties"]["Name"]["title"][0]["plain_text"] == "hello"
+    assert kwargs["properties"]["Tags"]["multi_select"] == [{"name": "a"}]
+
+
+def test_async_create_pages_bounded_concurrency(mocker):
+    notion = AsyncNotion(token="secret", scheduler=RequestScheduler(rate=1000))
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"title": kwargs["properties"]["Name"]["title"][0]["plain_text"]}
+
+    mocker.patch.object(notion.client.pages, "create", side_effect=create)
+    rows = ({"database_id": "db", "title": str(i)} for i in range(20))
+
+    responses = asyncio.run(notion.create_pages(rows, max_in_flight=4))
+
+    assert [response["title"] for response in responses] == [str(i) for i in range(20)]
+    assert peak == 4
+
+
+def test_async_create_pages_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncNotion(token="secret").create_pages([], max_in_flight=0))
+
+
+def test_iter_database_prefetches_next_page(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    query = mocker.patch.object(
+        notion.client.databases,
+        "query",
+        side_effect=[
+            {"results": [1, 2], "has_more": True, "next_cursor": "a"},
+            {"results": [3], "has_more": True, "next_cursor": "b"},
+            {"results": [4], "has_more": False, "next_cursor": None},
+        ],
+    )
+
+    pages = notion.iter_database("db", filter={"property": "Archived"}, page_size=2)
+    assert next(pages) == 1
+    waited = 0
+    while query.call_count < 2 and waited < 100:
+        time.sleep(0.01)
+        waited += 1
+
+    assert query.call_count == 2
+    assert [1, *pages] == [1, 2, 3, 4]
+    assert [call.kwargs.get("start_cursor") for call in query.call_args_list] == [
+        None,
+        "a",
+        "b",
+    ]
+    assert all(call.kwargs["page_size"] == 2 for call in query.call_args_list)
+
+
+def test_append_blocks_batches_and_uploads_nested_children(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    lock = threading.Lock()
+    appended = {}
+    ids = iter(range(10_000))
+
+    def send(path, method, content):
+        children = json.loads(content)["children"]
+        parent = path.split("/")[1]
+        with lock:
+            appended.setdefault(parent, []).append(len(children))
+            results = [{"id": f"b{next(ids)}"} for _ in children]
+        return {"results": results}
+
+    mocker.patch.object(notion, "_send_json", side_effect=send)
+    blocks = [
+        Block.create(
+            "bulleted_list_item",
+            str(i),
+            children=[Block.create("paragraph", "child")] * (150 if i < 2 else 0),
+        )
+        for i in range(250)
+    ]
+
+    created = notion.append_blocks("page", iter(blocks), max_in_flight=4)
+
+    assert [block["id"] for block in created] == [f"b{i}" for i in range(250)]
+    assert appended.pop("page") == [100, 100, 50]
+    assert sorted(appended) == ["b0", "b1"]
+    assert all(batches == [100, 50] for batches in appended.values())
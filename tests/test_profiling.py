@@ -0,0 +1,91 @@
+"""Testing the profiling reports."""
+
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from notion_toolkit import profiling
+from notion_toolkit.profiling import Area, area_of, profiled, traced_memory
+from notion_toolkit.schema.rich_text import RichText
+from notion_toolkit.template import ProdCopilotSourcePropertiesTemplate
+
+
+def test_area_of():
+    site = "/venv/lib/python3.11/site-packages"
+    assert area_of("/repo/src/notion_toolkit/notion.py") is Area.TOOLKIT
+    assert area_of(f"{site}/pydantic/main.py") is Area.PYDANTIC
+    assert area_of(f"{site}/httpx/_client.py") is Area.HTTP
+    assert area_of(f"{site}/notion_client/client.py") is Area.HTTP
+    assert area_of("/usr/lib/python3.11/http/client.py") is Area.HTTP
+    assert area_of("/usr/lib/python3.11/ssl.py") is Area.HTTP
+    assert area_of("/usr/lib/python3.11/json/encoder.py") is Area.OTHER
+    assert area_of("~", "<method 'recv_into' of '_socket.socket' objects>") is Area.HTTP
+    assert (
+        area_of(
+            "~",
+            "<method 'validate_python' of "
+            "'pydantic_core._pydantic_core.SchemaValidator' objects>",
+        )
+        is Area.PYDANTIC
+    )
+
+
+def test_profiled_includes_worker_threads():
+    template = ProdCopilotSourcePropertiesTemplate()
+    report = io.StringIO()
+
+    with profiled(top=5, file=report):
+        with ThreadPoolExecutor(2) as executor:
+            list(executor.map(lambda i: template.render(title=str(i)), range(50)))
+
+    text = report.getvalue()
+    assert "CPU time by area" in text
+    assert "Top toolkit functions:" in text
+    assert "notion_toolkit/template.py" in text
+
+
+def test_profiled_collects_threads_running_on_exit():
+    template = ProdCopilotSourcePropertiesTemplate()
+    rendered, release = threading.Event(), threading.Event()
+    report = io.StringIO()
+
+    def work():
+        template.render(title="x")
+        rendered.set()
+        release.wait()
+
+    with profiled(top=5, file=report):
+        thread = threading.Thread(target=work)
+        thread.start()
+        rendered.wait()
+    release.set()
+    thread.join()
+
+    assert "notion_toolkit/template.py" in report.getvalue()
+
+
+def test_profiled_uses_one_profiler_without_per_thread_profilers(mocker):
+    mocker.patch.object(profiling, "PER_THREAD_PROFILERS", False)
+    template = ProdCopilotSourcePropertiesTemplate()
+    report = io.StringIO()
+
+    with profiled(top=5, file=report) as profilers:
+        with ThreadPoolExecutor(2) as executor:
+            list(executor.map(lambda i: str(i), range(10)))
+        template.render(title="x")
+
+    assert len(profilers) == 1
+    assert "notion_toolkit/template.py" in report.getvalue()
+
+
+def test_traced_memory_reports_allocation_sites():
+    report = io.StringIO()
+
+    with traced_memory(top=3, file=report):
+        spans = [RichText.create_for_text(str(i)) for i in range(1000)]
+
+    text = report.getvalue()
+    assert len(spans) == 1000
+    assert "Peak traced memory" in text
+    assert "Top pydantic allocation sites:" in text
+    assert "pydantic/main.py" in text
@@ -0,0 +1,176 @@
+"""Testing the query DSL and local query engine."""
+
+import time
+from datetime import date
+
+import pytest
+
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import Notion
+from notion_toolkit.query import (
+    Filter,
+    LocalIndex,
+    Property,
+    QueryEngine,
+    Timestamp,
+    parse_filter,
+)
+from notion_toolkit.scheduler import RequestScheduler
+
+status = Property("Status", "select")
+tags = Property("Tags", "multi_select")
+done = Property("Done", "checkbox")
+due = Property("Due", "date")
+name = Property("Name", "title")
+score = Property("Score", "number")
+
+
+def page(i, status_name, tag_names, due_date=None, edited="2024-01-01T00:00:00.000Z"):
+    return {
+        "object": "page",
+        "id": f"p{i}",
+        "last_edited_time": edited,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": f"Page {i}"}]},
+            "Status": {"type": "select", "select": {"name": status_name}},
+            "Tags": {
+                "type": "multi_select",
+                "multi_select": [{"name": tag} for tag in tag_names],
+            },
+            "Done": {"type": "checkbox", "checkbox": status_name == "Done"},
+            "Due": {
+                "type": "date",
+                "date": {"start": due_date} if due_date else None,
+            },
+            "Score": {"type": "number", "number": i},
+        },
+    }
+
+
+PAGES = [
+    page(0, "Done", ["python"], "2024-03-01"),
+    page(1, "Todo", ["python", "rust"], "2024-03-02T10:00:00.000+00:00"),
+    page(2, "Done", [], "2024-03-03"),
+    page(3, "Todo", ["go"]),
+]
+
+
+def ids(pages):
+    return [page["id"] for page in pages]
+
+
+def test_compile_to_notion_filter():
+    expression = (status == "Done") & tags.contains("python") | (
+        due >= date(2024, 1, 1)
+    )
+
+    assert expression.to_notion() == {
+        "or": [
+            {
+                "and": [
+                    {"property": "Status", "select": {"equals": "Done"}},
+                    {"property": "Tags", "multi_select": {"contains": "python"}},
+                ]
+            },
+            {"property": "Due", "date": {"on_or_after": "2024-01-01"}},
+        ]
+    }
+    assert Timestamp("last_edited_time").desc().to_notion() == {
+        "timestamp": "last_edited_time",
+        "direction": "descending",
+    }
+    with pytest.raises(ValueError):
+        status.contains("Done")
+
+
+def test_parse_filter_round_trip():
+    data = (
+        (status == "Done") | (Timestamp("last_edited_time") >= "2024-01-01")
+    ).to_notion()
+
+    parsed = parse_filter(data)
+
+    assert parsed.to_notion() == data
+    assert ids(filter(parsed.matches, PAGES)) == ["p0", "p1", "p2", "p3"]
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        (status == "Done", ["p0", "p2"]),
+        (status != "Done", ["p1", "p3"]),
+        (tags.contains("python") & (done == False), ["p1"]),  # noqa: E712
+        (tags.is_empty() | (score > 2), ["p2", "p3"]),
+        (name.contains("page 1"), ["p1"]),
+        (due.is_empty(), ["p3"]),
+        (due == "2024-03-02", ["p1"]),
+        (due > "2024-03-01", ["p1", "p2"]),
+        (due <= "2024-03-02", ["p0", "p1"]),
+    ],
+)
+def test_local_index_matches_predicate(expression, expected):
+    index = LocalIndex(PAGES)
+
+    assert ids(index.query(expression)) == expected
+    assert ids(filter(expression.matches, PAGES)) == expected
+
+
+def test_local_index_uses_indexes():
+    index = LocalIndex(PAGES)
+
+    assert index.candidates(status == "Todo") == {"p1", "p3"}
+    assert index.candidates((status == "Todo") & name.contains("x")) == {"p1", "p3"}
+    assert index.candidates((due < "2024-03-02") | tags.contains("go")) == {"p0", "p3"}
+    assert index.candidates(name.contains("x")) is None
+
+
+def test_local_sorts_put_empty_values_last():
+    index = LocalIndex(PAGES)
+
+    assert ids(index.query(sorts=[due.desc()])) == ["p2", "p1", "p0", "p3"]
+    assert ids(index.query(sorts=[status.asc(), score.desc()])) == [
+        "p2",
+        "p0",
+        "p3",
+        "p1",
+    ]
+
+
+def test_local_sorts_mixed_empty_values():
+    untagged = page(4, "Todo", [])
+    del untagged["properties"]["Tags"]
+    index = LocalIndex([*PAGES, untagged])
+
+    assert ids(index.query(sorts=[tags.asc()]))[-2:] in (["p2", "p4"], ["p4", "p2"])
+    assert ids(index.query(sorts=[tags.desc()]))[:3] == ["p1", "p0", "p3"]
+
+
+def test_filter_is_abstract():
+    with pytest.raises(TypeError):
+        Filter()
+
+
+def test_query_engine_prefers_fresh_mirror(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    iter_database = mocker.patch.object(
+        notion, "iter_database", side_effect=lambda *args, **kwargs: iter(PAGES)
+    )
+    mirror = DatabaseMirror(notion, "db")
+    engine = QueryEngine(notion, "db", mirror, max_age=60)
+
+    # Never synced: filtered and sorted by the API.
+    assert ids(engine.query(status == "Done", score.desc())) == ids(PAGES)
+    assert iter_database.call_args.kwargs == {
+        "filter": {"property": "Status", "select": {"equals": "Done"}},
+        "sorts": [{"property": "Score", "direction": "descending"}],
+    }
+
+    mirror.sync()
+    iter_database.reset_mock()
+    assert ids(engine.query(status == "Done", score.desc())) == ["p2", "p0"]
+    assert ids(engine.query(tags.contains("rust"))) == ["p1"]
+    iter_database.assert_not_called()
+
+    mirror.synced_at = time.time() - 120
+    engine.query(status == "Done")
+    iter_database.assert_called_once()
@@ -0,0 +1,159 @@
+"""Testing database schema registry."""
+
+import asyncio
+
+import pytest
+
+from notion_toolkit.notion import AsyncNotion, Notion
+from notion_toolkit.registry import (
+    CompiledSchema,
+    DatabaseSchemaRegistry,
+    PropertyValidationError,
+)
+from notion_toolkit.scheduler import RequestScheduler
+
+DATABASE = {
+    "object": "database",
+    "id": "db",
+    "properties": {
+        "Name": {"id": "title", "type": "title", "title": {}},
+        "Archived": {"id": "a", "type": "checkbox", "checkbox": {}},
+        "Tags": {
+            "id": "b",
+            "type": "multi_select",
+            "multi_select": {"options": [{"name": "ml"}, {"name": "ops"}]},
+        },
+        "Source_Type": {
+            "id": "c",
+            "type": "select",
+            "select": {"options": [{"name": "webpage"}]},
+        },
+        "URL": {"id": "d", "type": "url", "url": {}},
+        "Score": {"id": "e", "type": "number", "number": {}},
+        "Created": {"id": "f", "type": "created_time", "created_time": {}},
+    },
+}
+
+
+def test_valid_payload_passes():
+    notion = Notion(token="secret")
+    properties = notion._create_properties(title="a", tags=["ml"], url="https://a")
+
+    CompiledSchema(DATABASE).validate(properties)
+
+
+@pytest.mark.parametrize(
+    "properties, message",
+    [
+        ({"Missing": {"url": None}}, "Missing: unknown property"),
+        ({"Tags": {"multi_select": [{"name": "new"}]}}, "unknown option 'new'"),
+        ({"Score": {"number": True}}, "Score: expected int or float, got bool"),
+        ({"Archived": {"checkbox": "yes"}}, "Archived: expected bool"),
+        ({"URL": {"type": "select", "select": None}}, "URL: expected url"),
+        ({"Created": {"created_time": "now"}}, "created_time is read-only"),
+        ({"Name": {"title": [{"text": {"content": "x" * 2001}}]}}, "longer than"),
+        ({"Name": {"title": ["x"]}}, "rich text objects must be dicts"),
+        ({"Name": {"title": [{"text": "x"}]}}, "text must be"),
+        ({"URL": {"url": 5}}, "URL: expected str, got int"),
+        ({"URL": "https://x"}, "URL: expected a property value object"),
+        ({"Score": None}, "Score: expected a property value object"),
+    ],
+)
+def test_invalid_payload_is_rejected(properties, message):
+    with pytest.raises(PropertyValidationError, match=message):
+        CompiledSchema(DATABASE).validate(properties)
+
+
+def test_new_options_can_be_allowed():
+    schema = CompiledSchema(DATABASE, allow_new_options=True)
+
+    assert schema.errors({"Tags": {"multi_select": [{"name": "new"}]}}) == []
+
+
+def test_create_page_validates_without_sending(mocker):
+    notion = Notion(
+        token="secret",
+        scheduler=RequestScheduler(rate=1000),
+        validate_properties=True,
+    )
+    retrieve = mocker.patch.object(
+        notion.client.databases, "retrieve", return_value=DATABASE
+    )
+    create = mocker.patch.object(notion.client.pages, "create", return_value={})
+
+    notion.create_page("db", title="ok", tags=["ops"])
+    with pytest.raises(PropertyValidationError):
+        notion.create_page("db", title="bad", tags=["unknown"])
+
+    assert retrieve.call_count == 1
+    assert create.call_count == 1
+
+
+def test_updates_validate_against_the_page_database(mocker):
+    notion = Notion(
+        token="secret",
+        scheduler=RequestScheduler(rate=1000),
+        validate_properties=True,
+    )
+    page = {"object": "page", "id": "p1", "parent": {"database_id": "db"}}
+    mocker.patch.object(notion.client.databases, "retrieve", return_value=DATABASE)
+    mocker.patch.object(notion.client.pages, "retrieve", return_value=page)
+    update = mocker.patch.object(notion.client.pages, "update", return_value=page)
+    existing = {"id": "p1", "properties": {"URL": {"type": "url", "url": "https://a"}}}
+    mocker.patch.object(notion, "iter_database", return_value=[existing])
+
+    notion.update_page("p1", title="ok", tags=["ops"])
+    with pytest.raises(PropertyValidationError):
+        notion.update_page("p1", title="bad", tags=["unknown"])
+    with pytest.raises(PropertyValidationError):
+        notion.upsert_page("db", title="bad", tags=["unknown"], url="https://a")
+    [result] = notion.bulk_create(
+        "db", [{"title": "bad", "tags": ["unknown"], "url": "https://a"}], upsert=True
+    )
+
+    assert isinstance(result.error, PropertyValidationError)
+    assert update.call_count == 1
+
+
+def test_async_client_validates_properties(mocker):
+    notion = AsyncNotion(
+        token="secret",
+        scheduler=RequestScheduler(rate=1000),
+        validate_properties=True,
+    )
+    page = {"object": "page", "id": "p1", "parent": {"database_id": "db"}}
+    retrieve = mocker.patch.object(
+        notion.client.databases, "retrieve", mocker.AsyncMock(return_value=DATABASE)
+    )
+    mocker.patch.object(
+        notion.client.pages, "retrieve", mocker.AsyncMock(return_value=page)
+    )
+    create = mocker.patch.object(
+        notion.client.pages, "create", mocker.AsyncMock(return_value=page)
+    )
+    update = mocker.patch.object(
+        notion.client.pages, "update", mocker.AsyncMock(return_value=page)
+    )
+
+    async def run():
+        await notion.create_page("db", title="ok", tags=["ops"])
+        with pytest.raises(PropertyValidationError):
+            await notion.create_page("db", title="bad", tags=["unknown"])
+        with pytest.raises(PropertyValidationError):
+            await notion.update_page("p1", title="bad", tags=["unknown"])
+
+    asyncio.run(run())
+
+    assert retrieve.call_count == 1
+    assert create.call_count == 1
+    assert update.call_count == 0
+
+
+def test_registry_ttl(mocker):
+    fetch = mocker.Mock(return_value=DATABASE)
+    registry = DatabaseSchemaRegistry(fetch, ttl=0)
+
+    registry.get("db")
+    registry.get("db")
+
+    assert fetch.call_count == 2
@@ -0,0 +1,64 @@
+"""Testing request scheduler."""
+
+import time
+
+import httpx
+import pytest
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from notion_toolkit.scheduler import (
+    Priority,
+    RateLimitExceeded,
+    RequestScheduler,
+    parse_retry_after,
+)
+
+
+def rate_limited_error(retry_after: str = "0.05") -> APIResponseError:
+    response = httpx.Response(
+        429,
+        headers={"Retry-After": retry_after},
+        request=httpx.Request("POST", "https://api.notion.com/v1/pages"),
+    )
+    return APIResponseError(response, "Rate limited", APIErrorCode.RateLimited)
+
+
+def test_token_bucket_paces_requests():
+    scheduler = RequestScheduler(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        scheduler.call(lambda: None)
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_retry_after_is_honored_and_rate_adapts(mocker):
+    scheduler = RequestScheduler(rate=100, backoff_base=0.001)
+    func = mocker.Mock(side_effect=[rate_limited_error(), {"id": "1"}])
+
+    start = time.monotonic()
+    assert scheduler.call(func, priority=Priority.HIGH) == {"id": "1"}
+
+    assert time.monotonic() - start >= 0.05
+    assert func.call_count == 2
+    assert scheduler.rate_limited_count == 1
+    assert scheduler.rate < 100
+
+
+def test_gives_up_after_max_retries(mocker):
+    scheduler = RequestScheduler(rate=100, max_retries=2, backoff_base=0.001)
+    func = mocker.Mock(side_effect=rate_limited_error("0"))
+
+    with pytest.raises(RateLimitExceeded):
+        scheduler.call(func)
+
+    assert func.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2", 2.0), ("0.5", 0.5), (None, None), ("Wed, 21 Oct 2015 07:28:00 GMT", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
@@ -1,6 +1,18 @@
 """Testing notion shcema."""
 
-from notion_toolkit.schema import Color, Annotations
+import pytest
+from pydantic import ValidationError
+
+from notion_toolkit.schema import (
+    Annotations,
+    Block,
+    BlockType,
+    Color,
+    CompactAnnotations,
+    CompactRichText,
+)
+from notion_toolkit.schema.encode import dumps
+from notion_toolkit.schema.rich_text import RichText
 
 
 def test_color():
@@ -17,3 +29,97 @@ def test_annotations():
         color="default",
     )
     assert Annotations() == default_annotations
+
+
+def test_compact_annotations_are_interned():
+    assert CompactAnnotations.of() is CompactAnnotations.from_model(Annotations())
+    assert CompactAnnotations.of(bold=True, color="red") is CompactAnnotations.of(
+        bold=True, color=Color.RED
+    )
+    assert CompactAnnotations.of(bold=True) is not CompactAnnotations.of()
+
+
+def test_compact_annotations_round_trip():
+    annotations = Annotations(italic=True, code=True, color=Color.BLUE_BACKGROUND)
+    compact = CompactAnnotations.from_model(annotations)
+
+    assert compact.italic and compact.code and not compact.bold
+    assert compact.color is Color.BLUE_BACKGROUND
+    assert compact.to_model() == annotations
+    assert CompactAnnotations.from_dict(compact.to_dict()) is compact
+
+
+def test_compact_rich_text_round_trip():
+    rich_text = RichText(
+        type="text",
+        text={"content": "hello", "link": {"url": "https://example.com/"}},
+        annotations=Annotations(bold=True),
+        plain_text="hello",
+        href="https://example.com/",
+    )
+    compact = CompactRichText.from_model(rich_text)
+
+    assert compact.to_model() == rich_text
+    assert CompactRichText.from_dict(compact.to_dict()) == compact
+    assert not hasattr(compact, "__dict__")
+
+
+def test_compact_rich_text_from_api_mention():
+    span = {
+        "type": "mention",
+        "mention": {"type": "date", "date": {"start": "2022-01-01", "end": None}},
+        "annotations": Annotations().model_dump(mode="json"),
+        "plain_text": "2022-01-01",
+        "href": None,
+    }
+    compact = CompactRichText.from_dict(span)
+
+    assert compact.annotations is CompactAnnotations.of()
+    assert compact.to_dict() == span
+
+
+@pytest.mark.parametrize(
+    "kind, value",
+    [
+        ("mention", {"type": "date", "date": {"start": "2022-01-01", "end": None}}),
+        (
+            "mention",
+            {"type": "page", "page": {"id": "59833787-2cf9-4fdf-8782-e53db20768a5"}},
+        ),
+        ("equation", {"expression": "E = mc^2"}),
+    ],
+)
+def test_compact_rich_text_round_trips_mentions_and_equations(kind, value):
+    span = {
+        "type": kind,
+        kind: value,
+        "annotations": Annotations().model_dump(mode="json"),
+        "plain_text": "x",
+        "href": None,
+    }
+    compact = CompactRichText.from_dict(span)
+    model = compact.to_model()
+
+    assert model == RichText.model_validate(
+        {**span, kind: {"type": kind, kind: value} if kind == "mention" else value}
+    )
+    assert CompactRichText.from_model(model) == compact
+    assert CompactRichText.from_model(model).to_dict() == span
+
+
+def test_block_children_are_not_serialized():
+    block = Block.create(
+        BlockType.TOGGLE, "details", children=[Block.create("code", "print(1)")]
+    )
+
+    assert block.children[0].code.language == "plain text"
+    assert dumps(block) == (
+        b'{"type":"toggle","toggle":{"rich_text":[{"type":"text",'
+        b'"text":{"content":"details"},"plain_text":"details"}]}}'
+    )
+    assert Block.model_validate({"type": "divider", "divider": {}}).children == []
+
+
+def test_block_requires_content_of_its_type():
+    with pytest.raises(ValidationError):
+        Block(type="quote")
@@ -0,0 +1,105 @@
+"""Testing offline full-text search."""
+
+import pytest
+
+from notion_toolkit.mirror import DatabaseMirror
+from notion_toolkit.notion import Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.search import SearchIndex, page_text
+
+
+def page(page_id, title, edited="2024-01-01T00:00:00.000Z"):
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": title}]},
+            "Done": {"type": "checkbox", "checkbox": True},
+        },
+    }
+
+
+def paragraph(text):
+    return {"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": text}]}}
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add_page(page("a", "Release notes"), [paragraph("Deploying Python apps")])
+    index.add_page(page("b", "Python tips"), [paragraph("python python notes")])
+    index.add_page(page("c", "Notes on release"), [paragraph("deployment guide")])
+    return index
+
+
+def hits(results):
+    return [hit.page_id for hit in results]
+
+
+def test_page_text():
+    assert page_text(page("a", "Title"), [paragraph("Body"), {"type": "divider"}]) == [
+        "Title",
+        "Body",
+    ]
+
+
+def test_ranked_terms_phrases_and_prefixes(index):
+    assert hits(index.search("python")) == ["b", "a"]
+    assert sorted(hits(index.search("notes"))) == ["a", "b", "c"]
+    assert hits(index.search('"release notes"')) == ["a"]
+    assert sorted(hits(index.search("deploy*"))) == ["a", "c"]
+    assert hits(index.search("deploy* python")) == ["a"]
+    assert hits(index.search('"notes deploying"')) == []
+    assert index.search("missing") == []
+
+
+def test_incremental_updates(index):
+    assert not index.add_page(page("a", "Release notes"))
+    assert index.add_page(page("a", "Changelog", edited="2024-02-01T00:00:00.000Z"))
+
+    assert hits(index.search("release")) == ["c"]
+    assert hits(index.search("changelog")) == ["a"]
+
+    index.remove("c")
+    assert index.search("release") == []
+    assert len(index) == 2
+
+
+def test_save_and_load(index, tmp_path):
+    index.remove("c")
+    path = tmp_path / "search.idx"
+    index.save(path)
+
+    loaded = SearchIndex.load(path)
+
+    assert len(loaded) == 2
+    assert all(isinstance(p, bytes) for p in loaded._postings.values())
+    assert "guide" not in loaded._postings
+    for query in ["python", '"release notes"', "dep*"]:
+        assert [(h.page_id, round(h.score, 6)) for h in loaded.search(query)] == [
+            (h.page_id, round(h.score, 6)) for h in index.search(query)
+        ]
+    loaded.add_page(page("d", "More python"))
+    assert "d" in hits(loaded.search("python"))
+
+
+def test_update_from_mirror(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    responses = [
+        [page("a", "Alpha"), page("b", "Beta")],
+        [page("b", "Beta"), page("c", "Gamma", edited="2024-01-02T00:00:00.000Z")],
+    ]
+    mocker.patch.object(
+        notion, "iter_database", side_effect=lambda *args, **kwargs: responses.pop(0)
+    )
+    mirror = DatabaseMirror(notion, "db")
+    blocks = mocker.Mock(side_effect=lambda page_id: [paragraph(f"body of {page_id}")])
+    index = SearchIndex()
+
+    mirror.sync()
+    assert index.update_from_mirror(mirror, blocks) == 2
+    mirror.sync(full=True)
+    assert index.update_from_mirror(mirror, blocks) == 1
+
+    assert sorted(call.args[0] for call in blocks.call_args_list) == ["a", "b", "c"]
+    assert hits(index.search("body")) and "a" not in index
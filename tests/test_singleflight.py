@@ -0,0 +1,73 @@
+"""Testing single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from notion_toolkit.notion import AsyncNotion, Notion
+from notion_toolkit.scheduler import RequestScheduler
+from notion_toolkit.singleflight import SingleFlight
+
+
+def test_concurrent_sync_reads_share_one_request(mocker):
+    notion = Notion(token="secret", scheduler=RequestScheduler(rate=1000))
+    started = threading.Event()
+
+    def retrieve(**kwargs):
+        started.set()
+        time.sleep(0.05)
+        return {"id": kwargs["page_id"]}
+
+    retrieve = mocker.patch.object(
+        notion.client.pages, "retrieve", side_effect=retrieve
+    )
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(notion.retrieve_page("a")))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert retrieve.call_count == 1
+    assert results == [{"id": "a"}] * 5
+
+
+def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_concurrent_async_reads_share_one_request(mocker):
+    notion = AsyncNotion(token="secret", scheduler=RequestScheduler(rate=1000))
+
+    async def retrieve(**kwargs):
+        await asyncio.sleep(0.01)
+        return {"id": kwargs["database_id"]}
+
+    retrieve = mocker.patch.object(
+        notion.client.databases, "retrieve", side_effect=retrieve
+    )
+
+    async def fan_out():
+        return await asyncio.gather(
+            *(notion.retrieve_database("db") for _ in range(5)),
+            notion.retrieve_database("other"),
+        )
+
+    results = asyncio.run(fan_out())
+
+    assert retrieve.call_count == 2
+    assert results == [{"id": "db"}] * 5 + [{"id": "other"}]
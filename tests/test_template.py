@@ -0,0 +1,73 @@
+"""Testing property payload templates."""
+
+import pytest
+
+from notion_toolkit.schema.page import ProdCopilotSourceType
+from notion_toolkit.template import ProdCopilotSourcePropertiesTemplate, _annotations
+
+
+def expected_properties(
+    title, bold=False, color="default", archived=False, tags=None, url=None
+):
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [
+                {
+                    "type": "text",
+                    "text": {"content": title, "link": None},
+                    "annotations": {
+                        "bold": bold,
+                        "italic": False,
+                        "strikethrough": False,
+                        "underline": False,
+                        "code": False,
+                        "color": color,
+                    },
+                    "plain_text": title,
+                    "href": None,
+                }
+            ],
+        },
+        "Archived": {"checkbox": archived},
+        "Tags": {
+            "type": "multi_select",
+            "multi_select": [{"name": tag} for tag in tags or ()],
+        },
+        "Source_Type": {"type": "select", "select": {"name": "webpage"}},
+        "URL": {"url": url},
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"title": "plain"},
+        {"title": "styled", "bold": True, "color": "red", "archived": True},
+        {"title": "tagged", "tags": ["a", "b"], "url": "https://example.com"},
+    ],
+)
+def test_render_matches_full_payload(kwargs):
+    template = ProdCopilotSourcePropertiesTemplate()
+
+    assert template.render(**kwargs) == expected_properties(**kwargs)
+
+
+def test_render_shares_invariant_parts():
+    template = ProdCopilotSourcePropertiesTemplate()
+    first = template.render(title="a")
+    second = template.render(title="b", source_type=ProdCopilotSourceType.WEBPAGE)
+
+    assert first["Name"]["title"][0]["annotations"] is (
+        second["Name"]["title"][0]["annotations"]
+    )
+    assert first["Source_Type"] is second["Source_Type"]
+
+
+def test_annotations_cache_is_bounded():
+    template = ProdCopilotSourcePropertiesTemplate()
+    for i in range(2000):
+        template.render(title="x", color=f"color-{i}")
+
+    assert _annotations.cache_info().currsize <= 1024